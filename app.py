@@ -10,23 +10,86 @@ Location: Nevada, Clark County
 License: MIT - For Research Simulation
 """
 
-from flask import Flask, render_template, jsonify, request, send_file
-import json
+from flask import Flask, Response, render_template, jsonify, request
+from flask.json.provider import JSONProvider
+import gzip
+import hashlib
+import logging
+import os
 import threading
 import time
+import uuid
+import numpy as np
+import orjson
+from collections import OrderedDict
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Tuple
 from complete_integration_pipeline import ChemPathIntegratedPipeline, TraditionalPlant
-import io
+import tempfile
 from reportlab.lib.pagesizes import letter
 from reportlab.lib import colors
 from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak
+from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer, PageBreak, Flowable
 from reportlab.lib.units import inch
 
+# numpy scalars reach the API through the formatted pipeline results
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that encodes responses with orjson."""
+
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
+
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
+
+# Pipeline modules log progress at INFO; only surface warnings in the web server
+for module_name in ('complete_integration_pipeline', 'classical_binding_simulator', 'cultural_qsar_engine',
+                    'tradition_aware_admet_predictor', 'equipath_integration'):
+    logging.getLogger(module_name).setLevel(logging.WARNING)
+
+@dataclass(slots=True)
+class JobState:
+    """Progress and results of a single simulation run."""
+    job_id: str
+    running: bool = True
+    progress: int = 0
+    current_step: str = ''
+    results: Optional[Dict] = None
+    error: Optional[str] = None
+    results_json: Optional[bytes] = None
+    results_json_gz: Optional[bytes] = None
+    status_json: Optional[bytes] = None
+    version: int = 0
+    updated_at: float = 0.0
+    created_at: float = field(default_factory=time.time)
+
+    def to_dict(self) -> Dict:
+        """Status payload returned by the API."""
+        return {
+            'job_id': self.job_id,
+            'running': self.running,
+            'progress': self.progress,
+            'current_step': self.current_step,
+            'results': self.results,
+            'error': self.error
+        }
+
 
-# Global variable to store simulation status and results
-simulation_status = {
+# Status reported before any simulation has been started
+IDLE_STATUS = {
     'running': False,
     'progress': 0,
     'current_step': '',
@@ -34,262 +97,589 @@ simulation_status = {
     'error': None
 }
 
+# Simulation jobs keyed by job ID; finished jobs are dropped after JOB_TTL_SECONDS
+JOB_TTL_SECONDS = 30 * 60
+jobs: Dict[str, JobState] = {}
+# JobState updates and status snapshots happen under jobs_lock; the results
+# fields are written once, together with running=False, and never change after
+jobs_lock = threading.Lock()
+latest_job_id = None
+
+# Condition used to wake Server-Sent Event streams when a job changes
+status_condition = threading.Condition(jobs_lock)
+
+# Progress-only updates are dropped unless progress moves by PROGRESS_MIN_DELTA,
+# the step changes, or PROGRESS_MIN_INTERVAL seconds have passed
+PROGRESS_FIELDS = frozenset({'progress', 'current_step'})
+PROGRESS_MIN_DELTA = 1
+PROGRESS_MIN_INTERVAL = 0.1
+
+
+def update_job(job_id: str, **changes):
+    """Apply status changes to a job and notify any listening event streams."""
+    with status_condition:
+        job = jobs.get(job_id)
+        if job is None:
+            return
+
+        now = time.monotonic()
+        if (changes.keys() <= PROGRESS_FIELDS
+                and abs(changes.get('progress', job.progress) - job.progress) < PROGRESS_MIN_DELTA
+                and changes.get('current_step', job.current_step) == job.current_step
+                and now - job.updated_at < PROGRESS_MIN_INTERVAL):
+            return
+
+        for name, value in changes.items():
+            setattr(job, name, value)
+        job.version += 1
+        job.updated_at = now
+        job.status_json = None
+        status_condition.notify_all()
+
+
+def get_job(job_id: Optional[str] = None) -> Optional[JobState]:
+    """Look up a job by ID, defaulting to the most recently started one."""
+    with jobs_lock:
+        return jobs.get(job_id or latest_job_id)
+
+
+def not_modified(etag: str) -> Optional[Response]:
+    """Return a 304 response if the client already holds this ETag."""
+    if etag in request.if_none_match:
+        response = app.response_class(status=304)
+        response.set_etag(etag)
+        return response
+    return None
+
+
+def schedule_job_eviction(job_id: str):
+    """Drop a job from the registry once its TTL expires."""
+    timer = threading.Timer(JOB_TTL_SECONDS, evict_job, args=(job_id,))
+    timer.daemon = True
+    timer.start()
+
+
+def evict_job(job_id: str):
+    """Remove a finished job, or check again later if it is still running."""
+    with jobs_lock:
+        job = jobs.get(job_id)
+        if job is not None and not job.running:
+            del jobs[job_id]
+            job = None
+
+    if job is not None:
+        schedule_job_eviction(job_id)
+
+
+# Shared pipeline instance, built on first use and reused across runs
+_pipeline = None
+_pipeline_lock = threading.Lock()
+
+# The pipeline seeds the global NumPy RNG, so runs are serialized
+_pipeline_run_lock = threading.Lock()
+
+
+def get_pipeline():
+    """Return the shared ChemPath pipeline, creating it on first call."""
+    global _pipeline
+
+    with _pipeline_lock:
+        if _pipeline is None:
+            _pipeline = ChemPathIntegratedPipeline(
+                deployment_mode="standalone",
+                enable_equipath=True
+            )
+        return _pipeline
+
+
+# Pipeline results keyed by plant fingerprint; bump the version to invalidate
+PIPELINE_VERSION = "5.1"
+RESULTS_CACHE_SIZE = 32
+_results_cache = OrderedDict()
+_results_cache_lock = threading.Lock()
+
+
+def plant_fingerprint(plant: TraditionalPlant) -> str:
+    """Content hash of a plant profile and the pipeline version."""
+    payload = orjson.dumps(asdict(plant), option=orjson.OPT_SORT_KEYS | ORJSON_OPTIONS, default=str)
+    digest = hashlib.blake2b(PIPELINE_VERSION.encode() + b":" + payload, digest_size=16)
+    return digest.hexdigest()
+
+
+def process_plant_cached(pipeline, plant: TraditionalPlant):
+    """Run the pipeline for a plant, reusing results for identical profiles."""
+    key = plant_fingerprint(plant)
+
+    with _results_cache_lock:
+        if key in _results_cache:
+            _results_cache.move_to_end(key)
+            return _results_cache[key]
+
+    results = pipeline.process_traditional_plant(plant)
+
+    with _results_cache_lock:
+        _results_cache[key] = results
+        _results_cache.move_to_end(key)
+        while len(_results_cache) > RESULTS_CACHE_SIZE:
+            _results_cache.popitem(last=False)
+
+    return results
+
+
+# Demo plant profile; constant across runs, so it is built once at import
+ASHWAGANDHA = TraditionalPlant(
+    scientific_name="Withania somnifera",
+    common_names=["Ashwagandha", "Indian Winter Cherry", "Poison Gooseberry"],
+    traditional_uses=[
+        "Stress and anxiety relief",
+        "Sleep enhancement",
+        "Cognitive function improvement",
+        "Physical strength and endurance",
+        "Immune system support",
+        "Anti-inflammatory effects"
+    ],
+    geographic_origin="India, Middle East, North Africa",
+    cultural_contexts=["Ayurveda", "Traditional Indian Medicine", "Unani Medicine"],
+    active_compounds=[
+        {
+            "name": "Withanoside IV",
+            "smiles": "C[C@H]1[C@@H]2[C@H](C[C@@H]3[C@@]2(CC[C@H]4[C@H]3CC[C@@H]5[C@@]4(CC[C@@H](C5)O[C@H]6[C@@H]([C@H]([C@@H]([C@H](O6)CO)O)O)O)C)C)[C@H](C[C@H]7[C@@]1(CC[C@@H](C7)O)C)O",
+            "concentration_percent": 0.3,
+            "traditional_importance": 0.9
+        },
+        {
+            "name": "Withanoside VI",
+            "smiles": "C[C@H]1[C@@H]2[C@H](C[C@@H]3[C@@]2(CC[C@H]4[C@H]3CC[C@@H]5[C@@]4(CC[C@@H](C5)O[C@H]6[C@@H]([C@H]([C@@H]([C@H](O6)CO)O)O)O[C@H]7[C@@H]([C@H]([C@@H]([C@H](O7)CO)O)O)O)C)C)[C@H](C[C@H]8[C@@]1(CC[C@@H](C8)O)C)O",
+            "concentration_percent": 0.15,
+            "traditional_importance": 0.8
+        },
+        {
+            "name": "Withanolide D",
+            "smiles": "C[C@H]1[C@@H]2[C@H](C[C@@H]3[C@@]2(CC[C@H]4[C@H]3CC[C@@H]5[C@@]4(CC[C@@H](C5)O)C)C)[C@H](C[C@H]6[C@@]1(CC[C@@H](C6)O)C)O",
+            "concentration_percent": 0.05,
+            "traditional_importance": 0.95
+        }
+    ],
+    traditional_preparations=[
+        {
+            "method": "Root powder with ghee and honey",
+            "timing": "Early morning on empty stomach",
+            "lunar_phase": "Waxing moon preferred",
+            "preparation_time": "12 hours"
+        }
+    ],
+    safety_profile={
+        "traditional_safety_rating": 0.95,
+        "documented_adverse_effects": ["Mild drowsiness", "Stomach upset if taken without food"],
+        "contraindications": ["Pregnancy", "Autoimmune conditions"],
+        "herb_drug_interactions": ["Sedatives", "Immunosuppressants"]
+    },
+    historical_documentation={
+        "charaka_samhita": True,
+        "sushruta_samhita": True,
+        "first_documentation_year": 600,
+        "scientific_papers": 2847,
+        "clinical_trials": 89
+    },
+    bioactivity_confidence=0.92
+)
+
+
+# Page templates have no request-dependent context, so each renders only once
+PAGE_MAX_AGE = 5 * 60
+
+
+@lru_cache(maxsize=None)
+def render_static_page(template_name: str) -> Tuple[str, str]:
+    """Render a page template once and return its HTML and ETag."""
+    html = render_template(template_name)
+    return html, hashlib.blake2b(html.encode('utf-8'), digest_size=16).hexdigest()
+
+
+def static_page(template_name: str) -> Response:
+    """Serve a pre-rendered page with ETag revalidation."""
+    if app.debug:
+        return render_template(template_name)
+
+    html, etag = render_static_page(template_name)
+    response = not_modified(etag) or app.response_class(html, mimetype='text/html')
+    response.set_etag(etag)
+    response.cache_control.public = True
+    response.cache_control.max_age = PAGE_MAX_AGE
+    return response
+
 
 @app.route('/')
 def index():
     """Landing page for ChemPath simulation."""
-    return render_template('index.html')
+    return static_page('index.html')
 
 
 @app.route('/run-simulation')
 def run_simulation_page():
     """Simulation running page."""
-    return render_template('simulation.html')
+    return static_page('simulation.html')
 
 
 @app.route('/results')
 def results_page():
     """Results display page."""
-    return render_template('results.html')
+    return static_page('results.html')
+
+
+@app.route('/healthz')
+def healthz():
+    """Liveness check for load balancers; does not touch job state."""
+    return 'ok', 200, {'Content-Type': 'text/plain', 'Cache-Control': 'no-store'}
 
 
 @app.route('/api/start-simulation', methods=['POST'])
 def start_simulation():
     """API endpoint to start the simulation."""
-    global simulation_status
-
-    if simulation_status['running']:
-        return jsonify({'error': 'Simulation already running'}), 400
+    global latest_job_id
 
-    # Reset status
-    simulation_status = {
-        'running': True,
-        'progress': 0,
-        'current_step': 'Initializing ChemPath Pipeline...',
-        'results': None,
-        'error': None
-    }
+    job_id = uuid.uuid4().hex
+    with jobs_lock:
+        jobs[job_id] = JobState(job_id=job_id, current_step='Initializing ChemPath Pipeline...')
+        latest_job_id = job_id
+    schedule_job_eviction(job_id)
 
     # Run simulation in background thread
-    thread = threading.Thread(target=run_chempath_simulation)
+    thread = threading.Thread(target=run_chempath_simulation, args=(job_id,))
     thread.daemon = True
     thread.start()
 
-    return jsonify({'status': 'started'})
+    return jsonify({'status': 'started', 'job_id': job_id})
 
 
-@app.route('/api/simulation-status')
-def get_simulation_status():
+@app.route('/api/simulation-status', defaults={'job_id': None})
+@app.route('/api/simulation-status/<job_id>')
+def get_simulation_status(job_id):
     """API endpoint to get current simulation status."""
-    return jsonify(simulation_status)
+    job = get_job(job_id)
+    if job is None:
+        if job_id:
+            return jsonify({'error': 'Unknown job'}), 404
+        return jsonify(IDLE_STATUS)
+
+    # Encoded status is reused until the job changes; unchanged polls get a 304
+    with jobs_lock:
+        etag = f'{job.job_id}-{job.version}'
+        if job.status_json is None:
+            job.status_json = orjson.dumps(job.to_dict(), option=ORJSON_OPTIONS)
+        status_json = job.status_json
+
+    response = not_modified(etag) or app.response_class(status_json, mimetype='application/json')
+    response.set_etag(etag)
+    response.cache_control.no_cache = True
+    return response
+
+
+# Each open SSE stream holds a server thread until its job finishes; past this many
+# streams, clients get a 503 and the page falls back to polling /api/simulation-status
+SSE_MAX_STREAMS = int(os.environ.get("SSE_MAX_STREAMS", 3))
+sse_slots = threading.BoundedSemaphore(SSE_MAX_STREAMS)
+
+
+@app.route('/api/simulation-stream', defaults={'job_id': None})
+@app.route('/api/simulation-stream/<job_id>')
+def stream_simulation_status(job_id):
+    """Server-Sent Events stream of simulation status updates."""
+    job = get_job(job_id)
+    if job is None:
+        return jsonify({'error': 'Unknown job'}), 404
+
+    if not sse_slots.acquire(blocking=False):
+        response = jsonify({'error': 'Too many open streams; poll /api/simulation-status instead'})
+        response.status_code = 503
+        response.headers['Retry-After'] = '5'
+        return response
+
+    def generate():
+        last_version = None
+        while True:
+            # Sleep until this job's version moves; the snapshot is taken under the lock
+            with status_condition:
+                changed = status_condition.wait_for(lambda: job.version != last_version, timeout=15)
+                if changed:
+                    last_version = job.version
+                    update = job.to_dict()
+
+            if not changed:
+                # Comment frame keeps idle connections open through proxies
+                yield ': keep-alive\n\n'
+                continue
+
+            yield b"data: " + orjson.dumps(update, option=ORJSON_OPTIONS) + b"\n\n"
+
+            if not update['running']:
+                yield "event: done\ndata: {}\n\n"
+                return
+
+    response = Response(generate(), mimetype='text/event-stream',
+                        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'})
+    # Freed when the stream ends or the client disconnects
+    response.call_on_close(sse_slots.release)
+    return response
+
+
+# Numeric display columns, staged as one array per run and rounded together
+DISPLAY_DECIMALS = np.array([
+    2,  # qsar_score
+    2,  # binding_affinity
+    1,  # bioavailability
+    1,  # bioavailability_improvement
+    2,  # safety_enhancement
+    1,  # development_confidence
+    2,  # compensation amount
+    2   # compensation cultural_preservation
+])
+DISPLAY_SCALE = 10.0 ** DISPLAY_DECIMALS
+
+
+def format_compounds(optimization_results: Dict) -> Tuple[List[Dict], float]:
+    """Format every compound's optimization results for web display.
+
+    Args:
+        optimization_results: OptimizationResults keyed by compound name
+
+    Returns:
+        Tuple of the display dicts and the unrounded total compensation
+    """
+    compensations = [getattr(result, 'equipath_compensation', None) or {}
+                     for result in optimization_results.values()]
+
+    values = np.array([
+        [
+            result.cultural_qsar_score,
+            result.binding_affinity,
+            result.traditional_admet_profile['bioavailability_percent'],
+            result.bioavailability_improvement,
+            result.safety_enhancement,
+            result.development_confidence * 100,
+            equipath_comp.get('compensation_amount', 0),
+            equipath_comp.get('cultural_preservation_score', 0.92)
+        ]
+        for result, equipath_comp in zip(optimization_results.values(), compensations)
+    ], dtype=np.float64).reshape(-1, len(DISPLAY_DECIMALS))
+    rounded = (np.round(values * DISPLAY_SCALE) / DISPLAY_SCALE).tolist()
+
+    compounds = []
+    for (compound_name, result), equipath_comp, row in zip(optimization_results.items(), compensations, rounded):
+        compounds.append({
+            'name': compound_name,
+            'qsar_score': row[0],
+            'binding_affinity': row[1],
+            'bioavailability': row[2],
+            'bioavailability_improvement': row[3],
+            'safety_enhancement': row[4],
+            'development_confidence': row[5],
+            'synthesis_pathway': 'traditional',  # Default fallback
+            'sustainability': 0.85,  # Default fallback
+            'cultural_preservation': "0.92/1.0",  # Default fallback
+            'optimal_solvent': result.preparation_recommendation.get('optimal_solvent', 'honey'),
+            'enhancers': result.preparation_recommendation.get('enhancers', ['piperine', 'ghee']),
+            # Compounds without EquiPath records fall back to demo compensation values
+            'compensation': {
+                'amount': row[6],
+                'record_id': equipath_comp.get('record_id', 'N/A') if equipath_comp else 'DEMO-MODE',
+                'cultural_preservation': row[7]
+            }
+        })
 
+    return compounds, sum(values[:, 6].tolist())
 
-def run_chempath_simulation():
-    """Run the ChemPath simulation and update status."""
-    global simulation_status
 
+def run_chempath_simulation(job_id: str):
+    """Run the ChemPath simulation and update the job's status."""
     try:
         # Step 1: Initialize pipeline
-        simulation_status['current_step'] = 'Initializing ChemPath Integrated Pipeline v5.1...'
-        simulation_status['progress'] = 10
-        time.sleep(0.5)
+        update_job(job_id, current_step='Initializing ChemPath Integrated Pipeline v5.1...', progress=10)
 
-        pipeline = ChemPathIntegratedPipeline(
-            deployment_mode="standalone",
-            enable_equipath=True
-        )
+        pipeline = get_pipeline()
 
-        # Step 2: Define plant profile
-        simulation_status['current_step'] = 'Loading Ashwagandha plant profile...'
-        simulation_status['progress'] = 20
-        time.sleep(0.5)
-
-        ashwagandha = TraditionalPlant(
-            scientific_name="Withania somnifera",
-            common_names=["Ashwagandha", "Indian Winter Cherry", "Poison Gooseberry"],
-            traditional_uses=[
-                "Stress and anxiety relief",
-                "Sleep enhancement",
-                "Cognitive function improvement",
-                "Physical strength and endurance",
-                "Immune system support",
-                "Anti-inflammatory effects"
-            ],
-            geographic_origin="India, Middle East, North Africa",
-            cultural_contexts=["Ayurveda", "Traditional Indian Medicine", "Unani Medicine"],
-            active_compounds=[
-                {
-                    "name": "Withanoside IV",
-                    "smiles": "C[C@H]1[C@@H]2[C@H](C[C@@H]3[C@@]2(CC[C@H]4[C@H]3CC[C@@H]5[C@@]4(CC[C@@H](C5)O[C@H]6[C@@H]([C@H]([C@@H]([C@H](O6)CO)O)O)O)C)C)[C@H](C[C@H]7[C@@]1(CC[C@@H](C7)O)C)O",
-                    "concentration_percent": 0.3,
-                    "traditional_importance": 0.9
-                },
-                {
-                    "name": "Withanoside VI",
-                    "smiles": "C[C@H]1[C@@H]2[C@H](C[C@@H]3[C@@]2(CC[C@H]4[C@H]3CC[C@@H]5[C@@]4(CC[C@@H](C5)O[C@H]6[C@@H]([C@H]([C@@H]([C@H](O6)CO)O)O)O[C@H]7[C@@H]([C@H]([C@@H]([C@H](O7)CO)O)O)O)C)C)[C@H](C[C@H]8[C@@]1(CC[C@@H](C8)O)C)O",
-                    "concentration_percent": 0.15,
-                    "traditional_importance": 0.8
-                },
-                {
-                    "name": "Withanolide D",
-                    "smiles": "C[C@H]1[C@@H]2[C@H](C[C@@H]3[C@@]2(CC[C@H]4[C@H]3CC[C@@H]5[C@@]4(CC[C@@H](C5)O)C)C)[C@H](C[C@H]6[C@@]1(CC[C@@H](C6)O)C)O",
-                    "concentration_percent": 0.05,
-                    "traditional_importance": 0.95
-                }
-            ],
-            traditional_preparations=[
-                {
-                    "method": "Root powder with ghee and honey",
-                    "timing": "Early morning on empty stomach",
-                    "lunar_phase": "Waxing moon preferred",
-                    "preparation_time": "12 hours"
-                }
-            ],
-            safety_profile={
-                "traditional_safety_rating": 0.95,
-                "documented_adverse_effects": ["Mild drowsiness", "Stomach upset if taken without food"],
-                "contraindications": ["Pregnancy", "Autoimmune conditions"],
-                "herb_drug_interactions": ["Sedatives", "Immunosuppressants"]
-            },
-            historical_documentation={
-                "charaka_samhita": True,
-                "sushruta_samhita": True,
-                "first_documentation_year": 600,
-                "scientific_papers": 2847,
-                "clinical_trials": 89
-            },
-            bioactivity_confidence=0.92
-        )
+        # Step 2: Load plant profile
+        update_job(job_id, current_step='Loading Ashwagandha plant profile...', progress=20)
 
         # Step 3: Run pipeline
-        simulation_status['current_step'] = 'Processing compound 1/3: Withanoside IV...'
-        simulation_status['progress'] = 30
+        update_job(job_id, current_step='Processing compound 1/3: Withanoside IV...', progress=30)
 
-        # Suppress print statements by redirecting stdout
-        import sys
-        import io
-        old_stdout = sys.stdout
-        sys.stdout = io.StringIO()
+        with _pipeline_run_lock:
+            optimization_results = process_plant_cached(pipeline, ASHWAGANDHA)
 
-        optimization_results = pipeline.process_traditional_plant(ashwagandha)
+            update_job(job_id, current_step='Generating comprehensive report...', progress=90)
 
-        # Restore stdout
-        sys.stdout = old_stdout
-
-        simulation_status['current_step'] = 'Generating comprehensive report...'
-        simulation_status['progress'] = 90
-        time.sleep(0.5)
-
-        # Generate report
-        development_report = pipeline.generate_development_report(optimization_results)
+            # Generate report
+            development_report = pipeline.generate_development_report(optimization_results)
 
         # Step 4: Format results for web display
-        simulation_status['current_step'] = 'Finalizing results...'
-        simulation_status['progress'] = 95
+        update_job(job_id, current_step='Finalizing results...', progress=95)
+
+        compounds, total_compensation = format_compounds(optimization_results)
 
         formatted_results = {
             'plant_name': 'Ashwagandha (Withania somnifera)',
-            'compounds': [],
+            'compounds': compounds,
             'performance_metrics': {
                 'speed_improvement': '54.3%',
                 'accuracy_enhancement': '42.8%',
                 'deployment_flexibility': '94%',
                 'processing_capacity': '22,000 optimizations/hour'
             },
-            'total_compensation': 0,
+            'total_compensation': total_compensation,
             'timestamp': datetime.now().strftime('%Y-%m-%d %H:%M:%S')
         }
 
-        for compound_name, result in optimization_results.items():
-            compound_data = {
-                'name': compound_name,
-                'qsar_score': round(result.cultural_qsar_score, 2),
-                'binding_affinity': round(result.binding_affinity, 2),
-                'bioavailability': round(result.traditional_admet_profile['bioavailability_percent'], 1),
-                'bioavailability_improvement': round(result.bioavailability_improvement, 1),
-                'safety_enhancement': round(result.safety_enhancement, 2),
-                'development_confidence': round(result.development_confidence * 100, 1),
-                'synthesis_pathway': 'traditional',  # Default fallback
-                'sustainability': 0.85,  # Default fallback
-                'cultural_preservation': "0.92/1.0",  # Default fallback
-                'optimal_solvent': result.preparation_recommendation.get('optimal_solvent', 'honey'),
-                'enhancers': result.preparation_recommendation.get('enhancers', ['piperine', 'ghee'])
-            }
-
-            # Handle compensation if available
-            equipath_comp = getattr(result, 'equipath_compensation', None)
-            if equipath_comp:
-                compound_data['compensation'] = {
-                    'amount': round(equipath_comp.get('compensation_amount', 0), 2),
-                    'record_id': equipath_comp.get('record_id', 'N/A'),
-                    'cultural_preservation': round(equipath_comp.get('cultural_preservation_score', 0.92), 2)
-                }
-                formatted_results['total_compensation'] += equipath_comp.get('compensation_amount', 0)
-            else:
-                # Default compensation values
-                compound_data['compensation'] = {
-                    'amount': 0.0,
-                    'record_id': 'DEMO-MODE',
-                    'cultural_preservation': 0.92
-                }
-
-            formatted_results['compounds'].append(compound_data)
+        # Serialize the export once; results do not change after completion
+        results_json = orjson.dumps(formatted_results, option=ORJSON_OPTIONS)
 
         # Complete
-        simulation_status['current_step'] = 'Simulation complete!'
-        simulation_status['progress'] = 100
-        simulation_status['results'] = formatted_results
-        simulation_status['running'] = False
+        update_job(
+            job_id,
+            current_step='Simulation complete!',
+            progress=100,
+            results=formatted_results,
+            results_json=results_json,
+            results_json_gz=gzip.compress(results_json, compresslevel=6),
+            running=False
+        )
 
     except Exception as e:
         import traceback
         error_details = f"Error: {str(e)}\nTraceback: {traceback.format_exc()}"
         print(f"🚨 SIMULATION ERROR: {error_details}")
-        simulation_status['error'] = str(e)
-        simulation_status['running'] = False
-        simulation_status['progress'] = 0
-        simulation_status['current_step'] = f'Error: {str(e)}'
-
-
-@app.route('/api/export-json')
-def export_json():
-    """Export results as JSON file."""
-    global simulation_status
-
-    if not simulation_status.get('results'):
-        return jsonify({'error': 'No results available'}), 404
-
-    # Create JSON string
-    json_data = json.dumps(simulation_status['results'], indent=2)
+        update_job(
+            job_id,
+            error=str(e),
+            running=False,
+            progress=0,
+            current_step=f'Error: {str(e)}'
+        )
 
-    # Create in-memory file
-    json_file = io.BytesIO()
-    json_file.write(json_data.encode('utf-8'))
-    json_file.seek(0)
 
-    return send_file(
-        json_file,
-        mimetype='application/json',
-        as_attachment=True,
-        download_name=f'chempath_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
-    )
+def set_export_caching(response: Response, etag: str, job_id: Optional[str]):
+    """Mark an export cacheable; results never change once a job completes."""
+    response.set_etag(etag)
+    response.cache_control.private = True
+    if job_id:
+        response.cache_control.no_cache = None
+        response.cache_control.max_age = JOB_TTL_SECONDS
+    else:
+        # The un-suffixed routes follow the latest job, so always revalidate
+        response.cache_control.no_cache = True
 
 
-@app.route('/api/export-pdf')
-def export_pdf():
-    """Export results as PDF file."""
-    global simulation_status
-
-    if not simulation_status.get('results'):
+@app.route('/api/export-json', defaults={'job_id': None})
+@app.route('/api/export-json/<job_id>')
+def export_json(job_id):
+    """Export results as JSON file."""
+    job = get_job(job_id)
+    if job is None or not job.results_json:
         return jsonify({'error': 'No results available'}), 404
 
-    results = simulation_status['results']
-
-    # Create PDF in memory
-    pdf_buffer = io.BytesIO()
-    doc = SimpleDocTemplate(pdf_buffer, pagesize=letter)
+    # Serve the pre-serialized export, compressed when the client allows it
+    use_gzip = 'gzip' in request.accept_encodings
+    etag = f'{job.job_id}-gz' if use_gzip else job.job_id
+    cached = not_modified(etag)
+    if cached:
+        return cached
+
+    filename = f'chempath_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.json'
+    response = Response(job.results_json_gz if use_gzip else job.results_json, mimetype='application/json',
+                        headers={'Content-Disposition': f'attachment; filename={filename}'})
+    if use_gzip:
+        response.headers['Content-Encoding'] = 'gzip'
+    response.vary.add('Accept-Encoding')
+    set_export_caching(response, etag, job_id)
+    return response
+
+
+# PDF exports are spooled in memory up to this size, then streamed in chunks
+PDF_SPOOL_SIZE = 64 * 1024
+PDF_CHUNK_SIZE = 16 * 1024
+
+# Report styles are read-only configuration, shared by every export
+PDF_STYLES = getSampleStyleSheet()
+
+METRICS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 14),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black)
+])
+
+# Compound tables share one fixed schema of (label, value formatter) rows
+COMPOUND_TABLE_ROWS = (
+    ('QSAR Score', lambda c: f"{c['qsar_score']} pIC50"),
+    ('Binding Affinity', lambda c: f"{c['binding_affinity']} pKd"),
+    ('Bioavailability', lambda c: f"{c['bioavailability']}%"),
+    ('Improvement', lambda c: f"{c['bioavailability_improvement']}x"),
+    ('Safety Enhancement', lambda c: str(c['safety_enhancement'])),
+    ('Development Confidence', lambda c: f"{c['development_confidence']}%"),
+    ('Synthesis Pathway', lambda c: c['synthesis_pathway'].upper()),
+    ('Sustainability', lambda c: str(c['sustainability'])),
+    ('Cultural Preservation', lambda c: str(c['cultural_preservation']))
+)
+
+
+class CompoundTable(Flowable):
+    """Fixed-schema compound table drawn directly on the canvas.
+
+    Every compound uses the same rows and column widths, so the cells are
+    placed at precomputed offsets instead of going through Table layout.
+    """
+
+    col_widths = (2.5 * inch, 3.5 * inch)
+    header_height = 26
+    row_height = 18
+    padding = 6
+
+    def __init__(self, compound: Dict):
+        super().__init__()
+        self.rows = [(label, value(compound)) for label, value in COMPOUND_TABLE_ROWS]
+        self.width = sum(self.col_widths)
+        self.height = self.header_height + self.row_height * len(self.rows)
+        self.hAlign = 'CENTER'
+
+    def wrap(self, availWidth, availHeight):
+        return self.width, self.height
+
+    def draw(self):
+        canv = self.canv
+        value_x = self.col_widths[0] + self.padding
+        header_bottom = self.height - self.header_height
+
+        # Header row
+        canv.setFillColor(colors.lightblue)
+        canv.rect(0, header_bottom, self.width, self.header_height, stroke=0, fill=1)
+        canv.setFillColor(colors.black)
+        canv.setFont('Helvetica-Bold', 12)
+        canv.drawString(self.padding, header_bottom + 10, 'Property')
+        canv.drawString(value_x, header_bottom + 10, 'Value')
+
+        # Body rows
+        canv.setFont('Helvetica', 10)
+        row_lines = [self.height, header_bottom]
+        y = header_bottom
+        for label, value in self.rows:
+            y -= self.row_height
+            canv.drawString(self.padding, y + 5, label)
+            canv.drawString(value_x, y + 5, value)
+            row_lines.append(y)
+
+        canv.setLineWidth(1)
+        canv.grid([0, self.col_widths[0], self.width], row_lines)
+
+
+def _build_results_pdf(results: Dict[str, Any], pdf_file) -> None:
+    """Render a job's simulation results as a PDF into pdf_file."""
+    doc = SimpleDocTemplate(pdf_file, pagesize=letter)
     story = []
-    styles = getSampleStyleSheet()
+    styles = PDF_STYLES
 
     # Title
     title = Paragraph("<b>ChemPath Simulation Results</b>", styles['Title'])
@@ -315,16 +705,7 @@ def export_pdf():
     ]
 
     metrics_table = Table(metrics_data, colWidths=[3*inch, 3*inch])
-    metrics_table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.grey),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'CENTER'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('FONTSIZE', (0, 0), (-1, 0), 14),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black)
-    ]))
+    metrics_table.setStyle(METRICS_TABLE_STYLE)
     story.append(metrics_table)
     story.append(Spacer(1, 0.3*inch))
 
@@ -337,29 +718,7 @@ def export_pdf():
         compound_name = Paragraph(f"<b>{compound['name']}</b>", styles['Heading2'])
         story.append(compound_name)
 
-        compound_data = [
-            ['Property', 'Value'],
-            ['QSAR Score', f"{compound['qsar_score']} pIC50"],
-            ['Binding Affinity', f"{compound['binding_affinity']} pKd"],
-            ['Bioavailability', f"{compound['bioavailability']}%"],
-            ['Improvement', f"{compound['bioavailability_improvement']}x"],
-            ['Safety Enhancement', str(compound['safety_enhancement'])],
-            ['Development Confidence', f"{compound['development_confidence']}%"],
-            ['Synthesis Pathway', compound['synthesis_pathway'].upper()],
-            ['Sustainability', str(compound['sustainability'])],
-            ['Cultural Preservation', str(compound['cultural_preservation'])]
-        ]
-
-        compound_table = Table(compound_data, colWidths=[2.5*inch, 3.5*inch])
-        compound_table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.lightblue),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 10),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black)
-        ]))
-        story.append(compound_table)
+        story.append(CompoundTable(compound))
         story.append(Spacer(1, 0.2*inch))
 
     # EquiPath Compensation
@@ -372,14 +731,43 @@ def export_pdf():
 
     # Build PDF
     doc.build(story)
-    pdf_buffer.seek(0)
-
-    return send_file(
-        pdf_buffer,
-        mimetype='application/pdf',
-        as_attachment=True,
-        download_name=f'chempath_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
-    )
+
+
+@app.route('/api/export-pdf', defaults={'job_id': None})
+@app.route('/api/export-pdf/<job_id>')
+def export_pdf(job_id):
+    """Export results as PDF file."""
+    job = get_job(job_id)
+    if job is None or not job.results:
+        return jsonify({'error': 'No results available'}), 404
+
+    cached = not_modified(job.job_id)
+    if cached:
+        return cached
+
+    results = job.results
+
+    # Build the PDF into a spooled file that moves to disk past PDF_SPOOL_SIZE;
+    # it is closed here if building fails, otherwise once the response is done
+    pdf_file = tempfile.SpooledTemporaryFile(max_size=PDF_SPOOL_SIZE)
+    try:
+        _build_results_pdf(results, pdf_file)
+        pdf_file.seek(0)
+    except BaseException:
+        pdf_file.close()
+        raise
+
+    def generate():
+        with pdf_file:
+            while chunk := pdf_file.read(PDF_CHUNK_SIZE):
+                yield chunk
+
+    filename = f'chempath_results_{datetime.now().strftime("%Y%m%d_%H%M%S")}.pdf'
+    response = Response(generate(), mimetype='application/pdf',
+                        headers={'Content-Disposition': f'attachment; filename={filename}'})
+    response.call_on_close(pdf_file.close)
+    set_export_caching(response, job.job_id, job_id)
+    return response
 
 
 if __name__ == '__main__':
@@ -23,14 +23,38 @@ License: MIT - For Research Simulation
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple, Optional, Union, Any
-from dataclasses import dataclass
+from typing import Dict, List, Mapping, NamedTuple, Tuple, Optional, Union, Any
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from functools import lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
+from types import MappingProxyType
+import hashlib
 import math
+import threading
 import json
+import logging
+import sys
 from datetime import datetime
 
+try:
+    from rdkit import Chem, RDLogger
+    from rdkit.Chem import Crippen, Descriptors, Lipinski, rdMolDescriptors
+    RDLogger.DisableLog('rdApp.*')
+    RDKIT_AVAILABLE = True
+except ImportError:
+    RDKIT_AVAILABLE = False
+
+try:
+    import cupy
+    CUPY_AVAILABLE = True
+except ImportError:
+    CUPY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 
 class TraditionalSolventType(Enum):
     """Traditional solvents used in cultural preparations."""
@@ -51,7 +75,15 @@ class DeploymentMode(Enum):
     ECOSYSTEM = "ecosystem"  # Full OmniPath coordination
 
 
-@dataclass
+# Optimizations per hour for each deployment mode
+_CAPACITIES = {
+    DeploymentMode.STANDALONE: 22000,
+    DeploymentMode.BUNDLE: 45000,
+    DeploymentMode.ECOSYSTEM: 78000
+}
+
+
+@dataclass(slots=True, frozen=True)
 class TraditionalSolvent:
     """
     Traditional solvent parameters for molecular mechanics calculations.
@@ -72,8 +104,43 @@ class TraditionalSolvent:
     ph_range: Tuple[float, float]  # Optimal pH range
     bioavailability_enhancement: float  # Fold improvement over water
 
-
-@dataclass
+    # Solvent-only terms of the binding model, derived once in __post_init__
+    dielectric_factor: float = field(init=False, repr=False)
+    polarity_energy: float = field(init=False, repr=False)  # Polarity shift x cultural potency
+    dipole_scale: float = field(init=False, repr=False)
+    polarizability: float = field(init=False, repr=False)
+    electrostatic_potential: float = field(init=False, repr=False)
+    binding_energy: float = field(init=False, repr=False)  # kcal/mol
+    solvation_coefficient: float = field(init=False, repr=False)  # Born term x cultural factor
+    cultural_enhancement: float = field(init=False, repr=False)
+    bioavailability_log_bonus: float = field(init=False, repr=False)
+    cultural_contribution: float = field(init=False, repr=False)
+
+    def __post_init__(self):
+        """Precompute solvent-only terms used by the binding kernels."""
+        if self.dielectric_constant <= 1.0:
+            raise ValueError(f"Dielectric constant of {self.name} must exceed 1.0")
+
+        # Frozen instance: derived fields are set through object.__setattr__
+        set_field = partial(object.__setattr__, self)
+        dielectric_factor = 1.0 / (1.0 + 0.1 * (self.dielectric_constant - 1.0))
+        born_dielectric_term = 1 - 1 / self.dielectric_constant
+        cultural_factor = 1.0 + 0.2 * (self.cultural_potency_modifier - 1.0)
+
+        set_field('dielectric_factor', dielectric_factor)
+        set_field('polarity_energy', (self.dielectric_constant - 1.0) * 2.5 * self.cultural_potency_modifier)
+        set_field('dipole_scale', 1.0 + 0.2 * self.refractive_index - 0.2)
+        set_field('polarizability', 42.5 * (1.0 + 0.001 * self.viscosity))
+        set_field('electrostatic_potential', -0.15 * dielectric_factor)
+        set_field('binding_energy', _binding_energy_kernel(self.lipophilicity_factor, self.cultural_potency_modifier,
+                                                           self.viscosity, self.ph_range[0], self.ph_range[1]))
+        set_field('solvation_coefficient', -166.0 / 3.5 * born_dielectric_term * cultural_factor)
+        set_field('cultural_enhancement', 0.2 * math.log(self.cultural_potency_modifier))
+        set_field('bioavailability_log_bonus', 0.1 * math.log(self.bioavailability_enhancement))
+        set_field('cultural_contribution', (self.cultural_potency_modifier - 1.0) * 0.5)
+
+
+@dataclass(slots=True, frozen=True)
 class MolecularTarget:
     """
     Molecular target for docking calculations.
@@ -82,12 +149,17 @@ class MolecularTarget:
     target_id: str
     target_name: str
     pdb_structure: Optional[str]  # PDB ID or structure data
-    binding_site_residues: List[str]  # Key binding site amino acids
-    allosteric_sites: List[str]  # Alternative binding sites
+    binding_site_residues: Tuple[str, ...]  # Key binding site amino acids
+    allosteric_sites: Tuple[str, ...]  # Alternative binding sites
     traditional_affinity_known: bool  # Whether traditional binding is documented
 
+    def __post_init__(self):
+        """Store residue lists as tuples so the frozen target is hashable."""
+        object.__setattr__(self, 'binding_site_residues', tuple(self.binding_site_residues))
+        object.__setattr__(self, 'allosteric_sites', tuple(self.allosteric_sites))
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class MolecularCalculationParams:
     """Parameters for classical molecular mechanics calculations."""
     force_field: str = "MMFF94"  # Molecular mechanics force field
@@ -101,16 +173,415 @@ class MolecularCalculationParams:
     deployment_mode: str = "standalone"
 
 
-@dataclass
+class SynthesisStep(NamedTuple):
+    """One step of a synthesis pathway."""
+    step: str
+    duration: str
+
+
+@dataclass(slots=True, frozen=True)
 class SynthesisPathway:
     """Synthesis pathway information for compound optimization."""
     pathway_type: str  # "traditional", "synthetic", "hybrid"
-    steps: List[Dict[str, Any]]
+    steps: Tuple[SynthesisStep, ...]
     yield_estimate: float
     cost_estimate: float
     sustainability_score: float
     cultural_preservation_score: float
 
+    def __post_init__(self):
+        """Store steps as a tuple so the frozen pathway is hashable."""
+        object.__setattr__(self, 'steps', tuple(self.steps))
+
+
+class MolecularProperties(NamedTuple):
+    """Molecular mechanics properties of a compound in a traditional solvent."""
+    molecular_energy: float  # kcal/mol
+    optimized_energy: float  # kcal/mol
+    dipole_moment: float  # Debye
+    polarizability: float
+    traditional_solvent_binding: float  # kcal/mol
+    electrostatic_potential: float
+    solvation_free_energy: float  # kcal/mol
+    dielectric_factor: float
+    cultural_enhancement: float
+    molecular_weight: float
+    log_p: float
+    tpsa: float
+    hbd: float
+    hba: float
+    rotatable_bonds: float
+
+
+@dataclass(slots=True, frozen=True)
+class DockingResult:
+    """Docking result for a compound in a traditional solvent; contribution breakdowns are built on access."""
+    binding_affinity_pKd: float
+    base_affinity: float
+    pose_confidence: float
+    bioavailability_fold_improvement: float
+    solvent: TraditionalSolvent
+    solvent_binding: float  # kcal/mol
+    solvation_energy: float  # kcal/mol
+    cultural_enhancement: float
+
+    @property
+    def binding_affinity_kcal_mol(self) -> float:
+        return ENERGY_PER_PKD * self.binding_affinity_pKd
+
+    @property
+    def traditional_enhancement(self) -> float:
+        return self.binding_affinity_pKd - self.base_affinity
+
+    @property
+    def solvent_contributions(self) -> Dict[str, float]:
+        return {
+            'cultural_potency': self.solvent.cultural_potency_modifier,
+            'lipophilic_enhancement': self.solvent.lipophilicity_factor,
+            'bioavailability_factor': self.solvent.bioavailability_enhancement
+        }
+
+    @property
+    def molecular_contributions(self) -> Dict[str, float]:
+        return {
+            'binding_energy': self.solvent_binding,
+            'solvation_energy': self.solvation_energy,
+            'cultural_enhancement': self.cultural_enhancement
+        }
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Docking results as a plain dictionary."""
+        return {
+            'binding_affinity_pKd': self.binding_affinity_pKd,
+            'binding_affinity_kcal_mol': self.binding_affinity_kcal_mol,
+            'base_affinity': self.base_affinity,
+            'traditional_enhancement': self.traditional_enhancement,
+            'pose_confidence': self.pose_confidence,
+            'bioavailability_fold_improvement': self.bioavailability_fold_improvement,
+            'solvent_contributions': self.solvent_contributions,
+            'molecular_contributions': self.molecular_contributions
+        }
+
+
+# Record layout of MolecularProperties for per-solvent batches
+MOLECULAR_PROPERTIES_DTYPE = np.dtype([(name, np.float64) for name in MolecularProperties._fields])
+
+# Record layout of featurize() output
+DESCRIPTOR_FIELDS = ('molecular_weight', 'log_p', 'tpsa', 'hbd', 'hba', 'rotatable_bonds')
+DESCRIPTOR_DTYPE = np.dtype([(name, np.float64) for name in DESCRIPTOR_FIELDS])
+
+
+# Upper bounds on memoized results per simulator / per process
+PROPERTY_CACHE_SIZE = 100_000
+DESCRIPTOR_CACHE_SIZE = 100_000
+
+# Binding free energy per pKd unit: ΔG = -RT ln(10^-pKd) = -2.303 RT pKd, RT = 0.592 kcal/mol at 298K
+ENERGY_PER_PKD = -1.364
+
+# Solvent fields packed into columns for the vectorized molecular mechanics path
+SOLVENT_TABLE_FIELDS = (
+    'dielectric_constant', 'cultural_potency_modifier', 'bioavailability_enhancement',
+    'dielectric_factor', 'polarity_energy', 'dipole_scale', 'polarizability', 'electrostatic_potential',
+    'binding_energy', 'solvation_coefficient', 'cultural_enhancement',
+    'bioavailability_log_bonus', 'cultural_contribution'
+)
+
+
+def build_solvent_table(solvents: List[TraditionalSolvent]) -> Dict[str, np.ndarray]:
+    """
+    Pack traditional solvent parameters into structure-of-arrays columns.
+
+    Args:
+        solvents: Traditional solvents, one row each
+
+    Returns:
+        Dictionary of float64 columns keyed by SOLVENT_TABLE_FIELDS
+    """
+    return {
+        field_name: np.array([getattr(solvent, field_name) for solvent in solvents], dtype=np.float64)
+        for field_name in SOLVENT_TABLE_FIELDS
+    }
+
+
+def molecular_seed(*parts: str) -> int:
+    """
+    Stable 64-bit seed for a molecule, identical across processes.
+
+    Unlike the built-in hash(), the value does not depend on PYTHONHASHSEED,
+    so simulated properties and caches are reproducible between runs.
+
+    Args:
+        parts: Strings identifying the calculation (SMILES, target ID, ...)
+
+    Returns:
+        Unsigned 64-bit integer seed
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    for part in parts:
+        digest.update(part.encode('utf-8'))
+    return int.from_bytes(digest.digest(), 'little')
+
+
+def pkd_to_energy(pkd: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    """Convert pKd (scalar or array) to binding energy in kcal/mol."""
+    return ENERGY_PER_PKD * pkd
+
+
+def _molecule_rng(seed: int) -> np.random.Generator:
+    """Independent random stream for a molecule; leaves global NumPy state untouched."""
+    return np.random.Generator(np.random.Philox(key=seed))
+
+
+def featurize(smiles_list: List[str]) -> np.ndarray:
+    """
+    Compute molecular descriptors for a batch of compounds.
+
+    Uses RDKit when installed; otherwise (or for SMILES RDKit cannot parse)
+    falls back to the simulated descriptors.
+
+    Args:
+        smiles_list: SMILES strings of the compounds
+
+    Returns:
+        Structured array of DESCRIPTOR_DTYPE records, one per compound
+    """
+    features = np.empty(len(smiles_list), dtype=DESCRIPTOR_DTYPE)
+    for i, molecule_smiles in enumerate(smiles_list):
+        descriptors = _molecular_descriptors(molecule_smiles)
+        features[i] = tuple(descriptors[name] for name in DESCRIPTOR_FIELDS)
+    return features
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def _molecular_descriptors(molecule_smiles: str) -> Dict[str, float]:
+    """Solvent-independent molecular descriptors, memoized per SMILES."""
+    if RDKIT_AVAILABLE:
+        mol = Chem.MolFromSmiles(molecule_smiles)
+        if mol is not None:
+            return {
+                'molecular_weight': Descriptors.MolWt(mol),
+                'log_p': Crippen.MolLogP(mol),
+                'tpsa': rdMolDescriptors.CalcTPSA(mol),
+                'hbd': float(Lipinski.NumHDonors(mol)),
+                'hba': float(Lipinski.NumHAcceptors(mol)),
+                'rotatable_bonds': float(rdMolDescriptors.CalcNumRotatableBonds(mol))
+            }
+
+    # Simulated descriptors
+    mol_hash = molecular_seed(molecule_smiles) % 1000
+    rng = _molecule_rng(mol_hash)
+
+    return {
+        'molecular_weight': rng.uniform(200, 500),
+        'log_p': rng.uniform(1.0, 4.5),
+        'tpsa': rng.uniform(40, 140),
+        'hbd': float(rng.integers(1, 6)),
+        'hba': float(rng.integers(2, 10)),
+        'rotatable_bonds': float(rng.integers(2, 12))
+    }
+
+
+# Scalar kernels: pure float arithmetic on primitive solvent fields, shared by
+# the per-call methods on ClassicalBindingSimulator
+
+def _binding_energy_kernel(lipophilicity: float, potency: float, viscosity: float,
+                           ph_low: float, ph_high: float) -> float:
+    """Traditional solvent binding energy in kcal/mol."""
+    lipophilic_bonus = -1.2 * (lipophilicity - 1.0) if lipophilicity > 1.5 else 0.0
+    cultural_bonus = -0.8 * (potency - 1.0)
+    viscosity_effect = -0.002 * (viscosity if viscosity < 100.0 else 100.0)
+    ph_bonus = -0.3 * abs(7.0 - (ph_low + ph_high) / 2) / 3.5
+    return -8.3 + lipophilic_bonus + cultural_bonus + viscosity_effect + ph_bonus
+
+
+def _solvation_energy_kernel(dipole_moment: float, solvation_coefficient: float) -> float:
+    """Born solvation free energy with cultural enhancement."""
+    return solvation_coefficient * (dipole_moment * dipole_moment)
+
+
+def _enhancement_kernel(base_affinity: float, cultural_enhancement: float, solvent_binding: float,
+                        bioavailability_log_bonus: float) -> float:
+    """Binding affinity (pKd) after traditional preparation enhancements."""
+    # Both log terms are precomputed once per solvent in TraditionalSolvent.__post_init__
+    total_enhancement = cultural_enhancement + solvent_binding * 0.05 + bioavailability_log_bonus
+    return base_affinity + total_enhancement
+
+
+def _bioavailability_kernel(bioavailability_enhancement: float, solvation_energy: float,
+                            solvent_binding: float, cultural_contribution: float) -> float:
+    """Bioavailability fold improvement, floored at 1x."""
+    # Solvation and solvent binding energies are always negative, so negation is abs()
+    total_enhancement = (bioavailability_enhancement - solvation_energy * 0.01 -
+                         solvent_binding * 0.05 + cultural_contribution)
+    return total_enhancement if total_enhancement > 1.0 else 1.0
+
+
+# Batch drivers: module-level so process pools can pickle them
+
+def _mm_solvent_energies(molecule_smiles: str, polarity_energy: np.ndarray, dipole_scale: np.ndarray,
+                         solvation_coefficient: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Molecular energy, dipole moment and solvation energy of a molecule per solvent (or one solvent)."""
+    base_energy, base_dipole = _base_mm_properties(molecule_smiles)
+
+    # Solvent effects on molecular properties; solvent-only terms are precomputed
+    molecular_energy = base_energy - polarity_energy
+    dipole_moment = base_dipole * dipole_scale
+
+    # Born solvation with cultural enhancement
+    solvation_energy = solvation_coefficient * (dipole_moment * dipole_moment)
+    return molecular_energy, dipole_moment, solvation_energy
+
+
+def _base_mm_properties(molecule_smiles: str) -> Tuple[float, float]:
+    """Simulated solvent-free energy (kcal/mol) and dipole moment (Debye) of the optimized structure."""
+    # Simulate molecular hash for reproducible "calculations"
+    mol_hash = molecular_seed(molecule_smiles) % 1000000
+    rng = _molecule_rng(mol_hash)
+
+    base_energy = -250.0 + rng.normal(0, 30.0)
+    base_dipole = 3.8 + rng.normal(0, 0.5)
+    return base_energy, base_dipole
+
+
+def _base_affinity(compound_smiles: str, target_id: str) -> float:
+    """Simulated solvent-free binding affinity (pKd) of a compound to a target."""
+    mol_hash = molecular_seed(compound_smiles, target_id) % 1000
+    return 7.2 + _molecule_rng(mol_hash).normal(0, 0.5)
+
+
+def _dock_ligands(smiles_list: List[str], target_id: str, solvents: Dict[str, np.ndarray],
+                  use_gpu: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Binding affinity (pKd) and bioavailability of compounds across solvents.
+
+    The seeded per-compound draws run on the CPU; the (ligand x solvent)
+    arithmetic is broadcast on the GPU through CuPy when requested and
+    installed, otherwise through NumPy.
+
+    Args:
+        smiles_list: SMILES strings of the compounds
+        target_id: Identifier of the docking target
+        solvents: Solvent parameter columns from build_solvent_table
+        use_gpu: Whether to evaluate the pair matrices on the GPU
+
+    Returns:
+        (ligand x solvent) affinity and bioavailability matrices as NumPy arrays
+    """
+    xp = cupy if use_gpu and CUPY_AVAILABLE else np
+    base_affinity = xp.asarray([_base_affinity(smiles, target_id) for smiles in smiles_list],
+                               dtype=np.float64)[:, None]
+    base_dipole = xp.asarray([_base_mm_properties(smiles)[1] for smiles in smiles_list],
+                             dtype=np.float64)[:, None]
+    columns = {name: xp.asarray(solvents[name]) for name in (
+        'dipole_scale', 'solvation_coefficient', 'binding_energy', 'cultural_enhancement',
+        'bioavailability_log_bonus', 'bioavailability_enhancement', 'cultural_contribution')}
+
+    dipole_moment = base_dipole * columns['dipole_scale']
+    solvation_energy = columns['solvation_coefficient'] * (dipole_moment * dipole_moment)
+    affinity = base_affinity + (columns['cultural_enhancement'] + columns['binding_energy'] * 0.05 +
+                                columns['bioavailability_log_bonus'])
+    bioavailability = xp.fmax(columns['bioavailability_enhancement'] - solvation_energy * 0.01 -
+                              columns['binding_energy'] * 0.05 + columns['cultural_contribution'], 1.0)
+
+    if xp is not np:
+        return cupy.asnumpy(affinity), cupy.asnumpy(bioavailability)
+    return affinity, bioavailability
+
+
+def _build_solvent_db() -> Dict[str, TraditionalSolvent]:
+    """
+    Initialize database of traditional solvents with molecular parameters.
+
+    Returns:
+        Dictionary of traditional solvent parameters
+    """
+    solvents = {
+        "ghee": TraditionalSolvent(
+            name="Clarified Butter (Ghee)",
+            solvent_type=TraditionalSolventType.GHEE,
+            dielectric_constant=3.2,  # Low polarity, lipophilic
+            refractive_index=1.465,
+            density=0.91,
+            viscosity=45.0,
+            surface_tension=28.5,
+            lipophilicity_factor=2.3,  # Enhances lipophilic compound solubility
+            cultural_potency_modifier=1.8,  # Ayurvedic preparation enhancement
+            temperature_sensitivity=0.85,  # Stable at body temperature
+            ph_range=(6.0, 7.5),
+            bioavailability_enhancement=3.2  # 3.2x improvement for curcumin
+        ),
+
+        "coconut_oil": TraditionalSolvent(
+            name="Virgin Coconut Oil",
+            solvent_type=TraditionalSolventType.COCONUT_OIL,
+            dielectric_constant=2.8,
+            refractive_index=1.448,
+            density=0.924,
+            viscosity=32.0,
+            surface_tension=26.8,
+            lipophilicity_factor=2.1,
+            cultural_potency_modifier=1.6,  # Traditional Pacific medicine
+            temperature_sensitivity=0.90,
+            ph_range=(5.5, 7.0),
+            bioavailability_enhancement=2.8
+        ),
+
+        "neem_oil": TraditionalSolvent(
+            name="Neem Oil Extract",
+            solvent_type=TraditionalSolventType.NEEM_OIL,
+            dielectric_constant=4.1,
+            refractive_index=1.462,
+            density=0.912,
+            viscosity=48.5,
+            surface_tension=31.2,
+            lipophilicity_factor=1.9,
+            cultural_potency_modifier=2.1,  # Synergistic antimicrobial effects
+            temperature_sensitivity=0.75,
+            ph_range=(6.2, 7.8),
+            bioavailability_enhancement=2.2
+        ),
+
+        "honey": TraditionalSolvent(
+            name="Raw Honey",
+            solvent_type=TraditionalSolventType.HONEY,
+            dielectric_constant=16.5,  # Higher polarity due to sugars
+            refractive_index=1.504,
+            density=1.38,
+            viscosity=2000.0,  # Very viscous
+            surface_tension=58.2,
+            lipophilicity_factor=0.6,  # Enhances hydrophilic compounds
+            cultural_potency_modifier=1.9,  # Antimicrobial synergy
+            temperature_sensitivity=0.65,  # Heat sensitive
+            ph_range=(3.2, 4.5),  # Acidic
+            bioavailability_enhancement=1.8
+        ),
+
+        "sesame_oil": TraditionalSolvent(
+            name="Sesame Oil",
+            solvent_type=TraditionalSolventType.SESAME_OIL,
+            dielectric_constant=3.4,
+            refractive_index=1.472,
+            density=0.92,
+            viscosity=38.0,
+            surface_tension=29.5,
+            lipophilicity_factor=2.0,
+            cultural_potency_modifier=1.7,  # Traditional Ayurvedic and TCM use
+            temperature_sensitivity=0.82,
+            ph_range=(5.8, 7.2),
+            bioavailability_enhancement=2.5
+        )
+    }
+
+    return solvents
+
+
+# Traditional solvent database, built once at import and shared read-only by all simulators
+_SOLVENT_DB: Mapping[str, TraditionalSolvent] = MappingProxyType(_build_solvent_db())
+_SOLVENT_NAMES = tuple(_SOLVENT_DB)
+_SOLVENT_TABLE = build_solvent_table(list(_SOLVENT_DB.values()))
+for _column in _SOLVENT_TABLE.values():
+    _column.setflags(write=False)
+
 
 class ClassicalBindingSimulator:
     """
@@ -130,128 +601,40 @@ class ClassicalBindingSimulator:
         Initialize Classical Binding Simulator.
 
         Args:
-            use_gpu: Whether to use GPU acceleration for calculations
-            max_workers: Maximum worker threads for parallel calculations
+            use_gpu: Whether to use GPU acceleration (CuPy) for batch docking
+            max_workers: Maximum worker processes for parallel docking (dock_many)
             deployment_mode: Deployment configuration (standalone/bundle/ecosystem)
         """
         self.use_gpu = use_gpu
         self.max_workers = max_workers
         self.deployment_mode = DeploymentMode(deployment_mode)
 
-        # Initialize traditional solvent database
-        self.traditional_solvents = self._initialize_traditional_solvents()
+        # Shared traditional solvent database
+        self.traditional_solvents = _SOLVENT_DB
+        self.solvent_names = _SOLVENT_NAMES
+        self.solvent_table = _SOLVENT_TABLE
 
-        # Cache for computed molecular properties
-        self.property_cache = {}
+        # LRU cache for computed molecular properties
+        self.property_cache = OrderedDict()
+        self._property_cache_lock = threading.Lock()
 
         # Performance tracking
         self.processing_capacity = self._get_processing_capacity()
 
-        print(f"🔬 Classical Binding Simulator initialized")
-        print(f"   GPU Acceleration: {self.use_gpu}")
-        print(f"   Deployment Mode: {self.deployment_mode.value}")
-        print(f"   Processing Capacity: {self.processing_capacity:,} optimizations/hour")
-        print(f"   Traditional solvents loaded: {len(self.traditional_solvents)}")
+        logger.info("🔬 Classical Binding Simulator initialized")
+        logger.info("   GPU Acceleration: %s", self.use_gpu)
+        logger.info("   Deployment Mode: %s", self.deployment_mode.value)
+        logger.info("   Processing Capacity: %s optimizations/hour", format(self.processing_capacity, ','))
+        logger.info("   Traditional solvents loaded: %s", len(self.traditional_solvents))
 
     def _get_processing_capacity(self) -> int:
         """Get processing capacity based on deployment mode."""
-        capacities = {
-            DeploymentMode.STANDALONE: 22000,
-            DeploymentMode.BUNDLE: 45000,
-            DeploymentMode.ECOSYSTEM: 78000
-        }
-        return capacities.get(self.deployment_mode, 22000)
-
-    def _initialize_traditional_solvents(self) -> Dict[str, TraditionalSolvent]:
-        """
-        Initialize database of traditional solvents with molecular parameters.
-
-        Returns:
-            Dictionary of traditional solvent parameters
-        """
-        solvents = {
-            "ghee": TraditionalSolvent(
-                name="Clarified Butter (Ghee)",
-                solvent_type=TraditionalSolventType.GHEE,
-                dielectric_constant=3.2,  # Low polarity, lipophilic
-                refractive_index=1.465,
-                density=0.91,
-                viscosity=45.0,
-                surface_tension=28.5,
-                lipophilicity_factor=2.3,  # Enhances lipophilic compound solubility
-                cultural_potency_modifier=1.8,  # Ayurvedic preparation enhancement
-                temperature_sensitivity=0.85,  # Stable at body temperature
-                ph_range=(6.0, 7.5),
-                bioavailability_enhancement=3.2  # 3.2x improvement for curcumin
-            ),
-
-            "coconut_oil": TraditionalSolvent(
-                name="Virgin Coconut Oil",
-                solvent_type=TraditionalSolventType.COCONUT_OIL,
-                dielectric_constant=2.8,
-                refractive_index=1.448,
-                density=0.924,
-                viscosity=32.0,
-                surface_tension=26.8,
-                lipophilicity_factor=2.1,
-                cultural_potency_modifier=1.6,  # Traditional Pacific medicine
-                temperature_sensitivity=0.90,
-                ph_range=(5.5, 7.0),
-                bioavailability_enhancement=2.8
-            ),
-
-            "neem_oil": TraditionalSolvent(
-                name="Neem Oil Extract",
-                solvent_type=TraditionalSolventType.NEEM_OIL,
-                dielectric_constant=4.1,
-                refractive_index=1.462,
-                density=0.912,
-                viscosity=48.5,
-                surface_tension=31.2,
-                lipophilicity_factor=1.9,
-                cultural_potency_modifier=2.1,  # Synergistic antimicrobial effects
-                temperature_sensitivity=0.75,
-                ph_range=(6.2, 7.8),
-                bioavailability_enhancement=2.2
-            ),
-
-            "honey": TraditionalSolvent(
-                name="Raw Honey",
-                solvent_type=TraditionalSolventType.HONEY,
-                dielectric_constant=16.5,  # Higher polarity due to sugars
-                refractive_index=1.504,
-                density=1.38,
-                viscosity=2000.0,  # Very viscous
-                surface_tension=58.2,
-                lipophilicity_factor=0.6,  # Enhances hydrophilic compounds
-                cultural_potency_modifier=1.9,  # Antimicrobial synergy
-                temperature_sensitivity=0.65,  # Heat sensitive
-                ph_range=(3.2, 4.5),  # Acidic
-                bioavailability_enhancement=1.8
-            ),
-
-            "sesame_oil": TraditionalSolvent(
-                name="Sesame Oil",
-                solvent_type=TraditionalSolventType.SESAME_OIL,
-                dielectric_constant=3.4,
-                refractive_index=1.472,
-                density=0.92,
-                viscosity=38.0,
-                surface_tension=29.5,
-                lipophilicity_factor=2.0,
-                cultural_potency_modifier=1.7,  # Traditional Ayurvedic and TCM use
-                temperature_sensitivity=0.82,
-                ph_range=(5.8, 7.2),
-                bioavailability_enhancement=2.5
-            )
-        }
-
-        return solvents
+        return _CAPACITIES[self.deployment_mode]
 
     def calculate_molecular_properties(self,
                                      molecule_smiles: str,
                                      solvent: TraditionalSolvent,
-                                     calc_params: MolecularCalculationParams) -> Dict[str, float]:
+                                     calc_params: MolecularCalculationParams) -> MolecularProperties:
         """
         Calculate molecular mechanics properties with traditional solvent effects.
 
@@ -261,93 +644,94 @@ class ClassicalBindingSimulator:
             calc_params: Molecular calculation parameters
 
         Returns:
-            Dictionary of calculated molecular properties
+            Calculated molecular properties
         """
-        # Check cache first
-        cache_key = f"{molecule_smiles}_{solvent.name}_{calc_params.force_field}"
-        if cache_key in self.property_cache:
-            return self.property_cache[cache_key]
+        # Check cache first; tuple keys reuse each string's cached hash
+        cache_key = (molecule_smiles, solvent.name, calc_params.force_field)
+        with self._property_cache_lock:
+            cached = self.property_cache.get(cache_key)
+            if cached is not None:
+                self.property_cache.move_to_end(cache_key)
+                return cached
 
-        print(f"🔬 Computing molecular properties for {molecule_smiles[:20]}... in {solvent.name}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🔬 Computing molecular properties for %s... in %s", molecule_smiles[:20], solvent.name)
 
         # Perform molecular mechanics calculation
         properties = self._simulate_molecular_mechanics(molecule_smiles, solvent, calc_params)
 
-        # Cache results
-        self.property_cache[cache_key] = properties
+        # Cache results, evicting the least recently used entry when full
+        with self._property_cache_lock:
+            self.property_cache[cache_key] = properties
+            if len(self.property_cache) > PROPERTY_CACHE_SIZE:
+                self.property_cache.popitem(last=False)
 
         return properties
 
     def _simulate_molecular_mechanics(self,
                                     molecule_smiles: str,
                                     solvent: TraditionalSolvent,
-                                    calc_params: MolecularCalculationParams) -> Dict[str, float]:
+                                    calc_params: MolecularCalculationParams) -> MolecularProperties:
         """
         Simulate molecular mechanics calculation with traditional solvent effects.
 
         Uses classical force fields (MMFF94, UFF, etc.) instead of quantum methods.
         """
-        # Simulate molecular hash for reproducible "calculations"
-        mol_hash = hash(molecule_smiles) % 1000000
-        np.random.seed(mol_hash)
-
-        # Base molecular properties (optimized structure)
-        base_energy = -250.0 + np.random.normal(0, 30.0)
-        base_dipole = 3.8 + np.random.normal(0, 0.5)
-
-        # Solvent effects on molecular properties
-        dielectric_factor = 1.0 / (1.0 + 0.1 * (solvent.dielectric_constant - 1.0))
-        polarity_shift = (solvent.dielectric_constant - 1.0) * 2.5
-
-        # Calculate solvent-modified properties
-        molecular_energy = base_energy - polarity_shift * solvent.cultural_potency_modifier
-
-        # Dipole moment changes in traditional solvents
-        dipole_moment = base_dipole * (1.0 + 0.2 * solvent.refractive_index - 0.2)
-
-        # Polarizability affected by solvent viscosity
-        polarizability = 42.5 * (1.0 + 0.001 * solvent.viscosity)
+        molecular_energy, dipole_moment, solvation_energy = _mm_solvent_energies(
+            molecule_smiles, solvent.polarity_energy, solvent.dipole_scale, solvent.solvation_coefficient
+        )
 
-        # Traditional solvent binding energy (key innovation)
-        solvent_binding_energy = self._calculate_traditional_binding_energy(
-            molecule_smiles, solvent
+        return MolecularProperties(
+            molecular_energy=molecular_energy,
+            optimized_energy=molecular_energy - solvation_energy,
+            dipole_moment=dipole_moment,
+            polarizability=solvent.polarizability,
+            traditional_solvent_binding=solvent.binding_energy,
+            electrostatic_potential=solvent.electrostatic_potential,
+            solvation_free_energy=solvation_energy,
+            dielectric_factor=solvent.dielectric_factor,
+            cultural_enhancement=solvent.cultural_potency_modifier,
+            **_molecular_descriptors(molecule_smiles)
         )
 
-        # Electrostatic potential in solvent
-        electrostatic_potential = -0.15 * dielectric_factor
+    def _simulate_mm_batch(self,
+                           molecule_smiles: str,
+                           solvents: Dict[str, np.ndarray],
+                           calc_params: MolecularCalculationParams) -> np.ndarray:
+        """
+        Simulate molecular mechanics for one molecule across a batch of solvents.
 
-        # Solvation free energy with cultural enhancement
-        solvation_energy = self._calculate_solvation_energy(solvent, dipole_moment)
+        Args:
+            molecule_smiles: SMILES string of the molecule
+            solvents: Solvent parameter columns from build_solvent_table
+            calc_params: Molecular calculation parameters
 
-        # Molecular descriptors for ADMET
-        descriptors = self._calculate_molecular_descriptors(molecule_smiles)
+        Returns:
+            Structured array of MOLECULAR_PROPERTIES_DTYPE records, one per solvent
+        """
+        molecular_energy, dipole_moment, solvation_energy = _mm_solvent_energies(
+            molecule_smiles, solvents['polarity_energy'], solvents['dipole_scale'], solvents['solvation_coefficient']
+        )
 
-        return {
-            'molecular_energy': molecular_energy,
-            'optimized_energy': molecular_energy - solvation_energy,
-            'dipole_moment': dipole_moment,
-            'polarizability': polarizability,
-            'traditional_solvent_binding': solvent_binding_energy,
-            'electrostatic_potential': electrostatic_potential,
-            'solvation_free_energy': solvation_energy,
-            'dielectric_factor': dielectric_factor,
-            'cultural_enhancement': solvent.cultural_potency_modifier,
-            **descriptors
-        }
+        properties = np.empty(len(molecular_energy), dtype=MOLECULAR_PROPERTIES_DTYPE)
+        properties['molecular_energy'] = molecular_energy
+        properties['optimized_energy'] = molecular_energy - solvation_energy
+        properties['dipole_moment'] = dipole_moment
+        properties['polarizability'] = solvents['polarizability']
+        properties['traditional_solvent_binding'] = solvents['binding_energy']
+        properties['electrostatic_potential'] = solvents['electrostatic_potential']
+        properties['solvation_free_energy'] = solvation_energy
+        properties['dielectric_factor'] = solvents['dielectric_factor']
+        properties['cultural_enhancement'] = solvents['cultural_potency_modifier']
+
+        # Molecular descriptors for ADMET are solvent-independent
+        for name, value in _molecular_descriptors(molecule_smiles).items():
+            properties[name] = value
+        return properties
 
     def _calculate_molecular_descriptors(self, molecule_smiles: str) -> Dict[str, float]:
         """Calculate molecular descriptors for QSAR analysis."""
-        mol_hash = hash(molecule_smiles) % 1000
-        np.random.seed(mol_hash)
-
-        return {
-            'molecular_weight': np.random.uniform(200, 500),
-            'log_p': np.random.uniform(1.0, 4.5),
-            'tpsa': np.random.uniform(40, 140),
-            'hbd': float(np.random.randint(1, 6)),
-            'hba': float(np.random.randint(2, 10)),
-            'rotatable_bonds': float(np.random.randint(2, 12))
-        }
+        return dict(_molecular_descriptors(molecule_smiles))
 
     def _calculate_traditional_binding_energy(self,
                                             molecule_smiles: str,
@@ -358,53 +742,26 @@ class ClassicalBindingSimulator:
         This is ChemPath's key innovation - modeling specific interactions
         between compounds and traditional preparation solvents.
         """
-        # Simulate molecular properties that affect solvent binding
-        mol_hash = hash(molecule_smiles) % 1000
-
-        # Base binding affinity
-        base_binding = -8.3  # kcal/mol
-
-        # Lipophilicity enhancement for lipophilic solvents
-        lipophilic_bonus = 0.0
-        if solvent.lipophilicity_factor > 1.5:
-            lipophilic_bonus = -1.2 * (solvent.lipophilicity_factor - 1.0)
-
-        # Cultural preparation enhancement
-        cultural_bonus = -0.8 * (solvent.cultural_potency_modifier - 1.0)
-
-        # Viscosity effect (slower diffusion but better stability)
-        viscosity_effect = -0.002 * min(solvent.viscosity, 100.0)
-
-        # pH compatibility
-        ph_optimal = (solvent.ph_range[0] + solvent.ph_range[1]) / 2
-        ph_bonus = -0.3 * abs(7.0 - ph_optimal) / 3.5
-
-        total_binding = (base_binding + lipophilic_bonus + cultural_bonus +
-                        viscosity_effect + ph_bonus)
-
-        return total_binding
+        return solvent.binding_energy
 
     def _calculate_solvation_energy(self,
                                   solvent: TraditionalSolvent,
                                   dipole_moment: float) -> float:
         """Calculate solvation free energy in traditional solvent."""
-        # Born solvation model with traditional solvent modifications
-        born_radius = 3.5  # Angstroms, typical for small molecules
-        dielectric = solvent.dielectric_constant
-
-        # Born solvation energy
-        born_energy = -166.0 * (dipole_moment ** 2) * (1 - 1/dielectric) / born_radius
-
-        # Cultural enhancement factor
-        cultural_factor = 1.0 + 0.2 * (solvent.cultural_potency_modifier - 1.0)
+        return _solvation_energy_kernel(dipole_moment, solvent.solvation_coefficient)
 
-        return born_energy * cultural_factor
+    def _calculate_solvation_energy_batch(self,
+                                        solvent: TraditionalSolvent,
+                                        dipole_moments: np.ndarray) -> np.ndarray:
+        """Calculate solvation free energies for an array of dipole moments."""
+        dipole_moments = np.asarray(dipole_moments, dtype=np.float64)
+        return solvent.solvation_coefficient * (dipole_moments * dipole_moments)
 
     def dock_with_traditional_solvent(self,
                                     compound_smiles: str,
                                     target: MolecularTarget,
                                     solvent: TraditionalSolvent,
-                                    molecular_props: Dict[str, float]) -> Dict[str, Any]:
+                                    molecular_props: MolecularProperties) -> DockingResult:
         """
         Perform molecular docking with traditional solvent context.
 
@@ -417,19 +774,52 @@ class ClassicalBindingSimulator:
         Returns:
             Docking results with traditional context
         """
-        print(f"🎯 Docking {compound_smiles[:15]}... to {target.target_name} in {solvent.name}")
+        return self._dock(compound_smiles, target, solvent,
+                          molecular_props.traditional_solvent_binding,
+                          molecular_props.solvation_free_energy,
+                          molecular_props.cultural_enhancement)
+
+    def screen(self,
+               compound_smiles: str,
+               target: MolecularTarget,
+               solvent: TraditionalSolvent) -> DockingResult:
+        """
+        Dock a compound in a traditional solvent in a single pass.
+
+        Equivalent to calculate_molecular_properties followed by
+        dock_with_traditional_solvent, but only the solvation energy is
+        simulated and no property dictionary is built or cached.
 
-        # Simulate binding affinity calculation
-        mol_hash = hash(compound_smiles + target.target_id) % 1000
-        np.random.seed(mol_hash)
+        Args:
+            compound_smiles: SMILES string of compound
+            target: Molecular target for docking
+            solvent: Traditional solvent parameters
+
+        Returns:
+            Docking results with traditional context
+        """
+        _, _, solvation_energy = _mm_solvent_energies(compound_smiles, solvent.polarity_energy,
+                                                      solvent.dipole_scale, solvent.solvation_coefficient)
+        return self._dock(compound_smiles, target, solvent, solvent.binding_energy,
+                          solvation_energy, solvent.cultural_potency_modifier)
+
+    def _dock(self,
+              compound_smiles: str,
+              target: MolecularTarget,
+              solvent: TraditionalSolvent,
+              solvent_binding: float,
+              solvation_energy: float,
+              cultural_enhancement: float) -> DockingResult:
+        """Docking results from the molecular terms that binding depends on."""
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🎯 Docking %s... to %s in %s", compound_smiles[:15], target.target_name, solvent.name)
 
         # Base binding affinity
-        base_affinity = 7.2 + np.random.normal(0, 0.5)
+        base_affinity = _base_affinity(compound_smiles, target.target_id)
 
         # Apply traditional solvent enhancements
-        enhanced_affinity = self._apply_traditional_enhancements(
-            base_affinity, solvent, molecular_props
-        )
+        enhanced_affinity = _enhancement_kernel(base_affinity, solvent.cultural_enhancement,
+                                                solvent_binding, solvent.bioavailability_log_bonus)
 
         # Calculate binding pose confidence
         pose_confidence = self._calculate_pose_confidence(
@@ -437,27 +827,91 @@ class ClassicalBindingSimulator:
         )
 
         # Bioavailability prediction with traditional enhancement
-        bioavailability = self._predict_bioavailability(
-            compound_smiles, solvent, molecular_props
+        bioavailability = _bioavailability_kernel(solvent.bioavailability_enhancement, solvation_energy,
+                                                  solvent_binding, solvent.cultural_contribution)
+
+        return DockingResult(
+            binding_affinity_pKd=enhanced_affinity,
+            base_affinity=base_affinity,
+            pose_confidence=pose_confidence,
+            bioavailability_fold_improvement=bioavailability,
+            solvent=solvent,
+            solvent_binding=solvent_binding,
+            solvation_energy=solvation_energy,
+            cultural_enhancement=cultural_enhancement
         )
 
+    def dock_batch(self,
+                   smiles_list: List[str],
+                   target: MolecularTarget,
+                   solvent_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Dock many compounds to one target across a batch of solvents.
+
+        All (ligand x solvent) pairs are evaluated as broadcast array
+        expressions over the columnar solvent table, on the GPU when
+        use_gpu is set and CuPy is installed.
+
+        Args:
+            smiles_list: SMILES strings of the compounds
+            target: Molecular target for docking
+            solvent_names: Solvent database keys to screen (default: all)
+
+        Returns:
+            Solvent names and (ligand x solvent) matrices of affinity and bioavailability
+        """
+        solvent_names, solvents = self._select_solvents(solvent_names)
+        affinity, bioavailability = _dock_ligands(list(smiles_list), target.target_id, solvents, self.use_gpu)
+        return self._docking_matrices(solvent_names, affinity, bioavailability)
+
+    def dock_many(self,
+                  smiles_list: List[str],
+                  target: MolecularTarget,
+                  solvent_names: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Dock many compounds in parallel across up to max_workers processes.
+
+        Same results as dock_batch, evaluated on the CPU in ligand chunks;
+        worthwhile for large virtual screens where the per-ligand work
+        outweighs process start-up and pickling.
+
+        Args:
+            smiles_list: SMILES strings of the compounds
+            target: Molecular target for docking
+            solvent_names: Solvent database keys to screen (default: all)
+
+        Returns:
+            Solvent names and (ligand x solvent) matrices of affinity and bioavailability
+        """
+        solvent_names, solvents = self._select_solvents(solvent_names)
+        smiles_list = list(smiles_list)
+        chunk_size = max(1, len(smiles_list) // (self.max_workers * 4))
+        chunks = [smiles_list[i:i + chunk_size] for i in range(0, len(smiles_list), chunk_size)] or [[]]
+
+        worker = partial(_dock_ligands, target_id=target.target_id, solvents=solvents)
+        with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(worker, chunks))
+        return self._docking_matrices(solvent_names,
+                                      np.vstack([affinity for affinity, _ in results]),
+                                      np.vstack([bioavailability for _, bioavailability in results]))
+
+    def _select_solvents(self, solvent_names: Optional[List[str]]) -> Tuple[List[str], Dict[str, np.ndarray]]:
+        """Solvent names and their columns from the solvent table (default: all); KeyError names an unknown solvent."""
+        solvent_names = list(solvent_names or self.solvent_names)
+        for name in solvent_names:
+            if name not in self.traditional_solvents:
+                raise KeyError(name)
+        rows = [self.solvent_names.index(name) for name in solvent_names]
+        return solvent_names, {column: values[rows] for column, values in self.solvent_table.items()}
+
+    def _docking_matrices(self, solvent_names: List[str], affinity: np.ndarray,
+                          bioavailability: np.ndarray) -> Dict[str, Any]:
+        """Package (ligand x solvent) docking matrices with their solvent labels."""
         return {
-            'binding_affinity_pKd': enhanced_affinity,
-            'binding_affinity_kcal_mol': self._convert_pkd_to_energy(enhanced_affinity),
-            'base_affinity': base_affinity,
-            'traditional_enhancement': enhanced_affinity - base_affinity,
-            'pose_confidence': pose_confidence,
-            'bioavailability_fold_improvement': bioavailability,
-            'solvent_contributions': {
-                'cultural_potency': solvent.cultural_potency_modifier,
-                'lipophilic_enhancement': solvent.lipophilicity_factor,
-                'bioavailability_factor': solvent.bioavailability_enhancement
-            },
-            'molecular_contributions': {
-                'binding_energy': molecular_props['traditional_solvent_binding'],
-                'solvation_energy': molecular_props['solvation_free_energy'],
-                'cultural_enhancement': molecular_props['cultural_enhancement']
-            }
+            'solvents': solvent_names,
+            'binding_affinity_pKd': affinity,
+            'binding_affinity_kcal_mol': pkd_to_energy(affinity),
+            'bioavailability_fold_improvement': bioavailability
         }
 
     def optimize_synthesis_pathway(self,
@@ -471,7 +925,8 @@ class ClassicalBindingSimulator:
         - Synthetic chemical routes
         - Hybrid semi-synthetic approaches
         """
-        print(f"🧪 Optimizing synthesis pathways for compound...")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("🧪 Optimizing synthesis pathways for compound...")
 
         # Analyze traditional synthesis methods
         traditional_pathway = self._analyze_traditional_synthesis(
@@ -498,11 +953,11 @@ class ClassicalBindingSimulator:
         """Analyze traditional extraction and purification methods."""
         return SynthesisPathway(
             pathway_type="traditional",
-            steps=[
-                {"step": "Plant material harvest", "duration": "seasonal"},
-                {"step": "Traditional extraction", "duration": "12-48 hours"},
-                {"step": "Cultural purification", "duration": "varies"}
-            ],
+            steps=(
+                SynthesisStep("Plant material harvest", "seasonal"),
+                SynthesisStep("Traditional extraction", "12-48 hours"),
+                SynthesisStep("Cultural purification", "varies")
+            ),
             yield_estimate=0.05,  # 5% typical for plant extraction
             cost_estimate=250.0,  # $/kg
             sustainability_score=0.95,  # High sustainability
@@ -513,12 +968,12 @@ class ClassicalBindingSimulator:
         """Generate modern synthetic chemistry routes."""
         return SynthesisPathway(
             pathway_type="synthetic",
-            steps=[
-                {"step": "Starting material synthesis", "duration": "2 days"},
-                {"step": "Key intermediate formation", "duration": "1 day"},
-                {"step": "Final product synthesis", "duration": "3 days"},
-                {"step": "Purification and characterization", "duration": "1 day"}
-            ],
+            steps=(
+                SynthesisStep("Starting material synthesis", "2 days"),
+                SynthesisStep("Key intermediate formation", "1 day"),
+                SynthesisStep("Final product synthesis", "3 days"),
+                SynthesisStep("Purification and characterization", "1 day")
+            ),
             yield_estimate=0.65,  # 65% synthetic yield
             cost_estimate=1200.0,  # $/kg
             sustainability_score=0.45,  # Lower sustainability
@@ -529,11 +984,11 @@ class ClassicalBindingSimulator:
         """Create hybrid semi-synthetic approach."""
         return SynthesisPathway(
             pathway_type="hybrid",
-            steps=[
-                {"step": "Traditional extraction of precursor", "duration": "24 hours"},
-                {"step": "Chemical modification", "duration": "2 days"},
-                {"step": "Optimization and purification", "duration": "1 day"}
-            ],
+            steps=(
+                SynthesisStep("Traditional extraction of precursor", "24 hours"),
+                SynthesisStep("Chemical modification", "2 days"),
+                SynthesisStep("Optimization and purification", "1 day")
+            ),
             yield_estimate=0.42,  # 42% hybrid yield
             cost_estimate=580.0,  # $/kg - balanced cost
             sustainability_score=0.78,  # Good sustainability
@@ -543,20 +998,11 @@ class ClassicalBindingSimulator:
     def _apply_traditional_enhancements(self,
                                       base_affinity: float,
                                       solvent: TraditionalSolvent,
-                                      molecular_props: Dict[str, float]) -> float:
+                                      molecular_props: MolecularProperties) -> float:
         """Apply traditional preparation enhancements to binding affinity."""
-        # Cultural potency modifier
-        cultural_enhancement = 0.2 * math.log(solvent.cultural_potency_modifier)
-
-        # Solvent-specific binding enhancement
-        solvent_enhancement = molecular_props['traditional_solvent_binding'] * 0.05
-
-        # Bioavailability-derived affinity improvement
-        bioavail_enhancement = 0.1 * math.log(solvent.bioavailability_enhancement)
-
-        total_enhancement = cultural_enhancement + solvent_enhancement + bioavail_enhancement
-
-        return base_affinity + total_enhancement
+        return _enhancement_kernel(base_affinity, solvent.cultural_enhancement,
+                                   molecular_props.traditional_solvent_binding,
+                                   solvent.bioavailability_log_bonus)
 
     def _calculate_pose_confidence(self,
                                  compound_smiles: str,
@@ -577,28 +1023,12 @@ class ClassicalBindingSimulator:
     def _predict_bioavailability(self,
                                compound_smiles: str,
                                solvent: TraditionalSolvent,
-                               molecular_props: Dict[str, float]) -> float:
+                               molecular_props: MolecularProperties) -> float:
         """Predict bioavailability enhancement from traditional preparation."""
-        # Base bioavailability enhancement from solvent
-        base_enhancement = solvent.bioavailability_enhancement
-
-        # Molecular property contributions
-        solvation_contribution = abs(molecular_props['solvation_free_energy']) * 0.01
-        binding_contribution = abs(molecular_props['traditional_solvent_binding']) * 0.05
-
-        # Cultural preparation bonus
-        cultural_contribution = (solvent.cultural_potency_modifier - 1.0) * 0.5
-
-        total_enhancement = (base_enhancement + solvation_contribution +
-                           binding_contribution + cultural_contribution)
-
-        return max(total_enhancement, 1.0)  # At least 1x (no decrease)
-
-    def _convert_pkd_to_energy(self, pkd: float) -> float:
-        """Convert pKd to binding energy in kcal/mol."""
-        # ΔG = -RT ln(Kd) = -RT ln(10^(-pKd)) = 2.303 RT pKd
-        # At 298K: RT = 0.592 kcal/mol
-        return -1.364 * pkd  # -2.303 * 0.592 * pKd
+        return _bioavailability_kernel(solvent.bioavailability_enhancement,
+                                       molecular_props.solvation_free_energy,
+                                       molecular_props.traditional_solvent_binding,
+                                       solvent.cultural_contribution)
 
 
 def simulate_classical_binding():
@@ -620,8 +1050,8 @@ def simulate_classical_binding():
         target_id="COX2_HUMAN",
         target_name="Cyclooxygenase-2",
         pdb_structure="5KIR",
-        binding_site_residues=["Arg120", "Tyr355", "Phe518", "Ile523", "Gly526"],
-        allosteric_sites=["Arg513", "Phe504"],
+        binding_site_residues=("Arg120", "Tyr355", "Phe518", "Ile523", "Gly526"),
+        allosteric_sites=("Arg513", "Phe504"),
         traditional_affinity_known=True  # Traditional anti-inflammatories known
     )
 
@@ -644,27 +1074,19 @@ def simulate_classical_binding():
 
         print(f"\n--- {solvent.name} ---")
 
-        # Calculate molecular properties
-        calc_params = MolecularCalculationParams()
-        molecular_props = simulator.calculate_molecular_properties(
-            curcumin_smiles, solvent, calc_params
-        )
+        # Molecular mechanics and docking in one pass
+        docking_results = simulator.screen(curcumin_smiles, cox2_target, solvent)
 
-        # Perform docking
-        docking_results = simulator.dock_with_traditional_solvent(
-            curcumin_smiles, cox2_target, solvent, molecular_props
-        )
-
-        print(f"   Binding Affinity: {docking_results['binding_affinity_pKd']:.2f} pKd")
-        print(f"   Traditional Enhancement: {docking_results['traditional_enhancement']:.2f}")
-        print(f"   Bioavailability Improvement: {docking_results['bioavailability_fold_improvement']:.1f}x")
+        print(f"   Binding Affinity: {docking_results.binding_affinity_pKd:.2f} pKd")
+        print(f"   Traditional Enhancement: {docking_results.traditional_enhancement:.2f}")
+        print(f"   Bioavailability Improvement: {docking_results.bioavailability_fold_improvement:.1f}x")
         print(f"   Cultural Potency Factor: {solvent.cultural_potency_modifier:.1f}")
 
         results.append({
             'solvent': solvent_name,
-            'affinity': docking_results['binding_affinity_pKd'],
-            'enhancement': docking_results['traditional_enhancement'],
-            'bioavailability': docking_results['bioavailability_fold_improvement']
+            'affinity': docking_results.binding_affinity_pKd,
+            'enhancement': docking_results.traditional_enhancement,
+            'bioavailability': docking_results.bioavailability_fold_improvement
         })
 
     # Demonstrate synthesis pathway optimization
@@ -688,5 +1110,7 @@ def simulate_classical_binding():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.DEBUG, format="%(message)s", stream=sys.stdout)
+
     # Run simulation
     simulator, target, results = simulate_classical_binding()
@@ -30,14 +30,105 @@ License: MIT - For Research Simulation
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional, Union, Any
+import orjson
+from typing import Dict, List, Mapping, Tuple, Optional, Union, Any
+from collections import deque
 from dataclasses import dataclass, asdict
 from datetime import datetime
-import json
-from io import StringIO
+from functools import cached_property, lru_cache, partial
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from types import MappingProxyType
+import atexit
+import hashlib
+import io
+import logging
+import os
+import pickle
+import sys
+
+try:
+    from rdkit import Chem, RDLogger
+    RDLogger.DisableLog('rdApp.*')
+    RDKIT_AVAILABLE = True
+except ImportError:
+    RDKIT_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Traditional solvents screened for every compound, in tie-break order
+SCREENING_SOLVENTS = ['ghee', 'honey', 'coconut_oil', 'sesame_oil']
+
+# Upper bound on memoized SMILES-derived results per process
+DESCRIPTOR_CACHE_SIZE = 4096
+
+# Write buffer for the demo's stdout when run as a script
+STDOUT_BUFFER_SIZE = 65536
+
+# Bump when pipeline outputs change so cached demo results are not reused
+SIMULATION_CACHE_VERSION = "5.1.1"
+
+# Plant runs kept in memory; older runs are only in the optional JSONL history
+PIPELINE_HISTORY_SIZE = 128
+
+# Published performance metrics per deployment mode (read-only, shared by all pipelines)
+_PERFORMANCE_METRICS = MappingProxyType({
+    'standalone': MappingProxyType({
+        'capacity': 22000,
+        'accuracy_improvement': '42.8%',
+        'speed_improvement': '54.3%',
+        'deployment_flexibility': '94%'
+    }),
+    'bundle': MappingProxyType({
+        'capacity': 45000,
+        'accuracy_improvement': '45.2%',
+        'speed_improvement': '58.7%',
+        'deployment_flexibility': '96%'
+    }),
+    'ecosystem': MappingProxyType({
+        'capacity': 78000,
+        'accuracy_improvement': '48.1%',
+        'speed_improvement': '62.3%',
+        'deployment_flexibility': '98%'
+    })
+})
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def canonical_smiles(smiles: str) -> str:
+    """RDKit canonical SMILES; the input is returned unchanged without RDKit or if it cannot be parsed."""
+    if RDKIT_AVAILABLE:
+        mol = Chem.MolFromSmiles(smiles)
+        if mol is not None:
+            return Chem.MolToSmiles(mol)
+    return smiles
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def _descriptors_cached(smiles: str):
+    """Simulated molecular descriptors, memoized per canonical SMILES."""
+    from cultural_qsar_engine import MolecularDescriptors
+    from classical_binding_simulator import molecular_seed
+    # Simulate molecular descriptor calculation with a local generator,
+    # seeded identically in every process regardless of PYTHONHASHSEED
+    mol_hash = molecular_seed(smiles) % 1000
+    rng = np.random.default_rng(mol_hash)
+    mol_weight, log_p, tpsa = rng.uniform([200, 1.0, 40], [500, 4.0, 120]).tolist()
+    hbd, hba, rotatable_bonds, aromatic_rings = rng.integers([1, 2, 2, 1], [6, 8, 10, 3]).tolist()
+
+    return MolecularDescriptors(
+        mol_weight=mol_weight,
+        log_p=log_p,
+        tpsa=tpsa,
+        hbd=hbd,
+        hba=hba,
+        rotatable_bonds=rotatable_bonds,
+        aromatic_rings=aromatic_rings
+    )
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TraditionalPlant:
     """
     Traditional medicinal plant profile from EthnoPath integration.
@@ -54,7 +145,69 @@ class TraditionalPlant:
     bioactivity_confidence: float  # 0-1, genomic validation from GenomePath
 
 
-@dataclass
+@dataclass(slots=True)
+class ActiveCompoundTable:
+    """
+    Column-wise view of TraditionalPlant.active_compounds for batched calculations.
+    """
+    names: np.ndarray
+    smiles: np.ndarray
+    concentration: np.ndarray  # Percent of plant material; NaN when not reported
+    importance: np.ndarray  # Traditional importance 0-1; 0.8 when not reported
+
+    @classmethod
+    def from_list_of_dicts(cls, compounds: List[Dict[str, Any]]) -> 'ActiveCompoundTable':
+        """Build the table from EthnoPath active compound records."""
+        return cls(
+            names=np.array([compound['name'] for compound in compounds], dtype=object),
+            smiles=np.array([compound['smiles'] for compound in compounds], dtype=object),
+            concentration=np.array([compound.get('concentration_percent', np.nan) for compound in compounds],
+                                   dtype=np.float64),
+            importance=np.array([compound.get('traditional_importance', 0.8) for compound in compounds],
+                                dtype=np.float64)
+        )
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+
+@dataclass(slots=True, frozen=True)
+class TraditionalContribution:
+    """
+    Traditional knowledge contribution of one active compound for EquiPath compensation.
+    """
+    contributor_id: str
+    compound_name: str
+    value: float
+    significance: float
+    tradition: str
+    geographic_origin: str
+    preparation_method: str
+    traditional_use: str
+    knowledge_type: str = 'chemical'
+    community_consensus: float = 0.9
+    preservation_priority: float = 0.9
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Contribution record in the format expected by the EquiPath coordinator."""
+        return {
+            'contributor_id': self.contributor_id,
+            'knowledge_type': self.knowledge_type,
+            'value': self.value,
+            'cultural_context': {
+                'tradition': self.tradition,
+                'significance': self.significance,
+                'preservation_priority': self.preservation_priority
+            },
+            'geographic_origin': self.geographic_origin,
+            'community_consensus': self.community_consensus,
+            'compound_name': self.compound_name,
+            'preparation_method': self.preparation_method,
+            'traditional_use': self.traditional_use
+        }
+
+
+@dataclass(slots=True)
 class OptimizationResults:
     """
     Results from ChemPath optimization pipeline.
@@ -87,94 +240,75 @@ class ChemPathIntegratedPipeline:
     - Traditional knowledge preservation
     """
 
-    def __init__(self, deployment_mode: str = "standalone", enable_equipath: bool = True):
+    def __init__(self, deployment_mode: str = "standalone", enable_equipath: bool = True,
+                 max_workers: Optional[int] = 1, history_path: Optional[str] = None):
         """
         Initialize the integrated ChemPath pipeline.
 
         Args:
             deployment_mode: Deployment configuration (standalone/bundle/ecosystem)
             enable_equipath: Enable EquiPath compensation integration
+            max_workers: Worker processes for per-compound processing (1 = serial, None = all CPUs)
+            history_path: JSONL file each plant run summary is appended to (None = in-memory only)
         """
-        print("🌿 Initializing ChemPath Integrated Pipeline v5.1")
-        print("=" * 55)
-        print(f"   Deployment Mode: {deployment_mode}")
-        print(f"   EquiPath Integration: {'✅ Enabled' if enable_equipath else '❌ Disabled'}")
+        logger.info("🌿 Initializing ChemPath Integrated Pipeline v5.1")
+        logger.info("=" * 55)
+        logger.info("   Deployment Mode: %s", deployment_mode)
+        logger.info("   EquiPath Integration: %s", '✅ Enabled' if enable_equipath else '❌ Disabled')
 
         self.deployment_mode = deployment_mode
         self.enable_equipath = enable_equipath
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.history_path = history_path
 
-        # Initialize all ChemPath modules
-        print(f"\n   ⚗️  Cultural QSAR Engine... Loading")
-        self.cultural_qsar = self._initialize_cultural_qsar()
-
-        print(f"   🔬 Classical Binding Simulator... Loading")
-        self.classical_simulator = self._initialize_classical_simulator()
-
-        print(f"   💊 Tradition-Aware ADMET Predictor... Loading")
-        self.admet_predictor = self._initialize_admet_predictor()
-
-        if self.enable_equipath:
-            print(f"   🔒 EquiPath Compensation Coordinator... Loading")
-            self.equipath_coordinator = self._initialize_equipath()
+        # ChemPath modules are imported and constructed on first use
 
         # Performance metrics
         self.performance_metrics = self._get_performance_metrics()
 
-        # Integration tracking
-        self.pipeline_results = []
-        self.optimization_history = []
+        # Integration tracking, bounded to the most recent plant runs
+        self.pipeline_results = deque(maxlen=PIPELINE_HISTORY_SIZE)
+        self.optimization_history = deque(maxlen=PIPELINE_HISTORY_SIZE)
 
-        print(f"\n   ✅ ChemPath Integration Complete")
-        print(f"   📊 Processing Capacity: {self.performance_metrics['capacity']:,} optimizations/hour")
-        print(f"   🎯 Accuracy Enhancement: {self.performance_metrics['accuracy_improvement']}")
-        print(f"   ⚡ Speed Improvement: {self.performance_metrics['speed_improvement']}")
-        print(f"   📊 Ready for traditional plant processing")
+        logger.info("\n   ✅ ChemPath Integration Complete")
+        logger.info("   📊 Processing Capacity: %s optimizations/hour", format(self.performance_metrics['capacity'], ','))
+        logger.info("   🎯 Accuracy Enhancement: %s", self.performance_metrics['accuracy_improvement'])
+        logger.info("   ⚡ Speed Improvement: %s", self.performance_metrics['speed_improvement'])
+        logger.info("   📊 Ready for traditional plant processing")
 
-    def _get_performance_metrics(self) -> Dict[str, Any]:
+    def _get_performance_metrics(self) -> Mapping[str, Any]:
         """Get performance metrics based on deployment mode."""
-        metrics = {
-            'standalone': {
-                'capacity': 22000,
-                'accuracy_improvement': '42.8%',
-                'speed_improvement': '54.3%',
-                'deployment_flexibility': '94%'
-            },
-            'bundle': {
-                'capacity': 45000,
-                'accuracy_improvement': '45.2%',
-                'speed_improvement': '58.7%',
-                'deployment_flexibility': '96%'
-            },
-            'ecosystem': {
-                'capacity': 78000,
-                'accuracy_improvement': '48.1%',
-                'speed_improvement': '62.3%',
-                'deployment_flexibility': '98%'
-            }
-        }
-        return metrics.get(self.deployment_mode, metrics['standalone'])
+        return _PERFORMANCE_METRICS.get(self.deployment_mode, _PERFORMANCE_METRICS['standalone'])
 
-    def _initialize_cultural_qsar(self):
-        """Initialize Cultural QSAR Engine."""
+    @cached_property
+    def cultural_qsar(self):
+        """Cultural QSAR Engine, loaded on first use."""
+        logger.info("   ⚗️  Cultural QSAR Engine... Loading")
         # Import here to avoid circular dependencies
         from cultural_qsar_engine import CulturalQSAREngine
         return CulturalQSAREngine(deployment_mode=self.deployment_mode)
 
-    def _initialize_classical_simulator(self):
-        """Initialize Classical Binding Simulator."""
-        from classical_binding_simulator import ClassicalBindingSimulator, MolecularCalculationParams
+    @cached_property
+    def classical_simulator(self):
+        """Classical Binding Simulator, loaded on first use."""
+        logger.info("   🔬 Classical Binding Simulator... Loading")
+        from classical_binding_simulator import ClassicalBindingSimulator
         return ClassicalBindingSimulator(
             use_gpu=True,
             deployment_mode=self.deployment_mode
         )
 
-    def _initialize_admet_predictor(self):
-        """Initialize Tradition-Aware ADMET Predictor."""
+    @cached_property
+    def admet_predictor(self):
+        """Tradition-Aware ADMET Predictor, loaded on first use."""
+        logger.info("   💊 Tradition-Aware ADMET Predictor... Loading")
         from tradition_aware_admet_predictor import TraditionAwareADMETPredictor
         return TraditionAwareADMETPredictor()
 
-    def _initialize_equipath(self):
-        """Initialize EquiPath Compensation Coordinator."""
+    @cached_property
+    def equipath_coordinator(self):
+        """EquiPath Compensation Coordinator, loaded on first use."""
+        logger.info("   🔒 EquiPath Compensation Coordinator... Loading")
         from equipath_integration import EquiPathCoordinator
         return EquiPathCoordinator(deployment_mode=self.deployment_mode)
 
@@ -188,168 +322,78 @@ class ChemPathIntegratedPipeline:
         Returns:
             Dictionary of optimization results for each active compound
         """
-        print(f"\n🌱 Processing Traditional Plant: {plant.scientific_name}")
-        print(f"   Common names: {', '.join(plant.common_names)}")
-        print(f"   Traditional uses: {', '.join(plant.traditional_uses[:3])}...")
-        print(f"   Active compounds: {len(plant.active_compounds)}")
-        print(f"   Bioactivity confidence: {plant.bioactivity_confidence:.2f}")
+        logger.info("\n🌱 Processing Traditional Plant: %s", plant.scientific_name)
+        logger.info("   Common names: %s", ', '.join(plant.common_names))
+        logger.info("   Traditional uses: %s...", ', '.join(plant.traditional_uses[:3]))
+        logger.info("   Active compounds: %s", len(plant.active_compounds))
+        logger.info("   Bioactivity confidence: %.2f", plant.bioactivity_confidence)
 
         results = {}
-        traditional_contributions = []
-
-        for i, compound_data in enumerate(plant.active_compounds):
-            compound_name = compound_data['name']
-            compound_smiles = compound_data['smiles']
-
-            print(f"\n   🧪 Processing compound {i+1}/{len(plant.active_compounds)}: {compound_name}")
-
-            # Step 1: Cultural QSAR Analysis
-            print(f"      Step 1: Cultural QSAR optimization...")
-            cultural_vars = self._extract_cultural_variables(plant, compound_data)
-            mol_desc = self._extract_molecular_descriptors(compound_smiles)
-
-            # Step 2: Classical Molecular Modeling with Traditional Solvents
-            print(f"      Step 2: Classical molecular binding simulation...")
-            classical_results = {}
-            best_solvent = None
-            best_binding = 0.0
-
-            for solvent in ['ghee', 'honey', 'coconut_oil', 'sesame_oil']:
-                # Calculate molecular properties
-                from classical_binding_simulator import MolecularCalculationParams
-                calc_params = MolecularCalculationParams(deployment_mode=self.deployment_mode)
-
-                molecular_props = self.classical_simulator.calculate_molecular_properties(
-                    compound_smiles,
-                    self.classical_simulator.traditional_solvents[solvent],
-                    calc_params
-                )
-
-                # Perform docking
-                from classical_binding_simulator import MolecularTarget
-                target = MolecularTarget(
-                    target_id="STRESS_TARGET",
-                    target_name="Cortisol Receptor",
-                    pdb_structure="5KIR",
-                    binding_site_residues=["Arg120", "Tyr355"],
-                    allosteric_sites=[],
-                    traditional_affinity_known=True
-                )
-
-                binding_results = self.classical_simulator.dock_with_traditional_solvent(
-                    compound_smiles, target,
-                    self.classical_simulator.traditional_solvents[solvent],
-                    molecular_props
-                )
-
-                classical_results[solvent] = {
-                    'molecular_props': molecular_props,
-                    'binding_results': binding_results
-                }
-
-                if binding_results['binding_affinity_pKd'] > best_binding:
-                    best_binding = binding_results['binding_affinity_pKd']
-                    best_solvent = solvent
-
-            # Step 3: Cultural QSAR Prediction
-            print(f"      Step 3: Cultural QSAR prediction...")
-            best_molecular_props = classical_results[best_solvent]['molecular_props']
-
-            # Create MolecularFeatures for QSAR
-            from cultural_qsar_engine import MolecularFeatures
-            molecular_feat = MolecularFeatures(
-                molecular_energy=best_molecular_props['molecular_energy'],
-                optimized_energy=best_molecular_props['optimized_energy'],
-                dipole_moment=best_molecular_props['dipole_moment'],
-                polarizability=best_molecular_props['polarizability'],
-                traditional_solvent_binding=best_molecular_props['traditional_solvent_binding'],
-                electrostatic_potential=best_molecular_props['electrostatic_potential'],
-                log_p=best_molecular_props['log_p'],
-                molecular_weight=best_molecular_props['molecular_weight']
-            )
-
-            qsar_results = self.cultural_qsar.predict_bioactivity(
-                cultural_vars, mol_desc, molecular_feat
-            )
-
-            # Step 4: Synthesis Pathway Optimization
-            print(f"      Step 4: Synthesis pathway optimization...")
-            traditional_knowledge = {
-                'extraction_method': plant.traditional_preparations[0]['method'],
-                'cultural_context': plant.cultural_contexts[0]
-            }
-            synthesis_pathways = self.classical_simulator.optimize_synthesis_pathway(
-                compound_smiles, traditional_knowledge
-            )
-
-            # Step 5: Traditional ADMET Prediction
-            print(f"      Step 5: Traditional ADMET prediction...")
-            timing_factors = {
-                'fasting_state': True,
-                'optimal_circadian': True,
-                'lunar_phase': cultural_vars.lunar_phase
-            }
+        traditional_contributions: List[TraditionalContribution] = []
+
+        # Loop-invariant calculation inputs, built once per plant
+        from classical_binding_simulator import MolecularCalculationParams, MolecularTarget
+        calc_params = MolecularCalculationParams(deployment_mode=self.deployment_mode)
+        target = MolecularTarget(
+            target_id="STRESS_TARGET",
+            target_name="Cortisol Receptor",
+            pdb_structure="5KIR",
+            binding_site_residues=("Arg120", "Tyr355"),
+            allosteric_sites=(),
+            traditional_affinity_known=True
+        )
 
-            # Find optimal preparation
-            optimization = self.admet_predictor.optimize_traditional_preparation(
-                compound_smiles, target_bioavail=75.0, safety_threshold=0.95
+        # Dock every compound across all screening solvents in one batch
+        compounds = ActiveCompoundTable.from_list_of_dicts(plant.active_compounds)
+        affinities = self.classical_simulator.dock_batch(
+            compounds.smiles.tolist(), target, SCREENING_SOLVENTS
+        )['binding_affinity_pKd']
+
+        # Compounds are independent until the EquiPath batch below
+        columns = (range(len(compounds)), compounds.names, compounds.smiles, affinities)
+        if self.max_workers > 1 and len(compounds) > 1:
+            with ProcessPoolExecutor(max_workers=min(self.max_workers, len(compounds)),
+                                     initializer=_init_compound_worker,
+                                     initargs=(self.deployment_mode, self.enable_equipath)) as executor:
+                processed = list(executor.map(
+                    partial(_process_compound_in_worker, plant, calc_params=calc_params), *columns
+                ))
+        else:
+            # Serial compounds log each status line as their work happens
+            processed = (
+                self._process_one_compound(plant, i, name, smiles, compound_affinities, calc_params)
+                for i, name, smiles, compound_affinities in zip(*columns)
             )
 
-            # Step 6: EquiPath Compensation (if enabled)
-            equipath_record = None
-            if self.enable_equipath:
-                print(f"      Step 6: EquiPath compensation processing...")
-                contribution = {
-                    'contributor_id': f'TRAD-{i+1:03d}',
-                    'knowledge_type': 'chemical',
-                    'value': plant.bioactivity_confidence,
-                    'cultural_context': {
-                        'tradition': plant.cultural_contexts[0],
-                        'significance': compound_data.get('traditional_importance', 0.8),
-                        'preservation_priority': 0.9
-                    },
-                    'geographic_origin': plant.geographic_origin,
-                    'community_consensus': 0.9,
-                    'compound_name': compound_name,
-                    'preparation_method': plant.traditional_preparations[0]['method'],
-                    'traditional_use': plant.traditional_uses[0]
-                }
-                traditional_contributions.append(contribution)
-
-            # Step 7: Compile Results
-            print(f"      Step 7: Compiling optimization results...")
-
-            results[compound_name] = OptimizationResults(
-                compound_name=compound_name,
-                optimized_smiles=compound_smiles,
-                cultural_qsar_score=qsar_results['bioactivity_prediction'],
-                binding_affinity=classical_results[best_solvent]['binding_results']['binding_affinity_pKd'],
-                traditional_admet_profile=optimization['predicted_admet'],
-                synthesis_pathways=synthesis_pathways,
-                preparation_recommendation={
-                    'optimal_solvent': best_solvent,
-                    'enhancers': optimization['enhancers'],
-                    'timing': optimization['timing'],
-                    'route': 'oral_traditional',
-                    'synthesis_pathway': synthesis_pathways['recommended_pathway'].pathway_type
-                },
-                bioavailability_improvement=optimization['predicted_admet']['bioavailability_improvement_fold'],
-                safety_enhancement=optimization['predicted_admet']['traditional_safety_enhancement'],
-                development_confidence=min(plant.bioactivity_confidence * optimization['optimization_score'], 1.0)
-            )
+        for compound_name, result, status in processed:
+            if status:
+                logger.info(status)
+            results[compound_name] = result
 
-            print(f"      ✅ {compound_name} optimization complete")
-            print(f"         QSAR Score: {qsar_results['bioactivity_prediction']:.2f} pIC50")
-            print(f"         Binding Affinity: {best_binding:.2f} pKd")
-            print(f"         Bioavailability: {optimization['predicted_admet']['bioavailability_percent']:.1f}%")
-            print(f"         Enhancement: {optimization['predicted_admet']['bioavailability_improvement_fold']:.1f}x")
-            print(f"         Cultural Preservation: {qsar_results['bias_mitigation']['cultural_preservation_score']:.2f}")
+        if self.enable_equipath:
+            # Plant-level context is shared by every compound's contribution
+            tradition = plant.cultural_contexts[0]
+            prep_method = plant.traditional_preparations[0]['method']
+            trad_use = plant.traditional_uses[0]
+            traditional_contributions = [
+                TraditionalContribution(
+                    contributor_id=f'TRAD-{i+1:03d}',
+                    compound_name=name,
+                    value=plant.bioactivity_confidence,
+                    significance=float(importance),
+                    tradition=tradition,
+                    geographic_origin=plant.geographic_origin,
+                    preparation_method=prep_method,
+                    traditional_use=trad_use
+                )
+                for i, (name, importance) in enumerate(zip(compounds.names, compounds.importance))
+            ]
 
         # Process EquiPath compensation for all contributions
         if self.enable_equipath and traditional_contributions:
-            print(f"\n   🔒 Processing EquiPath Compensation...")
+            logger.info("\n   🔒 Processing EquiPath Compensation...")
             compensation_records = self.equipath_coordinator.coordinate_traditional_knowledge_compensation(
-                traditional_contributions
+                [contribution.as_dict() for contribution in traditional_contributions]
             )
 
             # Add compensation records to results
@@ -362,17 +406,174 @@ class ChemPathIntegratedPipeline:
                         'verified': compensation_records[i].verified
                     }
 
-        self.pipeline_results.append({
+        self.record_run(plant, results)
+
+        return results
+
+    def record_run(self, plant: TraditionalPlant, results: Dict[str, OptimizationResults], cached: bool = False):
+        """
+        Add a plant run to the in-memory history and, if configured, the JSONL history.
+
+        Args:
+            plant: Traditional plant profile that was processed
+            results: Optimization results for each active compound
+            cached: Whether the results were replayed from an earlier run's cache
+        """
+        run = {
             'plant': plant.scientific_name,
             'timestamp': datetime.now(),
             'compounds_processed': len(plant.active_compounds),
             'results': results,
-            'performance_metrics': self.performance_metrics
-        })
+            'performance_metrics': self.performance_metrics,
+            'cached': cached
+        }
+        self.pipeline_results.append(run)
+        if self.history_path:
+            self._append_history(run)
+
+    def _append_history(self, run: Dict[str, Any]):
+        """Append a plant run summary to the JSONL history; compounds keep scores and record IDs only."""
+        summary = {
+            'plant': run['plant'],
+            'timestamp': run['timestamp'],
+            'compounds_processed': run['compounds_processed'],
+            'compounds': [
+                {
+                    'compound_name': name,
+                    'cultural_qsar_score': float(result.cultural_qsar_score),
+                    'binding_affinity': float(result.binding_affinity),
+                    'development_confidence': float(result.development_confidence),
+                    'record_id': result.equipath_compensation['record_id'] if result.equipath_compensation else None
+                }
+                for name, result in run['results'].items()
+            ],
+            'performance_metrics': dict(run['performance_metrics']),
+            'cached': run['cached']
+        }
+        with open(self.history_path, 'ab') as history:
+            history.write(orjson.dumps(summary) + b"\n")
 
-        return results
+    def _process_one_compound(self, plant: TraditionalPlant, i: int, compound_name: str, compound_smiles: str,
+                              affinities: np.ndarray, calc_params,
+                              buffer_status: bool = False) -> Tuple[str, OptimizationResults, Optional[str]]:
+        """
+        Run QSAR, solvent selection, synthesis and ADMET steps for one active compound.
+
+        Args:
+            plant: Traditional plant profile from EthnoPath
+            i: Index of the compound within plant.active_compounds
+            compound_name: Compound name
+            compound_smiles: Compound SMILES
+            affinities: Docked binding affinities (pKd) across SCREENING_SOLVENTS
+            calc_params: Molecular calculation parameters
+            buffer_status: Return the status lines instead of logging them (pool workers)
+
+        Returns:
+            Compound name, its optimization results and its buffered status log (None unless buffered)
+        """
+        from cultural_qsar_engine import MolecularFeatures
+
+        # Status lines are logged as each step starts, or buffered for the parent process
+        status: List[str] = []
+        note = status.append if buffer_status else logger.info
+        note("\n   🧪 Processing compound %s/%s: %s" % (i + 1, len(plant.active_compounds), compound_name))
+
+        # Step 1: Cultural QSAR Analysis
+        note("      Step 1: Cultural QSAR optimization...")
+        cultural_vars = self._extract_cultural_variables(plant)
+        mol_desc = self._extract_molecular_descriptors(compound_smiles)
+
+        # Step 2: Classical Molecular Modeling with Traditional Solvents
+        note("      Step 2: Classical molecular binding simulation...")
+        # Keep the screening solvent with the strongest binding
+        simulator = self.classical_simulator
+        best_index = int(np.argmax(affinities))
+        best_solvent = SCREENING_SOLVENTS[best_index]
+        best_binding = float(affinities[best_index])
+        best_molecular_props = simulator.calculate_molecular_properties(
+            compound_smiles,
+            simulator.traditional_solvents[best_solvent],
+            calc_params
+        )
+
+        # Step 3: Cultural QSAR Prediction
+        note("      Step 3: Cultural QSAR prediction...")
+
+        # Create MolecularFeatures for QSAR
+        molecular_feat = MolecularFeatures(
+            molecular_energy=best_molecular_props.molecular_energy,
+            optimized_energy=best_molecular_props.optimized_energy,
+            dipole_moment=best_molecular_props.dipole_moment,
+            polarizability=best_molecular_props.polarizability,
+            traditional_solvent_binding=best_molecular_props.traditional_solvent_binding,
+            electrostatic_potential=best_molecular_props.electrostatic_potential,
+            log_p=best_molecular_props.log_p,
+            molecular_weight=best_molecular_props.molecular_weight
+        )
+
+        qsar_results = self.cultural_qsar.predict_bioactivity(
+            cultural_vars, mol_desc, molecular_feat
+        )
+
+        # Step 4: Synthesis Pathway Optimization
+        note("      Step 4: Synthesis pathway optimization...")
+        traditional_knowledge = {
+            'extraction_method': plant.traditional_preparations[0]['method'],
+            'cultural_context': plant.cultural_contexts[0]
+        }
+        synthesis_pathways = simulator.optimize_synthesis_pathway(
+            compound_smiles, traditional_knowledge
+        )
+
+        # Step 5: Traditional ADMET Prediction
+        note("      Step 5: Traditional ADMET prediction...")
+        timing_factors = {
+            'fasting_state': True,
+            'optimal_circadian': True,
+            'lunar_phase': cultural_vars.lunar_phase
+        }
+
+        # Find optimal preparation
+        optimization = self.admet_predictor.optimize_traditional_preparation(
+            compound_smiles, target_bioavail=75.0, safety_threshold=0.95
+        )
+
+        # Step 6: EquiPath Compensation (if enabled); contributions are built per plant
+        if self.enable_equipath:
+            note("      Step 6: EquiPath compensation processing...")
+
+        # Step 7: Compile Results
+        note("      Step 7: Compiling optimization results...")
+
+        result = OptimizationResults(
+            compound_name=compound_name,
+            optimized_smiles=compound_smiles,
+            cultural_qsar_score=qsar_results['bioactivity_prediction'],
+            binding_affinity=best_binding,
+            traditional_admet_profile=optimization['predicted_admet'],
+            synthesis_pathways=synthesis_pathways,
+            preparation_recommendation={
+                'optimal_solvent': best_solvent,
+                'enhancers': optimization['enhancers'],
+                'timing': optimization['timing'],
+                'route': 'oral_traditional',
+                'synthesis_pathway': synthesis_pathways['recommended_pathway'].pathway_type
+            },
+            bioavailability_improvement=optimization['predicted_admet']['bioavailability_improvement_fold'],
+            safety_enhancement=optimization['predicted_admet']['traditional_safety_enhancement'],
+            development_confidence=min(plant.bioactivity_confidence * optimization['optimization_score'], 1.0)
+        )
+
+        note("      ✅ %s optimization complete" % compound_name)
+        note("         QSAR Score: %.2f pIC50" % qsar_results['bioactivity_prediction'])
+        note("         Binding Affinity: %.2f pKd" % best_binding)
+        note("         Bioavailability: %.1f%%" % optimization['predicted_admet']['bioavailability_percent'])
+        note("         Enhancement: %.1fx" % optimization['predicted_admet']['bioavailability_improvement_fold'])
+        note("         Cultural Preservation: %.2f" % qsar_results['bias_mitigation']['cultural_preservation_score'])
+
+        return compound_name, result, ("\n".join(status) if buffer_status else None)
 
-    def _extract_cultural_variables(self, plant: TraditionalPlant, compound_data: Dict) -> Dict:
+    def _extract_cultural_variables(self, plant: TraditionalPlant) -> Dict:
         """Extract cultural variables for QSAR analysis."""
         from cultural_qsar_engine import CulturalVariables
         return CulturalVariables(
@@ -387,21 +588,8 @@ class ChemPathIntegratedPipeline:
         )
 
     def _extract_molecular_descriptors(self, smiles: str):
-        """Extract molecular descriptors from SMILES."""
-        from cultural_qsar_engine import MolecularDescriptors
-        # Simulate molecular descriptor calculation
-        mol_hash = hash(smiles) % 1000
-        np.random.seed(mol_hash)
-
-        return MolecularDescriptors(
-            mol_weight=np.random.uniform(200, 500),
-            log_p=np.random.uniform(1.0, 4.0),
-            tpsa=np.random.uniform(40, 120),
-            hbd=np.random.randint(1, 6),
-            hba=np.random.randint(2, 8),
-            rotatable_bonds=np.random.randint(2, 10),
-            aromatic_rings=np.random.randint(1, 3)
-        )
+        """Extract molecular descriptors from SMILES (shared, read-only instance)."""
+        return _descriptors_cached(canonical_smiles(smiles))
 
     def generate_development_report(self, results: Dict[str, OptimizationResults]) -> str:
         """
@@ -413,126 +601,199 @@ class ChemPathIntegratedPipeline:
         Returns:
             Formatted development report
         """
-        report = StringIO()
+        parts = []
+        metrics = self.performance_metrics
 
         # Header
-        report.write("📊 CHEMPATH ENHANCED PIPELINE DEVELOPMENT REPORT v5.1\n")
-        report.write("=" * 70 + "\n\n")
+        parts.append("📊 CHEMPATH ENHANCED PIPELINE DEVELOPMENT REPORT v5.1\n")
+        parts.append("=" * 70 + "\n\n")
 
         # Performance Metrics
-        report.write("⚡ PERFORMANCE METRICS\n")
-        report.write("-" * 25 + "\n")
-        report.write(f"Deployment Mode: {self.deployment_mode.upper()}\n")
-        report.write(f"Processing Capacity: {self.performance_metrics['capacity']:,} optimizations/hour\n")
-        report.write(f"Accuracy Enhancement: {self.performance_metrics['accuracy_improvement']}\n")
-        report.write(f"Speed Improvement: {self.performance_metrics['speed_improvement']}\n")
-        report.write(f"Deployment Flexibility: {self.performance_metrics['deployment_flexibility']}\n\n")
-
-        # Executive Summary
-        avg_bioavail_improvement = np.mean([r.bioavailability_improvement for r in results.values()])
-        avg_safety_enhancement = np.mean([r.safety_enhancement for r in results.values()])
-        avg_confidence = np.mean([r.development_confidence for r in results.values()])
-        best_compound = max(results.values(), key=lambda x: x.development_confidence)
-
-        report.write("🎯 EXECUTIVE SUMMARY\n")
-        report.write("-" * 20 + "\n")
-        report.write(f"Compounds Analyzed: {len(results)}\n")
-        report.write(f"Average Bioavailability Improvement: {avg_bioavail_improvement:.1f}x\n")
-        report.write(f"Average Safety Enhancement: {avg_safety_enhancement:.2f}\n")
-        report.write(f"Average Development Confidence: {avg_confidence:.1%}\n")
-        report.write(f"Lead Compound: {best_compound.compound_name}\n")
-        report.write(f"Lead Compound Confidence: {best_compound.development_confidence:.1%}\n\n")
+        parts.append("⚡ PERFORMANCE METRICS\n")
+        parts.append("-" * 25 + "\n")
+        parts.append(f"Deployment Mode: {self.deployment_mode.upper()}\n")
+        parts.append(f"Processing Capacity: {metrics['capacity']:,} optimizations/hour\n")
+        parts.append(f"Accuracy Enhancement: {metrics['accuracy_improvement']}\n")
+        parts.append(f"Speed Improvement: {metrics['speed_improvement']}\n")
+        parts.append(f"Deployment Flexibility: {metrics['deployment_flexibility']}\n\n")
+
+        # Executive Summary: one (compounds x 3) pass for all summary statistics
+        compounds = list(results.values())
+        if not compounds:
+            parts.append("🎯 EXECUTIVE SUMMARY\n")
+            parts.append("-" * 20 + "\n")
+            parts.append("Compounds Analyzed: 0\n")
+            parts.append("No compounds analyzed; nothing further to report.\n")
+            return "".join(parts)
+
+        summary = np.fromiter(
+            ((r.bioavailability_improvement, r.safety_enhancement, r.development_confidence) for r in compounds),
+            dtype=np.dtype((np.float64, 3)),
+            count=len(compounds)
+        )
+        avg_bioavail_improvement, avg_safety_enhancement, avg_confidence = summary.mean(axis=0)
+        max_bioavail_improvement = summary[:, 0].max()
+        best_compound = compounds[int(summary[:, 2].argmax())]
+
+        parts.append("🎯 EXECUTIVE SUMMARY\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(f"Compounds Analyzed: {len(results)}\n")
+        parts.append(f"Average Bioavailability Improvement: {avg_bioavail_improvement:.1f}x\n")
+        parts.append(f"Average Safety Enhancement: {avg_safety_enhancement:.2f}\n")
+        parts.append(f"Average Development Confidence: {avg_confidence:.1%}\n")
+        parts.append(f"Lead Compound: {best_compound.compound_name}\n")
+        parts.append(f"Lead Compound Confidence: {best_compound.development_confidence:.1%}\n\n")
 
         # Detailed Results
-        report.write("🔬 DETAILED COMPOUND ANALYSIS\n")
-        report.write("-" * 30 + "\n\n")
-
-        for compound_name, result in results.items():
-            report.write(f"Compound: {compound_name}\n")
-            report.write(f"  Cultural QSAR Score: {result.cultural_qsar_score:.2f} pIC50\n")
-            report.write(f"  Binding Affinity: {result.binding_affinity:.2f} pKd\n")
-            report.write(f"  Bioavailability: {result.traditional_admet_profile['bioavailability_percent']:.1f}%\n")
-            report.write(f"  Bioavailability Improvement: {result.bioavailability_improvement:.1f}x\n")
-            report.write(f"  Safety Enhancement: {result.safety_enhancement:.2f}\n")
-            report.write(f"  Development Confidence: {result.development_confidence:.1%}\n")
-
-            # Synthesis Pathway Info
-            rec_pathway = result.synthesis_pathways['recommended_pathway']
-            report.write(f"  Recommended Synthesis: {rec_pathway.pathway_type.upper()}\n")
-            report.write(f"    Yield: {rec_pathway.yield_estimate:.1%}\n")
-            report.write(f"    Sustainability: {rec_pathway.sustainability_score:.2f}\n")
-            report.write(f"    Cultural Preservation: {rec_pathway.cultural_preservation_score:.2f}\n")
-
-            # Preparation Recommendation
-            prep = result.preparation_recommendation
-            report.write(f"  Optimal Preparation:\n")
-            report.write(f"    Solvent: {prep['optimal_solvent']}\n")
-            report.write(f"    Enhancers: {', '.join(prep['enhancers'])}\n")
-            report.write(f"    Timing: {'Fasting + Optimal Circadian' if prep['timing']['fasting_state'] else 'Normal'}\n")
-            report.write(f"    Route: {prep['route']}\n")
-
-            # EquiPath Compensation
-            if result.equipath_compensation:
-                comp = result.equipath_compensation
-                report.write(f"  EquiPath Compensation:\n")
-                report.write(f"    Record ID: {comp['record_id']}\n")
-                report.write(f"    Amount: ${comp['compensation_amount']:,.2f}\n")
-                report.write(f"    Cultural Preservation: {comp['cultural_preservation_score']:.2f}\n")
-                report.write(f"    Verified: {'✅' if comp['verified'] else '❌'}\n")
-
-            report.write("\n")
+        parts.append("🔬 DETAILED COMPOUND ANALYSIS\n")
+        parts.append("-" * 30 + "\n\n")
+
+        # One row per compound; the tables are formatted in a single call each
+        analysis = pd.DataFrame({
+            'Compound': [r.compound_name for r in compounds],
+            'QSAR (pIC50)': [r.cultural_qsar_score for r in compounds],
+            'Binding (pKd)': [r.binding_affinity for r in compounds],
+            'Bioavail.': [r.traditional_admet_profile['bioavailability_percent'] for r in compounds],
+            'Improvement': summary[:, 0],
+            'Safety': summary[:, 1],
+            'Confidence': summary[:, 2]
+        })
+        parts.append(analysis.to_string(index=False, formatters={
+            'QSAR (pIC50)': '{:.2f}'.format,
+            'Binding (pKd)': '{:.2f}'.format,
+            'Bioavail.': '{:.1f}%'.format,
+            'Improvement': '{:.1f}x'.format,
+            'Safety': '{:.2f}'.format,
+            'Confidence': '{:.1%}'.format
+        }) + "\n\n")
+
+        # Synthesis Pathway and Preparation Recommendation
+        parts.append("🧪 SYNTHESIS & PREPARATION\n")
+        parts.append("-" * 27 + "\n\n")
+        pathways = [r.synthesis_pathways['recommended_pathway'] for r in compounds]
+        preparations = [r.preparation_recommendation for r in compounds]
+        preparation = pd.DataFrame({
+            'Compound': [r.compound_name for r in compounds],
+            'Synthesis': [pathway.pathway_type.upper() for pathway in pathways],
+            'Yield': [pathway.yield_estimate for pathway in pathways],
+            'Sustainability': [pathway.sustainability_score for pathway in pathways],
+            'Preservation': [pathway.cultural_preservation_score for pathway in pathways],
+            'Solvent': [prep['optimal_solvent'] for prep in preparations],
+            'Enhancers': [', '.join(prep['enhancers']) for prep in preparations],
+            'Timing': ['Fasting + Optimal Circadian' if prep['timing']['fasting_state'] else 'Normal'
+                       for prep in preparations],
+            'Route': [prep['route'] for prep in preparations]
+        })
+        parts.append(preparation.to_string(index=False, formatters={
+            'Yield': '{:.1%}'.format,
+            'Sustainability': '{:.2f}'.format,
+            'Preservation': '{:.2f}'.format
+        }) + "\n\n")
+
+        # EquiPath Compensation
+        compensated = [r for r in compounds if r.equipath_compensation]
+        if compensated:
+            parts.append("🔒 EQUIPATH COMPENSATION\n")
+            parts.append("-" * 25 + "\n\n")
+            compensation = pd.DataFrame({
+                'Compound': [r.compound_name for r in compensated],
+                'Record ID': [r.equipath_compensation['record_id'] for r in compensated],
+                'Amount': [r.equipath_compensation['compensation_amount'] for r in compensated],
+                'Preservation': [r.equipath_compensation['cultural_preservation_score'] for r in compensated],
+                'Verified': ['✅' if r.equipath_compensation['verified'] else '❌' for r in compensated]
+            })
+            parts.append(compensation.to_string(index=False, formatters={
+                'Amount': '${:,.2f}'.format,
+                'Preservation': '{:.2f}'.format
+            }) + "\n\n")
 
         # Investment Highlights
-        report.write("💰 INVESTMENT HIGHLIGHTS\n")
-        report.write("-" * 25 + "\n")
-        report.write(f"• {len(results)} validated compounds with traditional enhancement\n")
-        report.write(f"• Up to {max(r.bioavailability_improvement for r in results.values()):.0f}x bioavailability improvement\n")
-        report.write(f"• {avg_safety_enhancement:.1%} average safety enhancement through traditional methods\n")
-        report.write(f"• {avg_confidence:.1%} average development confidence with genomic validation\n")
-        report.write(f"• {self.performance_metrics['accuracy_improvement']} accuracy enhancement over conventional platforms\n")
-        report.write(f"• {self.performance_metrics['speed_improvement']} processing speed improvement\n")
-        report.write(f"• Complete traditional-to-modern optimization pipeline demonstrated\n")
-        report.write(f"• Regulatory pathway supported by mechanistic evidence\n")
+        parts.append("💰 INVESTMENT HIGHLIGHTS\n")
+        parts.append("-" * 25 + "\n")
+        parts.append(f"• {len(results)} validated compounds with traditional enhancement\n")
+        parts.append(f"• Up to {max_bioavail_improvement:.0f}x bioavailability improvement\n")
+        parts.append(f"• {avg_safety_enhancement:.1%} average safety enhancement through traditional methods\n")
+        parts.append(f"• {avg_confidence:.1%} average development confidence with genomic validation\n")
+        parts.append(f"• {metrics['accuracy_improvement']} accuracy enhancement over conventional platforms\n")
+        parts.append(f"• {metrics['speed_improvement']} processing speed improvement\n")
+        parts.append("• Complete traditional-to-modern optimization pipeline demonstrated\n")
+        parts.append("• Regulatory pathway supported by mechanistic evidence\n")
         if self.enable_equipath:
-            report.write(f"• EquiPath compensation framework: Privacy-preserving benefit-sharing ✅\n")
-        report.write(f"• Cultural knowledge attribution with ≥30% representation weight ✅\n\n")
+            parts.append("• EquiPath compensation framework: Privacy-preserving benefit-sharing ✅\n")
+        parts.append("• Cultural knowledge attribution with ≥30% representation weight ✅\n\n")
 
         # Next Steps
-        report.write("🚀 RECOMMENDED NEXT STEPS\n")
-        report.write("-" * 26 + "\n")
-        report.write(f"1. Advance {best_compound.compound_name} to experimental validation studies\n")
-        report.write(f"2. Synthesize optimal traditional preparations for preclinical testing\n")
-        report.write(f"3. Validate molecular modeling predictions with experimental binding assays\n")
-        report.write(f"4. Conduct clinical pharmacokinetic studies with traditional preparations\n")
-        report.write(f"5. File provisional patents with traditional knowledge attribution\n")
-        report.write(f"6. Engage traditional knowledge communities for benefit-sharing agreements\n")
-        report.write(f"7. Scale deployment from standalone to bundle/ecosystem configurations\n")
+        parts.append("🚀 RECOMMENDED NEXT STEPS\n")
+        parts.append("-" * 26 + "\n")
+        parts.append(f"1. Advance {best_compound.compound_name} to experimental validation studies\n")
+        parts.append("2. Synthesize optimal traditional preparations for preclinical testing\n")
+        parts.append("3. Validate molecular modeling predictions with experimental binding assays\n")
+        parts.append("4. Conduct clinical pharmacokinetic studies with traditional preparations\n")
+        parts.append("5. File provisional patents with traditional knowledge attribution\n")
+        parts.append("6. Engage traditional knowledge communities for benefit-sharing agreements\n")
+        parts.append("7. Scale deployment from standalone to bundle/ecosystem configurations\n")
 
-        return report.getvalue()
+        return "".join(parts)
 
 
-def simulate_complete_chempath_pipeline():
-    """
-    Complete ChemPath simulation for research validation.
+class _BufferedStreamHandler(logging.StreamHandler):
+    """Stream handler that leaves flushing to the stream's own buffer instead of flushing every record."""
 
-    Simulates the full traditional-to-modern drug discovery pipeline using
-    Ashwagandha as a case study.
-    """
-    print("🌟 CHEMPATH COMPLETE INTEGRATION SIMULATION v5.1")
-    print("=" * 60)
-    print("Case Study: Ashwagandha (Withania somnifera) - Traditional Adaptogen")
-    print("Traditional Use: Stress, anxiety, sleep, cognitive enhancement")
-    print("Modern Target: Cortisol regulation, GABA-A receptor modulation")
-    print("")
+    def flush(self):
+        pass
 
-    # Initialize integrated pipeline
-    pipeline = ChemPathIntegratedPipeline(
-        deployment_mode="standalone",
-        enable_equipath=True
-    )
 
-    # Define Ashwagandha plant profile (from EthnoPath integration)
-    ashwagandha = TraditionalPlant(
+# Per-process pipeline used by process pool workers
+_worker_pipeline: Optional[ChemPathIntegratedPipeline] = None
+
+
+def _init_compound_worker(deployment_mode: str, enable_equipath: bool):
+    """Build the worker process's own serial pipeline, with its INFO logging silenced."""
+    global _worker_pipeline
+    logging.disable(logging.INFO)
+    _worker_pipeline = ChemPathIntegratedPipeline(deployment_mode=deployment_mode, enable_equipath=enable_equipath)
+
+
+def _process_compound_in_worker(plant: TraditionalPlant, i: int, compound_name: str, compound_smiles: str,
+                                affinities: np.ndarray,
+                                calc_params) -> Tuple[str, OptimizationResults, str]:
+    """Process one compound in a pool worker; its status log is returned for the parent to emit."""
+    return _worker_pipeline._process_one_compound(plant, i, compound_name, compound_smiles,
+                                                  affinities, calc_params, buffer_status=True)
+
+
+# Static demo banners, each written to stdout in a single call
+_SIMULATION_BANNER = f"""\
+🌟 CHEMPATH COMPLETE INTEGRATION SIMULATION v5.1
+{'=' * 60}
+"""
+
+# Written after the banner only when running the default Ashwagandha case study
+_ASHWAGANDHA_CASE_STUDY = """\
+Case Study: Ashwagandha (Withania somnifera) - Traditional Adaptogen
+Traditional Use: Stress, anxiety, sleep, cognitive enhancement
+Modern Target: Cortisol regulation, GABA-A receptor modulation
+"""
+
+_START_BANNER = """\
+🚀 Starting ChemPath Complete Integration Simulation v5.1
+   Perfect for research validation and scientific analysis
+
+"""
+
+_COMPLETE_BANNER = """
+✅ ChemPath Integration Simulation Complete!
+   Ready for research validation and analysis
+   All modules integrated and validated
+   Traditional-to-modern pipeline simulated
+   54.3% speed improvement | 42.8% accuracy enhancement
+   Cloak and Quill Research 501(c)(3) Mission Accomplished
+"""
+
+
+def ashwagandha_plant() -> TraditionalPlant:
+    """Ashwagandha plant profile (from EthnoPath integration) used as the demo case study."""
+    return TraditionalPlant(
         scientific_name="Withania somnifera",
         common_names=["Ashwagandha", "Indian Winter Cherry", "Poison Gooseberry"],
         traditional_uses=[
@@ -595,75 +856,168 @@ def simulate_complete_chempath_pipeline():
         bioactivity_confidence=0.92  # High confidence from GenomePath genomic validation
     )
 
-    # Process through complete ChemPath pipeline
-    print("\n🔄 Running Complete ChemPath Pipeline...")
-    optimization_results = pipeline.process_traditional_plant(ashwagandha)
-
-    # Generate comprehensive development report
-    print("\n📋 Generating Development Report...")
-    development_report = pipeline.generate_development_report(optimization_results)
-
-    # Display results
-    print("\n" + "="*70)
-    print(development_report)
-
-    # Investment Summary
-    print("💎 INVESTMENT SUMMARY FOR CHEMPATH v5.1")
-    print("=" * 40)
-
-    best_result = max(optimization_results.values(), key=lambda x: x.development_confidence)
-    total_improvement = sum(r.bioavailability_improvement for r in optimization_results.values())
-
-    print(f"🎯 Lead Compound: {best_result.compound_name}")
-    print(f"   Development Confidence: {best_result.development_confidence:.1%}")
-    print(f"   Bioavailability Improvement: {best_result.bioavailability_improvement:.1f}x")
-    print(f"   Cultural QSAR Score: {best_result.cultural_qsar_score:.2f} pIC50")
-    print(f"   Binding Affinity: {best_result.binding_affinity:.2f} pKd")
-    print(f"   Traditional Safety: {best_result.safety_enhancement:.2f}")
-
-    print(f"\n📈 Portfolio Metrics:")
-    print(f"   Total Compounds Optimized: {len(optimization_results)}")
-    print(f"   Combined Bioavailability Improvement: {total_improvement:.1f}x")
-    print(f"   Traditional Knowledge Integration: ✅ Complete")
-    print(f"   Regulatory Pathway: ✅ FDA Traditional Knowledge Route")
-    print(f"   IP Protection: ✅ Modular + Traditional Attribution")
-    print(f"   Community Benefit-Sharing: ✅ EquiPath Integrated")
-
-    print(f"\n🚀 Competitive Advantages:")
-    print(f"   • 54.3% processing speed improvement over conventional platforms")
-    print(f"   • 42.8% accuracy enhancement through cultural-aware AI")
-    print(f"   • Modular deployment: standalone, bundle, ecosystem (94% flexibility)")
-    print(f"   • Only platform integrating 5,000+ years traditional wisdom")
-    print(f"   • Classical molecular modeling with cultural context (proprietary)")
-    print(f"   • AI-driven synthesis pathway optimization (traditional/synthetic/hybrid)")
-    print(f"   • EquiPath privacy-preserving compensation (blockchain-ready)")
-    print(f"   • Bias mitigation: ≥30% traditional knowledge representation")
-    print(f"   • 20x+ bioavailability improvements demonstrated")
-    print(f"   • Complete regulatory compliance framework")
-
-    print(f"\n💰 Funding Targets:")
-    print(f"   • Foundation Grants: $2-5M for validation and partnerships")
-    print(f"   • Standalone Deployments: $25K-75K per optimization project")
-    print(f"   • Bundle Integrations: $300K-1.2M per pharmaceutical suite")
-    print(f"   • Use of Funds: 60% R&D, 25% Community Partnerships, 15% Operations")
-    print(f"   • Timeline to Validation: 18-24 months")
-    print(f"   • Market Opportunity: $41.7B expanded TAM")
-
-    return pipeline, optimization_results, development_report
 
+@lru_cache(maxsize=None)
+def _investment_summary_template() -> str:
+    """Investment summary %-format template, read once per process."""
+    return (Path(__file__).parent / "templates" / "investment_summary.txt").read_text(encoding="utf-8")
+
+
+def _simulation_cache_path(cache_dir: str, pipeline: ChemPathIntegratedPipeline, plant: TraditionalPlant) -> str:
+    """Cache file for a plant's results, keyed by the plant profile and pipeline configuration."""
+    payload = orjson.dumps(
+        {
+            'version': SIMULATION_CACHE_VERSION,
+            'deployment_mode': pipeline.deployment_mode,
+            'enable_equipath': pipeline.enable_equipath,
+            'plant': asdict(plant)
+        },
+        option=orjson.OPT_SORT_KEYS, default=str
+    )
+    return os.path.join(cache_dir, hashlib.blake2b(payload, digest_size=16).hexdigest() + ".pkl")
+
+
+def _load_simulation_cache(path: str) -> Optional[Tuple[Dict[str, OptimizationResults], str]]:
+    """Cached (results, report) for a plant, or None if absent or unreadable (unreadable files are removed)."""
+    try:
+        with open(path, 'rb') as cached:
+            return pickle.load(cached)
+    except FileNotFoundError:
+        return None
+    except Exception as exc:
+        # Stale or corrupt pickles fail in many ways (renamed modules, newer protocols,
+        # changed dataclass state); any of them just means the plant is run again
+        logger.warning("⚠️  Discarding unreadable simulation cache %s: %r", path, exc)
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        return None
+
+
+def _store_simulation_cache(path: str, results: Dict[str, OptimizationResults], report: str):
+    """Atomically write a plant's (results, report) to the cache."""
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'wb') as cached:
+        pickle.dump((results, report), cached, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+
+
+def simulate_complete_chempath_pipeline(plants: Optional[List[TraditionalPlant]] = None,
+                                        cache_dir: Optional[str] = None):
+    """
+    Complete ChemPath simulation for research validation.
+
+    Simulates the full traditional-to-modern drug discovery pipeline for a
+    batch of plants sharing one pipeline, using Ashwagandha as the default
+    case study.
+
+    Plants served from cache_dir are recorded in the pipeline history as
+    cached runs; their results, including EquiPath record IDs and
+    compensation amounts, are replayed from the run that populated the cache.
+
+    Args:
+        plants: Traditional plant profiles to process (None = Ashwagandha only)
+        cache_dir: Directory of per-plant results cached across runs (None = always run the pipeline)
+
+    Returns:
+        Pipeline, and optimization results and development reports keyed by plant scientific name
+
+    Raises:
+        ValueError: If two plants share a scientific name
+    """
+    case_study = _ASHWAGANDHA_CASE_STUDY if plants is None else ""
+    if plants is None:
+        plants = [ashwagandha_plant()]
+
+    # Results and reports are keyed by scientific name, so names must be unique
+    names = [plant.scientific_name for plant in plants]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(f"Duplicate plant scientific names: {', '.join(duplicates)}")
+
+    sys.stdout.write(_SIMULATION_BANNER + case_study + "\n")
+
+    # Initialize integrated pipeline
+    pipeline = ChemPathIntegratedPipeline(
+        deployment_mode="standalone",
+        enable_equipath=True
+    )
+
+    # Process every plant through the same ChemPath pipeline
+    optimization_results = {}
+    development_reports = {}
+    for plant in plants:
+        name = plant.scientific_name
+        cache_path = _simulation_cache_path(cache_dir, pipeline, plant) if cache_dir else None
+        cached = _load_simulation_cache(cache_path) if cache_path else None
+        if cached is not None:
+            print(f"\n♻️  Using cached ChemPath results for {name}")
+            plant_results, report = cached
+            pipeline.record_run(plant, plant_results, cached=True)
+        else:
+            print("\n🔄 Running Complete ChemPath Pipeline...")
+            plant_results = pipeline.process_traditional_plant(plant)
+
+            # Generate comprehensive development report
+            print("\n📋 Generating Development Report...")
+            report = pipeline.generate_development_report(plant_results)
+            if cache_path:
+                _store_simulation_cache(cache_path, plant_results, report)
+        optimization_results[name] = plant_results
+        development_reports[name] = report
+
+        # Display results
+        print("\n" + "="*70)
+        print(report)
+
+    # Investment Summary (needs at least one optimized compound)
+    portfolio = [result for plant_results in optimization_results.values() for result in plant_results.values()]
+    if not portfolio:
+        print("\n⚠️  No compounds optimized; skipping investment summary")
+        return pipeline, optimization_results, development_reports
+
+    best_result = max(portfolio, key=lambda x: x.development_confidence)
+    total_improvement = sum(r.bioavailability_improvement for r in portfolio)
+
+    sys.stdout.write(_investment_summary_template() % {
+        'compound_name': best_result.compound_name,
+        'development_confidence_percent': best_result.development_confidence * 100,
+        'bioavailability_improvement': best_result.bioavailability_improvement,
+        'cultural_qsar_score': best_result.cultural_qsar_score,
+        'binding_affinity': best_result.binding_affinity,
+        'safety_enhancement': best_result.safety_enhancement,
+        'plants_processed': len(optimization_results),
+        'compounds_optimized': len(portfolio),
+        'total_improvement': total_improvement
+    })
+
+    return pipeline, optimization_results, development_reports
+
+
+def main():
+    """Command-line entry point: run the demo simulation with buffered console output."""
+    # Block-buffer the demo's stdout; it is flushed in bulk and once more at exit
+    sys.stdout.flush()
+    sys.stdout = io.TextIOWrapper(
+        open(sys.stdout.fileno(), 'wb', buffering=STDOUT_BUFFER_SIZE, closefd=False),
+        encoding=sys.stdout.encoding, errors=sys.stdout.errors
+    )
+    atexit.register(sys.stdout.flush)
+
+    logging.basicConfig(level=logging.INFO, format="%(message)s", handlers=[_BufferedStreamHandler(sys.stdout)])
 
-if __name__ == "__main__":
     # Run complete simulation
-    print("🚀 Starting ChemPath Complete Integration Simulation v5.1")
-    print("   Perfect for research validation and scientific analysis")
-    print("")
+    sys.stdout.write(_START_BANNER)
 
     # Main simulation
-    pipeline, results, report = simulate_complete_chempath_pipeline()
-
-    print(f"\n✅ ChemPath Integration Simulation Complete!")
-    print(f"   Ready for research validation and analysis")
-    print(f"   All modules integrated and validated")
-    print(f"   Traditional-to-modern pipeline simulated")
-    print(f"   54.3% speed improvement | 42.8% accuracy enhancement")
-    print(f"   Cloak and Quill Research 501(c)(3) Mission Accomplished")
+    simulate_complete_chempath_pipeline(
+        cache_dir=os.environ.get("CHEMPATH_CACHE_DIR")
+    )
+
+    sys.stdout.write(_COMPLETE_BANNER)
+
+
+if __name__ == "__main__":
+    main()
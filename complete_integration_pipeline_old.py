@@ -21,25 +21,123 @@ License: MIT - For Fundraising Demonstration
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, List, Tuple, Optional, Union, Any
+from typing import Dict, List, NamedTuple, Tuple, Optional, Union, Any
+from collections import deque
 from dataclasses import dataclass, asdict
 from datetime import datetime
+from functools import lru_cache, partial
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 import json
-from io import StringIO
-import matplotlib.pyplot as plt
-import matplotlib.patches as mpatches
-from matplotlib.gridspec import GridSpec
+import math
+import os
+import zlib
 
-try:
-    import seaborn as sns
-    SEABORN_AVAILABLE = True
-except ImportError:
-    SEABORN_AVAILABLE = False
-    print("⚠️  Seaborn not available, using matplotlib only")
 
+# Upper bound on memoized SMILES-derived results
+DESCRIPTOR_CACHE_SIZE = 4096
 
-@dataclass
+# Plant runs kept in memory; older runs are overwritten in arrival order
+PIPELINE_HISTORY_SIZE = 1024
+
+# Per-run numeric statistics, one fixed-size record per processed plant
+PLANT_STATS_DTYPE = np.dtype([('timestamp', 'datetime64[us]'), ('compounds_processed', 'i4')])
+
+
+def _molecule_seed(smiles: str) -> int:
+    """Stable simulation seed for a molecule; unlike hash(), independent of PYTHONHASHSEED."""
+    return zlib.crc32(smiles.encode('utf-8')) % 1000
+
+
+# Simulated descriptor columns and their [low, high) ranges; the last three are integer counts
+DESCRIPTOR_NAMES = ('mol_weight', 'log_p', 'tpsa', 'hbd', 'hba', 'rotatable_bonds')
+_DESCRIPTOR_LOW = np.array([200.0, 1.0, 40.0, 1.0, 2.0, 2.0])
+_DESCRIPTOR_HIGH = np.array([500.0, 4.0, 120.0, 6.0, 8.0, 10.0])
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def _descriptor_vector(smiles: str) -> np.ndarray:
+    """Simulated descriptor row (DESCRIPTOR_NAMES order) from one RNG draw, memoized per SMILES."""
+    row = np.random.default_rng(_molecule_seed(smiles)).uniform(_DESCRIPTOR_LOW, _DESCRIPTOR_HIGH)
+    row[3:] = np.floor(row[3:])
+    row.flags.writeable = False
+    return row
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def _molecular_descriptors(smiles: str) -> MappingProxyType:
+    """Simulated molecular descriptors, memoized per SMILES."""
+    row = _descriptor_vector(smiles).tolist()
+    return MappingProxyType({
+        name: (value if i < 3 else int(value))
+        for i, (name, value) in enumerate(zip(DESCRIPTOR_NAMES, row))
+    })
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def _quantum_noise(smiles: str) -> Tuple[float, float, float, float]:
+    """Simulated HOMO, LUMO, dipole and binding affinity noise, memoized per SMILES."""
+    rng = np.random.default_rng(_molecule_seed(smiles))
+    return tuple(rng.normal(0, [0.3, 0.2, 0.5, 0.5]).tolist())
+
+
+# Chart palettes shared by every visualization call
+_PALETTE_MAIN = ('#22c55e', '#3b82f6', '#8b5cf6')
+_PALETTE_WARM = ('#f59e0b', '#ef4444', '#10b981')
+_PALETTE_CYCLE = ('#22c55e', '#3b82f6', '#8b5cf6', '#f59e0b', '#ef4444')
+_PALETTE_SOLVENTS = ('#fbbf24', '#34d399', '#60a5fa')
+_PALETTE_METRICS = ('#ef4444', '#22c55e', '#3b82f6', '#f59e0b', '#8b5cf6')
+
+
+@lru_cache(maxsize=None)
+def _configure_plot_style() -> None:
+    """Apply the ChemPath matplotlib style once per process."""
+    import matplotlib.pyplot as plt
+    
+    try:
+        import seaborn as sns
+    except ImportError:
+        print("⚠️  Seaborn not available, using matplotlib only")
+        sns = None
+    
+    if sns is not None:
+        try:
+            plt.style.use('seaborn-v0_8')
+            sns.set_palette("husl")
+            return
+        except:
+            pass
+    plt.style.use('default')
+    plt.rcParams['axes.prop_cycle'] = plt.cycler(color=_PALETTE_CYCLE)
+
+
+def _annotate_bars(ax, bars, vals, fmt: str = '{:.1f}%', horizontal: bool = False) -> None:
+    """Write each bar's formatted value just past its end."""
+    labels = [fmt.format(val) for val in vals]
+    if horizontal:
+        for bar, label in zip(bars, labels):
+            ax.text(bar.get_width() + 2, bar.get_y() + bar.get_height()/2,
+                    label, ha='left', va='center', fontweight='bold')
+    else:
+        for bar, label in zip(bars, labels):
+            ax.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
+                    label, ha='center', va='bottom', fontweight='bold')
+
+
+@lru_cache(maxsize=DESCRIPTOR_CACHE_SIZE)
+def _plant_cultural_variables(bioactivity_confidence: float) -> MappingProxyType:
+    """Plant-level cultural variables for QSAR analysis, memoized per plant confidence."""
+    return MappingProxyType({
+        'lunar_phase': 0.75,  # Optimal harvest timing
+        'ritual_adherence': 0.9,  # High traditional compliance
+        'seasonal_offset': 0.8,  # Good seasonal timing
+        'historical_significance': bioactivity_confidence,
+        'geographic_authenticity': 0.85,  # Traditional growing region
+        'community_consensus': 0.9  # Strong traditional agreement
+    })
+
+
+@dataclass(slots=True, frozen=True)
 class TraditionalPlant:
     """
     Traditional medicinal plant profile from EthnoPath integration.
@@ -56,7 +154,7 @@ class TraditionalPlant:
     bioactivity_confidence: float  # 0-1, genomic validation from GenomePath
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class OptimizationResults:
     """
     Results from ChemPath optimization pipeline.
@@ -72,6 +170,32 @@ class OptimizationResults:
     development_confidence: float
 
 
+class QSARResult(NamedTuple):
+    """Cultural QSAR prediction and its weighted contributions (arrays from the batch predictor)."""
+    bioactivity_prediction: float  # pIC50
+    cultural_contribution: float
+    molecular_contribution: float
+    quantum_contribution: float
+
+
+class QuantumProperties(NamedTuple):
+    """Simulated quantum properties of a compound in a traditional solvent."""
+    homo_energy: float  # eV
+    lumo_energy: float  # eV
+    dipole_moment: float  # Debye
+    traditional_solvent_binding: float
+    solvation_free_energy: float
+    cultural_enhancement: float
+
+
+class DockingResult(NamedTuple):
+    """Simulated docking of a compound prepared in a traditional solvent."""
+    binding_affinity_pKd: float
+    traditional_enhancement: float
+    bioavailability_fold_improvement: float
+    cultural_potency: float
+
+
 class ChemPathIntegratedPipeline:
     """
     Complete ChemPath integration pipeline for traditional-to-modern drug discovery.
@@ -79,8 +203,14 @@ class ChemPathIntegratedPipeline:
     Demonstrates the full ecosystem capability for fundraising presentations.
     """
     
-    def __init__(self):
-        """Initialize the integrated ChemPath pipeline."""
+    def __init__(self, max_workers: Optional[int] = None, verbose: bool = False):
+        """
+        Initialize the integrated ChemPath pipeline.
+        
+        Args:
+            max_workers: Threads for per-compound processing (None = all CPUs)
+            verbose: Print plant and per-compound progress while processing
+        """
         print("🌿 Initializing ChemPath Integrated Pipeline")
         print("=" * 50)
         
@@ -94,9 +224,14 @@ class ChemPathIntegratedPipeline:
         print(f"   💊 Tradition-Aware ADMET Predictor... Loading")
         self.admet_predictor = self._initialize_admet_predictor()
         
-        # Integration tracking
-        self.pipeline_results = []
-        self.optimization_history = []
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.verbose = verbose
+        
+        # Integration tracking (bounded; per-compound results are returned, not retained)
+        self.pipeline_results = deque(maxlen=PIPELINE_HISTORY_SIZE)
+        self.optimization_history = deque(maxlen=PIPELINE_HISTORY_SIZE)
+        self._plant_stats = np.zeros(PIPELINE_HISTORY_SIZE, dtype=PLANT_STATS_DTYPE)
+        self._plant_stats_count = 0
         
         print(f"   ✅ ChemPath Integration Complete")
         print(f"   📊 Ready for traditional plant processing")
@@ -126,8 +261,8 @@ class ChemPathIntegratedPipeline:
                 )
                 
                 quantum_score = (
-                    abs(quantum_feat['homo_energy']) / 10.0 * 0.4 +
-                    abs(quantum_feat['traditional_solvent_binding']) / 15.0 * 0.6
+                    abs(quantum_feat.homo_energy) / 10.0 * 0.4 +
+                    abs(quantum_feat.traditional_solvent_binding) / 15.0 * 0.6
                 )
                 
                 final_prediction = (
@@ -136,12 +271,46 @@ class ChemPathIntegratedPipeline:
                     self.quantum_weight * quantum_score
                 )
                 
-                return {
-                    'bioactivity_prediction': min(final_prediction * 8.5, 9.2),  # pIC50 scale
-                    'cultural_contribution': cultural_score * self.cultural_weight,
-                    'molecular_contribution': molecular_score * self.molecular_weight,
-                    'quantum_contribution': quantum_score * self.quantum_weight
-                }
+                return QSARResult(
+                    bioactivity_prediction=min(final_prediction * 8.5, 9.2),  # pIC50 scale
+                    cultural_contribution=cultural_score * self.cultural_weight,
+                    molecular_contribution=molecular_score * self.molecular_weight,
+                    quantum_contribution=quantum_score * self.quantum_weight
+                )
+            
+            def predict_bioactivity_batch(self, cultural_vars, log_p, mol_weight, hbd,
+                                          homo_energy, solvent_binding):
+                # Same scoring as predict_bioactivity over per-compound arrays
+                cultural_score = (
+                    cultural_vars['lunar_phase'] * 0.2 +
+                    cultural_vars['ritual_adherence'] * 0.3 +
+                    cultural_vars['seasonal_offset'] * 0.2 +
+                    cultural_vars['historical_significance'] * 0.3
+                )
+                
+                molecular_score = (
+                    (log_p / 5.0) * 0.4 +
+                    (400 - mol_weight) / 400 * 0.3 +
+                    (hbd / 10.0) * 0.3
+                )
+                
+                quantum_score = (
+                    np.abs(homo_energy) / 10.0 * 0.4 +
+                    np.abs(solvent_binding) / 15.0 * 0.6
+                )
+                
+                final_prediction = (
+                    self.cultural_weight * cultural_score +
+                    self.molecular_weight * molecular_score +
+                    self.quantum_weight * quantum_score
+                )
+                
+                return QSARResult(
+                    bioactivity_prediction=np.minimum(final_prediction * 8.5, 9.2),  # pIC50 scale
+                    cultural_contribution=np.full_like(final_prediction, cultural_score * self.cultural_weight),
+                    molecular_contribution=molecular_score * self.molecular_weight,
+                    quantum_contribution=quantum_score * self.quantum_weight
+                )
         
         return SimplifiedCulturalQSAR()
     
@@ -155,33 +324,88 @@ class ChemPathIntegratedPipeline:
                     'coconut_oil': {'dielectric_constant': 2.8, 'cultural_potency': 1.6, 'bioavail_enhancement': 2.8},
                     'sesame_oil': {'dielectric_constant': 3.4, 'cultural_potency': 1.7, 'bioavail_enhancement': 2.5}
                 }
+                
+                # Column-wise solvent table for sweeping every solvent at once
+                self.solvent_names = np.array(list(self.traditional_solvents))
+                self.dielectric_constant = np.array([s['dielectric_constant'] for s in self.traditional_solvents.values()])
+                self.cultural_potency = np.array([s['cultural_potency'] for s in self.traditional_solvents.values()])
+                self.bioavail_enhancement = np.array([s['bioavail_enhancement'] for s in self.traditional_solvents.values()])
+                self.solvent_enhancement = 0.3 * np.log(self.cultural_potency)
+                self.solvent_index = {name: i for i, name in enumerate(self.traditional_solvents)}
+                # Affinity noise is per molecule, not per solvent, so every compound's best
+                # solvent is the one with the largest enhancement
+                self.best_solvent_index = int(np.argmax(self.solvent_enhancement))
             
             def calculate_quantum_properties(self, smiles, solvent_name):
                 # Simulate quantum chemistry calculation
-                mol_hash = hash(smiles) % 1000
-                np.random.seed(mol_hash)
+                homo_noise, lumo_noise, dipole_noise, _ = _quantum_noise(smiles.strip())
                 
-                solvent = self.traditional_solvents.get(solvent_name, self.traditional_solvents['ghee'])
+                potency = self.cultural_potency[self.solvent_index.get(solvent_name, self.solvent_index['ghee'])]
+                
+                return QuantumProperties(
+                    homo_energy=-5.2 + homo_noise,
+                    lumo_energy=-2.1 + lumo_noise,
+                    dipole_moment=3.8 + dipole_noise,
+                    traditional_solvent_binding=-8.3 - 1.2 * (potency - 1.0),
+                    solvation_free_energy=-25.0 * potency,
+                    cultural_enhancement=potency
+                )
+            
+            def dock_with_traditional_solvent(self, smiles, target_name, solvent_name, quantum_props):
+                i = self.solvent_index[solvent_name]
+                base_affinity = 7.2 + _quantum_noise(smiles.strip())[3]
+                enhancement = self.solvent_enhancement[i]
+                
+                return DockingResult(
+                    binding_affinity_pKd=base_affinity + enhancement,
+                    traditional_enhancement=enhancement,
+                    bioavailability_fold_improvement=self.bioavail_enhancement[i],
+                    cultural_potency=self.cultural_potency[i]
+                )
+            
+            def calculate_all_solvents_batch(self, smiles_list):
+                # Compound x solvent sweep; rows use the same per-molecule draws as calculate_all_solvents
+                noise = np.array([_quantum_noise(smiles.strip()) for smiles in smiles_list]).reshape(-1, 4)
                 
                 return {
-                    'homo_energy': -5.2 + np.random.normal(0, 0.3),
-                    'lumo_energy': -2.1 + np.random.normal(0, 0.2),
-                    'dipole_moment': 3.8 + np.random.normal(0, 0.5),
-                    'traditional_solvent_binding': -8.3 - 1.2 * (solvent['cultural_potency'] - 1.0),
-                    'solvation_free_energy': -25.0 * solvent['cultural_potency'],
-                    'cultural_enhancement': solvent['cultural_potency']
+                    'solvent': self.solvent_names,
+                    'homo_energy': -5.2 + noise[:, 0],
+                    'lumo_energy': -2.1 + noise[:, 1],
+                    'dipole_moment': 3.8 + noise[:, 2],
+                    'traditional_solvent_binding': -8.3 - 1.2 * (self.cultural_potency - 1.0),
+                    'binding_affinity_pKd': 7.2 + noise[:, 3:4] + self.solvent_enhancement
                 }
             
-            def dock_with_traditional_solvent(self, smiles, target_name, solvent_name, quantum_props):
-                solvent = self.traditional_solvents[solvent_name]
-                base_affinity = 7.2 + np.random.normal(0, 0.5)
-                enhancement = 0.3 * np.log(solvent['cultural_potency'])
+            def calculate_best_solvent_batch(self, smiles_list):
+                # Same columns as calculate_all_solvents_batch, evaluated only for the best solvent
+                noise = np.array([_quantum_noise(smiles.strip()) for smiles in smiles_list]).reshape(-1, 4)
+                i = self.best_solvent_index
+                
+                return {
+                    'solvent': self.solvent_names[i],
+                    'homo_energy': -5.2 + noise[:, 0],
+                    'lumo_energy': -2.1 + noise[:, 1],
+                    'dipole_moment': 3.8 + noise[:, 2],
+                    'traditional_solvent_binding': -8.3 - 1.2 * (self.cultural_potency[i] - 1.0),
+                    'binding_affinity_pKd': 7.2 + noise[:, 3] + self.solvent_enhancement[i]
+                }
+            
+            def calculate_all_solvents(self, smiles):
+                # Quantum properties and docking for every solvent in one pass,
+                # from the same per-molecule draws as the per-solvent calls
+                homo_noise, lumo_noise, dipole_noise, affinity_noise = _quantum_noise(smiles.strip())
                 
                 return {
-                    'binding_affinity_pKd': base_affinity + enhancement,
-                    'traditional_enhancement': enhancement,
-                    'bioavailability_fold_improvement': solvent['bioavail_enhancement'],
-                    'cultural_potency': solvent['cultural_potency']
+                    'solvent': self.solvent_names,
+                    'homo_energy': -5.2 + homo_noise,
+                    'lumo_energy': -2.1 + lumo_noise,
+                    'dipole_moment': 3.8 + dipole_noise,
+                    'traditional_solvent_binding': -8.3 - 1.2 * (self.cultural_potency - 1.0),
+                    'solvation_free_energy': -25.0 * self.cultural_potency,
+                    'cultural_enhancement': self.cultural_potency,
+                    'binding_affinity_pKd': 7.2 + affinity_noise + self.solvent_enhancement,
+                    'traditional_enhancement': self.solvent_enhancement,
+                    'bioavailability_fold_improvement': self.bioavail_enhancement
                 }
         
         return SimplifiedQuantumSimulator()
@@ -196,6 +420,13 @@ class ChemPathIntegratedPipeline:
                     'ghee': {'bioavail_mult': 4.8, 'safety': 0.99},
                     'honey': {'bioavail_mult': 2.1, 'safety': 0.97}
                 }
+                
+                # Column-wise enhancer table, indexed by enhancer name
+                self.enhancer_index = {name: i for i, name in enumerate(self.traditional_enhancers)}
+                self.enhancer_bioavail_mult = tuple(e['bioavail_mult'] for e in self.traditional_enhancers.values())
+                self.enhancer_safety = tuple(e['safety'] for e in self.traditional_enhancers.values())
+                # Multiplier of an enhancer stacked after the first one (diminishing returns)
+                self.enhancer_stacked_mult = tuple(1.0 + (mult - 1.0) * 0.7 for mult in self.enhancer_bioavail_mult)
             
             def predict_traditional_admet(self, smiles, enhancers, timing, route):
                 # Base ADMET properties
@@ -203,18 +434,15 @@ class ChemPathIntegratedPipeline:
                 base_half_life = 4.0
                 base_safety = 0.85
                 
-                # Calculate enhancer effects
-                total_bioavail_mult = 1.0
-                min_safety = 1.0
-                
-                for enhancer in enhancers:
-                    if enhancer in self.traditional_enhancers:
-                        enh = self.traditional_enhancers[enhancer]
-                        mult = enh['bioavail_mult']
-                        if total_bioavail_mult > 1.0:
-                            mult = 1.0 + (mult - 1.0) * 0.7  # Diminishing returns
-                        total_bioavail_mult *= mult
-                        min_safety = min(min_safety, enh['safety'])
+                # Calculate enhancer effects: first enhancer at full strength, the rest diminished
+                idx = [self.enhancer_index[e] for e in enhancers if e in self.enhancer_index]
+                if idx:
+                    total_bioavail_mult = math.prod([self.enhancer_bioavail_mult[idx[0]]]
+                                                    + [self.enhancer_stacked_mult[i] for i in idx[1:]])
+                    min_safety = min(1.0, *(self.enhancer_safety[i] for i in idx))
+                else:
+                    total_bioavail_mult = 1.0
+                    min_safety = 1.0
                 
                 # Timing effects
                 timing_bioavail_mult = 1.2 if timing.get('fasting_state') else 1.0
@@ -254,139 +482,198 @@ class ChemPathIntegratedPipeline:
         
         return SimplifiedADMETPredictor()
     
-    def process_traditional_plant(self, plant: TraditionalPlant) -> Dict[str, OptimizationResults]:
+    def process_traditional_plant(self, plant: TraditionalPlant,
+                                  fast_mode: bool = True) -> Dict[str, OptimizationResults]:
         """
         Process traditional plant through complete ChemPath pipeline.
         
         Args:
             plant: Traditional plant profile from EthnoPath
+            fast_mode: Evaluate only the best solvent instead of the full solvent sweep
             
         Returns:
             Dictionary of optimization results for each active compound
         """
-        print(f"\n🌱 Processing Traditional Plant: {plant.scientific_name}")
-        print(f"   Common names: {', '.join(plant.common_names)}")
-        print(f"   Traditional uses: {', '.join(plant.traditional_uses[:3])}...")
-        print(f"   Active compounds: {len(plant.active_compounds)}")
-        print(f"   Bioactivity confidence: {plant.bioactivity_confidence:.2f}")
+        if self.verbose:
+            self._log(f"\n🌱 Processing Traditional Plant: {plant.scientific_name}\n"
+                      f"   Common names: {', '.join(plant.common_names)}\n"
+                      f"   Traditional uses: {', '.join(plant.traditional_uses[:3])}...\n"
+                      f"   Active compounds: {len(plant.active_compounds)}\n"
+                      f"   Bioactivity confidence: {plant.bioactivity_confidence:.2f}")
         
         results = {}
         
-        for i, compound_data in enumerate(plant.active_compounds):
-            compound_name = compound_data['name']
-            compound_smiles = compound_data['smiles']
-            
-            print(f"\n   🧪 Processing compound {i+1}/{len(plant.active_compounds)}: {compound_name}")
-            
-            # Step 1: Cultural QSAR Analysis
-            print(f"      Step 1: Cultural QSAR optimization...")
-            cultural_vars = self._extract_cultural_variables(plant, compound_data)
-            mol_desc = self._extract_molecular_descriptors(compound_smiles)
-            
-            # Step 2: Quantum Chemistry with Traditional Solvents
-            print(f"      Step 2: Quantum binding simulation...")
-            quantum_results = {}
-            best_solvent = None
-            best_binding = 0.0
-            
-            for solvent in ['ghee', 'honey', 'coconut_oil', 'sesame_oil']:
-                quantum_props = self.quantum_simulator.calculate_quantum_properties(
-                    compound_smiles, solvent
-                )
-                
-                binding_results = self.quantum_simulator.dock_with_traditional_solvent(
-                    compound_smiles, "stress_target", solvent, quantum_props
-                )
-                
-                quantum_results[solvent] = {
-                    'quantum_props': quantum_props,
-                    'binding_results': binding_results
-                }
-                
-                if binding_results['binding_affinity_pKd'] > best_binding:
-                    best_binding = binding_results['binding_affinity_pKd']
-                    best_solvent = solvent
-            
-            # Step 3: Cultural QSAR Prediction
-            print(f"      Step 3: Cultural QSAR prediction...")
-            best_quantum_props = quantum_results[best_solvent]['quantum_props']
-            qsar_results = self.cultural_qsar.predict_bioactivity(
-                cultural_vars, mol_desc, best_quantum_props
-            )
-            
-            # Step 4: Traditional ADMET Prediction
-            print(f"      Step 4: Traditional ADMET prediction...")
-            timing_factors = {
-                'fasting_state': True,
-                'optimal_circadian': True,
-                'lunar_phase': cultural_vars['lunar_phase']
-            }
-            
-            # Find optimal preparation
-            optimization = self.admet_predictor.optimize_traditional_preparation(
-                compound_smiles, target_bioavail=75.0, safety_threshold=0.95
-            )
-            
-            # Step 5: Compile Results
-            print(f"      Step 5: Compiling optimization results...")
-            
-            results[compound_name] = OptimizationResults(
-                compound_name=compound_name,
-                optimized_smiles=compound_smiles,
-                cultural_qsar_score=qsar_results['bioactivity_prediction'],
-                quantum_binding_affinity=quantum_results[best_solvent]['binding_results']['binding_affinity_pKd'],
-                traditional_admet_profile=optimization['predicted_admet'],
-                preparation_recommendation={
-                    'optimal_solvent': best_solvent,
-                    'enhancers': optimization['enhancers'],
-                    'timing': optimization['timing'],
-                    'route': 'oral_traditional'
-                },
-                bioavailability_improvement=optimization['predicted_admet']['bioavailability_improvement_fold'],
-                safety_enhancement=optimization['predicted_admet']['traditional_safety_enhancement'],
-                development_confidence=min(plant.bioactivity_confidence * optimization['optimization_score'], 1.0)
-            )
-            
-            print(f"      ✅ {compound_name} optimization complete")
-            print(f"         QSAR Score: {qsar_results['bioactivity_prediction']:.2f} pIC50")
-            print(f"         Binding Affinity: {best_binding:.2f} pKd")
-            print(f"         Bioavailability: {optimization['predicted_admet']['bioavailability_percent']:.1f}%")
-            print(f"         Enhancement: {optimization['predicted_admet']['bioavailability_improvement_fold']:.1f}x")
+        # Quantum sweep and QSAR for every compound, then the per-compound steps;
+        # compounds are independent and progress summaries are printed in compound order
+        cultural_vars = self._extract_cultural_variables(plant)
+        batch = self._batch_process(plant, cultural_vars, fast_mode)
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, max(len(plant.active_compounds), 1))) as executor:
+            processed = list(executor.map(
+                partial(self._process_one_compound, plant, cultural_vars=cultural_vars, batch=batch),
+                range(len(plant.active_compounds)), plant.active_compounds
+            ))
+        
+        for compound_name, result, summary in processed:
+            if summary:
+                self._log(summary)
+            results[compound_name] = result
         
+        timestamp = datetime.now()
         self.pipeline_results.append({
             'plant': plant.scientific_name,
-            'timestamp': datetime.now(),
-            'compounds_processed': len(plant.active_compounds),
-            'results': results
+            'timestamp': timestamp,
+            'compounds_processed': len(plant.active_compounds)
         })
+        self._plant_stats[self._plant_stats_count % PIPELINE_HISTORY_SIZE] = (
+            np.datetime64(timestamp, 'us'), len(plant.active_compounds)
+        )
+        self._plant_stats_count += 1
         
         return results
     
-    def _extract_cultural_variables(self, plant: TraditionalPlant, compound_data: Dict) -> Dict:
-        """Extract cultural variables for QSAR analysis."""
+    def plant_statistics(self) -> np.ndarray:
+        """
+        Timestamps and compound counts of the retained plant runs.
+        
+        Returns:
+            Structured array (PLANT_STATS_DTYPE) of up to PIPELINE_HISTORY_SIZE runs, oldest first
+        """
+        if self._plant_stats_count <= PIPELINE_HISTORY_SIZE:
+            return self._plant_stats[:self._plant_stats_count].copy()
+        return np.roll(self._plant_stats, -(self._plant_stats_count % PIPELINE_HISTORY_SIZE))
+    
+    def _log(self, message: str) -> None:
+        """Print a progress message when the pipeline is verbose."""
+        if self.verbose:
+            print(message)
+    
+    def _batch_process(self, plant: TraditionalPlant, cultural_vars: Dict,
+                       fast_mode: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Run the quantum solvent sweep and Cultural QSAR for all compounds of a plant at once.
+        
+        Args:
+            plant: Traditional plant profile from EthnoPath
+            cultural_vars: Plant-level cultural variables
+            fast_mode: Evaluate only the best solvent; False runs the full sweep for validation
+            
+        Returns:
+            Per-compound arrays: best solvent, its binding affinity and the QSAR prediction
+        """
+        smiles_list = [compound['smiles'] for compound in plant.active_compounds]
+        if fast_mode:
+            best = self.quantum_simulator.calculate_best_solvent_batch(smiles_list)
+            best_solvent = np.full(len(smiles_list), best['solvent'])
+            best_binding = best['binding_affinity_pKd']
+            homo_energy = best['homo_energy']
+            solvent_binding = best['traditional_solvent_binding']
+        else:
+            sweep = self.quantum_simulator.calculate_all_solvents_batch(smiles_list)
+            best_idx = sweep['binding_affinity_pKd'].argmax(axis=1)
+            best_solvent = sweep['solvent'][best_idx]
+            best_binding = sweep['binding_affinity_pKd'][np.arange(len(smiles_list)), best_idx]
+            homo_energy = sweep['homo_energy']
+            solvent_binding = sweep['traditional_solvent_binding'][best_idx]
+        
+        # (N, 6) descriptor table in DESCRIPTOR_NAMES order
+        descriptors = self._extract_molecular_descriptors_batch(smiles_list)
+        
+        qsar = self.cultural_qsar.predict_bioactivity_batch(
+            cultural_vars,
+            descriptors[:, 1], descriptors[:, 0], descriptors[:, 3],
+            homo_energy, solvent_binding
+        )
+        
         return {
-            'lunar_phase': 0.75,  # Optimal harvest timing
-            'ritual_adherence': 0.9,  # High traditional compliance
-            'seasonal_offset': 0.8,  # Good seasonal timing
-            'historical_significance': plant.bioactivity_confidence,
-            'geographic_authenticity': 0.85,  # Traditional growing region
-            'community_consensus': 0.9  # Strong traditional agreement
+            'best_solvent': best_solvent,
+            'best_binding': best_binding,
+            'bioactivity_prediction': qsar.bioactivity_prediction
         }
     
-    def _extract_molecular_descriptors(self, smiles: str) -> Dict:
-        """Extract molecular descriptors from SMILES."""
-        # Simulate molecular descriptor calculation
-        mol_hash = hash(smiles) % 1000
-        np.random.seed(mol_hash)
+    def _process_one_compound(self, plant: TraditionalPlant, i: int, compound_data: Dict[str, Any],
+                              cultural_vars: Dict, batch: Dict[str, np.ndarray]
+                              ) -> Tuple[str, OptimizationResults, Optional[str]]:
+        """
+        Run the ADMET step and compile results for one active compound.
         
-        return {
-            'mol_weight': np.random.uniform(200, 500),
-            'log_p': np.random.uniform(1.0, 4.0),
-            'tpsa': np.random.uniform(40, 120),
-            'hbd': np.random.randint(1, 6),
-            'hba': np.random.randint(2, 8),
-            'rotatable_bonds': np.random.randint(2, 10)
+        Args:
+            plant: Traditional plant profile from EthnoPath
+            i: Index of the compound within plant.active_compounds
+            compound_data: Active compound record (name, SMILES, ...)
+            cultural_vars: Plant-level cultural variables
+            batch: Per-compound arrays from _batch_process
+            
+        Returns:
+            Compound name, its optimization results and its progress summary (None unless verbose)
+        """
+        compound_name = compound_data['name']
+        compound_smiles = compound_data['smiles']
+        
+        # Step 1: Cultural QSAR Analysis (cultural_vars are plant-level, computed once per plant)
+        # Step 2: Quantum Chemistry with Traditional Solvents (batched per plant)
+        best_solvent = str(batch['best_solvent'][i])
+        best_binding = float(batch['best_binding'][i])
+        
+        # Step 3: Cultural QSAR Prediction (batched per plant)
+        qsar_score = float(batch['bioactivity_prediction'][i])
+        
+        # Step 4: Traditional ADMET Prediction
+        timing_factors = {
+            'fasting_state': True,
+            'optimal_circadian': True,
+            'lunar_phase': cultural_vars['lunar_phase']
         }
+        
+        # Find optimal preparation
+        optimization = self.admet_predictor.optimize_traditional_preparation(
+            compound_smiles, target_bioavail=75.0, safety_threshold=0.95
+        )
+        
+        # Step 5: Compile Results
+        
+        result = OptimizationResults(
+            compound_name=compound_name,
+            optimized_smiles=compound_smiles,
+            cultural_qsar_score=qsar_score,
+            quantum_binding_affinity=best_binding,
+            traditional_admet_profile=optimization['predicted_admet'],
+            preparation_recommendation={
+                'optimal_solvent': best_solvent,
+                'enhancers': optimization['enhancers'],
+                'timing': optimization['timing'],
+                'route': 'oral_traditional'
+            },
+            bioavailability_improvement=optimization['predicted_admet']['bioavailability_improvement_fold'],
+            safety_enhancement=optimization['predicted_admet']['traditional_safety_enhancement'],
+            development_confidence=min(plant.bioactivity_confidence * optimization['optimization_score'], 1.0)
+        )
+        
+        # One progress block per compound, formatted only when it will be printed
+        summary = None
+        if self.verbose:
+            summary = (
+                f"\n   🧪 Compound {i+1}/{len(plant.active_compounds)}: {compound_name} ✅\n"
+                f"         QSAR Score: {qsar_score:.2f} pIC50\n"
+                f"         Binding Affinity: {best_binding:.2f} pKd\n"
+                f"         Bioavailability: {optimization['predicted_admet']['bioavailability_percent']:.1f}%\n"
+                f"         Enhancement: {optimization['predicted_admet']['bioavailability_improvement_fold']:.1f}x"
+            )
+        
+        return compound_name, result, summary
+    
+    def _extract_cultural_variables(self, plant: TraditionalPlant) -> Dict:
+        """Extract plant-level cultural variables for QSAR analysis (shared by all compounds)."""
+        return _plant_cultural_variables(plant.bioactivity_confidence)
+    
+    def _extract_molecular_descriptors(self, smiles: str) -> Dict:
+        """Extract molecular descriptors from SMILES (read-only, shared across calls)."""
+        return _molecular_descriptors(smiles.strip())
+    
+    def _extract_molecular_descriptors_batch(self, smiles_list: List[str]) -> np.ndarray:
+        """Descriptor table of shape (N, 6), columns in DESCRIPTOR_NAMES order."""
+        if not smiles_list:
+            return np.empty((0, len(DESCRIPTOR_NAMES)))
+        return np.stack([_descriptor_vector(smiles.strip()) for smiles in smiles_list])
     
     def generate_development_report(self, results: Dict[str, OptimizationResults]) -> str:
         """
@@ -398,70 +685,75 @@ class ChemPathIntegratedPipeline:
         Returns:
             Formatted development report
         """
-        report = StringIO()
+        parts = []
         
         # Header
-        report.write("📊 CHEMPATH TRADITIONAL-TO-MODERN DEVELOPMENT REPORT\n")
-        report.write("=" * 65 + "\n\n")
-        
-        # Executive Summary
-        avg_bioavail_improvement = np.mean([r.bioavailability_improvement for r in results.values()])
-        avg_safety_enhancement = np.mean([r.safety_enhancement for r in results.values()])
-        avg_confidence = np.mean([r.development_confidence for r in results.values()])
-        best_compound = max(results.values(), key=lambda x: x.development_confidence)
-        
-        report.write("🎯 EXECUTIVE SUMMARY\n")
-        report.write("-" * 20 + "\n")
-        report.write(f"Compounds Analyzed: {len(results)}\n")
-        report.write(f"Average Bioavailability Improvement: {avg_bioavail_improvement:.1f}x\n")
-        report.write(f"Average Safety Enhancement: {avg_safety_enhancement:.2f}\n")
-        report.write(f"Average Development Confidence: {avg_confidence:.1%}\n")
-        report.write(f"Lead Compound: {best_compound.compound_name}\n")
-        report.write(f"Lead Compound Confidence: {best_compound.development_confidence:.1%}\n\n")
+        parts.append("📊 CHEMPATH TRADITIONAL-TO-MODERN DEVELOPMENT REPORT\n")
+        parts.append("=" * 65 + "\n\n")
+        
+        # Executive Summary: one (compounds x 3) pass for all summary statistics
+        compounds = list(results.values())
+        summary = np.fromiter(
+            ((r.bioavailability_improvement, r.safety_enhancement, r.development_confidence) for r in compounds),
+            dtype=np.dtype((np.float64, 3)),
+            count=len(compounds)
+        )
+        avg_bioavail_improvement, avg_safety_enhancement, avg_confidence = summary.mean(axis=0)
+        max_bioavail_improvement = summary[:, 0].max()
+        best_compound = compounds[int(summary[:, 2].argmax())]
+        
+        parts.append("🎯 EXECUTIVE SUMMARY\n")
+        parts.append("-" * 20 + "\n")
+        parts.append(f"Compounds Analyzed: {len(results)}\n")
+        parts.append(f"Average Bioavailability Improvement: {avg_bioavail_improvement:.1f}x\n")
+        parts.append(f"Average Safety Enhancement: {avg_safety_enhancement:.2f}\n")
+        parts.append(f"Average Development Confidence: {avg_confidence:.1%}\n")
+        parts.append(f"Lead Compound: {best_compound.compound_name}\n")
+        parts.append(f"Lead Compound Confidence: {best_compound.development_confidence:.1%}\n\n")
         
         # Detailed Results
-        report.write("🔬 DETAILED COMPOUND ANALYSIS\n")
-        report.write("-" * 30 + "\n\n")
+        parts.append("🔬 DETAILED COMPOUND ANALYSIS\n")
+        parts.append("-" * 30 + "\n\n")
         
         for compound_name, result in results.items():
-            report.write(f"Compound: {compound_name}\n")
-            report.write(f"  Cultural QSAR Score: {result.cultural_qsar_score:.2f} pIC50\n")
-            report.write(f"  Quantum Binding Affinity: {result.quantum_binding_affinity:.2f} pKd\n")
-            report.write(f"  Bioavailability: {result.traditional_admet_profile['bioavailability_percent']:.1f}%\n")
-            report.write(f"  Bioavailability Improvement: {result.bioavailability_improvement:.1f}x\n")
-            report.write(f"  Safety Enhancement: {result.safety_enhancement:.2f}\n")
-            report.write(f"  Development Confidence: {result.development_confidence:.1%}\n")
+            parts.append(f"Compound: {compound_name}\n")
+            parts.append(f"  Cultural QSAR Score: {result.cultural_qsar_score:.2f} pIC50\n")
+            parts.append(f"  Quantum Binding Affinity: {result.quantum_binding_affinity:.2f} pKd\n")
+            parts.append(f"  Bioavailability: {result.traditional_admet_profile['bioavailability_percent']:.1f}%\n")
+            parts.append(f"  Bioavailability Improvement: {result.bioavailability_improvement:.1f}x\n")
+            parts.append(f"  Safety Enhancement: {result.safety_enhancement:.2f}\n")
+            parts.append(f"  Development Confidence: {result.development_confidence:.1%}\n")
             
             # Preparation Recommendation
             prep = result.preparation_recommendation
-            report.write(f"  Optimal Preparation:\n")
-            report.write(f"    Solvent: {prep['optimal_solvent']}\n")
-            report.write(f"    Enhancers: {', '.join(prep['enhancers'])}\n")
-            report.write(f"    Timing: {'Fasting + Optimal Circadian' if prep['timing']['fasting_state'] else 'Normal'}\n")
-            report.write(f"    Route: {prep['route']}\n\n")
+            parts.append(f"  Optimal Preparation:\n")
+            parts.append(f"    Solvent: {prep['optimal_solvent']}\n")
+            parts.append(f"    Enhancers: {', '.join(prep['enhancers'])}\n")
+            parts.append(f"    Timing: {'Fasting + Optimal Circadian' if prep['timing']['fasting_state'] else 'Normal'}\n")
+            parts.append(f"    Route: {prep['route']}\n\n")
         
         # Investment Highlights
-        report.write("💰 INVESTMENT HIGHLIGHTS\n")
-        report.write("-" * 25 + "\n")
-        report.write(f"• {len(results)} validated compounds with traditional enhancement\n")
-        report.write(f"• Up to {max(r.bioavailability_improvement for r in results.values()):.0f}x bioavailability improvement\n")
-        report.write(f"• {avg_safety_enhancement:.1%} average safety enhancement through traditional methods\n")
-        report.write(f"• {avg_confidence:.1%} average development confidence with genomic validation\n")
-        report.write(f"• Complete traditional-to-modern optimization pipeline demonstrated\n")
-        report.write(f"• Regulatory pathway supported by mechanistic evidence\n")
-        report.write(f"• Cultural knowledge attribution and compensation framework integrated\n\n")
+        parts.append("💰 INVESTMENT HIGHLIGHTS\n")
+        parts.append("-" * 25 + "\n")
+        parts.append(f"• {len(results)} validated compounds with traditional enhancement\n")
+        parts.append(f"• Up to {max_bioavail_improvement:.0f}x bioavailability improvement\n")
+        parts.append(f"• {avg_safety_enhancement:.1%} average safety enhancement through traditional methods\n")
+        parts.append(f"• {avg_confidence:.1%} average development confidence with genomic validation\n")
+        parts.append(f"• Complete traditional-to-modern optimization pipeline demonstrated\n")
+        parts.append(f"• Regulatory pathway supported by mechanistic evidence\n")
+        parts.append(f"• Cultural knowledge attribution and compensation framework integrated\n\n")
         
         # Next Steps
-        report.write("🚀 RECOMMENDED NEXT STEPS\n")
-        report.write("-" * 26 + "\n")
-        report.write(f"1. Advance {best_compound.compound_name} to experimental validation studies\n")
-        report.write(f"2. Synthesize optimal traditional preparations for preclinical testing\n")
-        report.write(f"3. Validate quantum chemistry predictions with experimental binding assays\n")
-        report.write(f"4. Conduct clinical pharmacokinetic studies with traditional preparations\n")
-        report.write(f"5. File provisional patents with traditional knowledge attribution\n")
-        report.write(f"6. Engage traditional knowledge communities for benefit-sharing agreements\n")
+        parts.append("🚀 RECOMMENDED NEXT STEPS\n")
+        parts.append("-" * 26 + "\n")
+        parts.append(f"1. Advance {best_compound.compound_name} to experimental validation studies\n")
+        parts.append(f"2. Synthesize optimal traditional preparations for preclinical testing\n")
+        parts.append(f"3. Validate quantum chemistry predictions with experimental binding assays\n")
+        parts.append(f"4. Conduct clinical pharmacokinetic studies with traditional preparations\n")
+        parts.append(f"5. File provisional patents with traditional knowledge attribution\n")
+        parts.append(f"6. Engage traditional knowledge communities for benefit-sharing agreements\n")
         
-        return report.getvalue()
+        return "".join(parts)
     
     def generate_visualizations(self, results: Dict[str, OptimizationResults]) -> None:
         """
@@ -470,57 +762,52 @@ class ChemPathIntegratedPipeline:
         Args:
             results: Optimization results from pipeline
         """
-        print("\n🎨 Generating ChemPath Visualizations...")
+        # Plotting libraries are imported here so report-only runs skip their import cost
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec
         
-        # Set up the plotting style
-        if SEABORN_AVAILABLE:
-            try:
-                plt.style.use('seaborn-v0_8')
-                sns.set_palette("husl")
-            except:
-                plt.style.use('default')
-                plt.rcParams['axes.prop_cycle'] = plt.cycler(color=['#22c55e', '#3b82f6', '#8b5cf6', '#f59e0b', '#ef4444'])
-        else:
-            plt.style.use('default')
-            plt.rcParams['axes.prop_cycle'] = plt.cycler(color=['#22c55e', '#3b82f6', '#8b5cf6', '#f59e0b', '#ef4444'])
+        # Set up the plotting style (once per process)
+        _configure_plot_style()
+        
+        print("\n🎨 Generating ChemPath Visualizations...")
         
         # Create a comprehensive figure with multiple subplots
         fig = plt.figure(figsize=(16, 12))
         gs = GridSpec(3, 3, figure=fig, hspace=0.3, wspace=0.3)
         
-        # Extract data for plotting
+        # Extract data for plotting in a single pass: one (compounds x 6) array
         compounds = list(results.keys())
-        qsar_scores = [r.cultural_qsar_score for r in results.values()]
-        binding_affinities = [r.quantum_binding_affinity for r in results.values()]
-        bioavailabilities = [r.traditional_admet_profile['bioavailability_percent'] for r in results.values()]
-        improvements = [r.bioavailability_improvement for r in results.values()]
-        confidences = [r.development_confidence * 100 for r in results.values()]
-        safety_scores = [r.safety_enhancement for r in results.values()]
+        vals = np.fromiter(
+            ((r.cultural_qsar_score, r.quantum_binding_affinity,
+              r.traditional_admet_profile['bioavailability_percent'], r.bioavailability_improvement,
+              r.development_confidence, r.safety_enhancement) for r in results.values()),
+            dtype=np.dtype((np.float64, 6)),
+            count=len(results)
+        )
+        qsar_scores, binding_affinities, bioavailabilities, improvements, confidences, safety_scores = vals.T
+        confidences = confidences * 100
         
         # 1. Bioavailability Comparison (Top Left)
         ax1 = fig.add_subplot(gs[0, 0])
-        bars1 = ax1.bar(compounds, bioavailabilities, color=['#22c55e', '#3b82f6', '#8b5cf6'], alpha=0.8)
+        bars1 = ax1.bar(compounds, bioavailabilities, color=_PALETTE_MAIN, alpha=0.8)
         ax1.set_title('🧪 Bioavailability Enhancement', fontweight='bold', fontsize=12)
         ax1.set_ylabel('Bioavailability (%)')
         ax1.set_ylim(0, 100)
         plt.setp(ax1.get_xticklabels(), rotation=45, ha='right')
         
         # Add value labels on bars
-        for bar, val in zip(bars1, bioavailabilities):
-            ax1.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                    f'{val:.1f}%', ha='center', va='bottom', fontweight='bold')
+        _annotate_bars(ax1, bars1, bioavailabilities)
         
         # 2. Development Confidence (Top Center)
         ax2 = fig.add_subplot(gs[0, 1])
-        colors = ['#22c55e', '#3b82f6', '#8b5cf6']
-        wedges, texts, autotexts = ax2.pie(confidences, labels=compounds, colors=colors,
+        wedges, texts, autotexts = ax2.pie(confidences, labels=compounds, colors=_PALETTE_MAIN,
                                           autopct='%1.1f%%', startangle=90)
         ax2.set_title('📊 Development Confidence', fontweight='bold', fontsize=12)
         
         # 3. QSAR vs Binding Affinity Scatter (Top Right)
         ax3 = fig.add_subplot(gs[0, 2])
         scatter = ax3.scatter(qsar_scores, binding_affinities, c=confidences, 
-                            s=[imp*5 for imp in improvements], alpha=0.7, cmap='viridis')
+                            s=improvements * 5, alpha=0.7, cmap='viridis')
         ax3.set_xlabel('Cultural QSAR Score (pIC50)')
         ax3.set_ylabel('Quantum Binding Affinity (pKd)')
         ax3.set_title('⚛️ QSAR vs Binding Analysis', fontweight='bold', fontsize=12)
@@ -536,14 +823,12 @@ class ChemPathIntegratedPipeline:
         
         # 4. Bioavailability Improvement Factor (Middle Left)
         ax4 = fig.add_subplot(gs[1, 0])
-        bars4 = ax4.barh(compounds, improvements, color=['#f59e0b', '#ef4444', '#10b981'])
+        bars4 = ax4.barh(compounds, improvements, color=_PALETTE_WARM)
         ax4.set_xlabel('Improvement Factor (x)')
         ax4.set_title('🚀 Bioavailability Enhancement', fontweight='bold', fontsize=12)
         
         # Add value labels
-        for i, (bar, val) in enumerate(zip(bars4, improvements)):
-            ax4.text(bar.get_width() + 2, bar.get_y() + bar.get_height()/2,
-                    f'{val:.1f}x', ha='left', va='center', fontweight='bold')
+        _annotate_bars(ax4, bars4, improvements, fmt='{:.1f}x', horizontal=True)
         
         # 5. Safety Enhancement Radar Chart (Middle Center)
         ax5 = fig.add_subplot(gs[1, 1], projection='polar')
@@ -555,16 +840,18 @@ class ChemPathIntegratedPipeline:
         angles = [n / float(N) * 2 * np.pi for n in range(N)]
         angles += angles[:1]  # Complete the circle
         
-        for i, (compound, color) in enumerate(zip(compounds, ['#22c55e', '#3b82f6', '#8b5cf6'])):
-            # Normalize values to 0-1 scale
-            values = [
-                qsar_scores[i] / 10.0,  # Normalize QSAR score
-                binding_affinities[i] / 10.0,  # Normalize binding affinity
-                bioavailabilities[i] / 100.0,  # Already percentage
-                safety_scores[i],  # Already 0-1
-                confidences[i] / 100.0  # Convert percentage to 0-1
-            ]
-            values += values[:1]  # Complete the circle
+        # Normalize every compound's profile to a 0-1 scale in one vectorized step
+        profiles = np.column_stack((
+            qsar_scores / 10.0,  # Normalize QSAR score
+            binding_affinities / 10.0,  # Normalize binding affinity
+            bioavailabilities / 100.0,  # Already percentage
+            safety_scores,  # Already 0-1
+            confidences / 100.0  # Convert percentage to 0-1
+        ))
+        profiles = np.concatenate([profiles, profiles[:, :1]], axis=1)  # Complete the circle
+        
+        for i, (compound, color) in enumerate(zip(compounds, _PALETTE_MAIN)):
+            values = profiles[i]
             
             ax5.plot(angles, values, 'o-', linewidth=2, label=compound, color=color)
             ax5.fill(angles, values, alpha=0.25, color=color)
@@ -579,16 +866,13 @@ class ChemPathIntegratedPipeline:
         ax6 = fig.add_subplot(gs[1, 2])
         
         # Count preparation methods
-        solvents = []
-        for result in results.values():
-            solvents.append(result.preparation_recommendation['optimal_solvent'])
+        solvent_names, solvent_counts = np.unique(
+            [r.preparation_recommendation['optimal_solvent'] for r in results.values()],
+            return_counts=True
+        )
         
-        solvent_counts = {}
-        for solvent in solvents:
-            solvent_counts[solvent] = solvent_counts.get(solvent, 0) + 1
-        
-        ax6.pie(solvent_counts.values(), labels=solvent_counts.keys(), autopct='%1.0f',
-               colors=['#fbbf24', '#34d399', '#60a5fa'])
+        ax6.pie(solvent_counts, labels=solvent_names, autopct='%1.0f',
+               colors=_PALETTE_SOLVENTS)
         ax6.set_title('🥥 Optimal Traditional Solvents', fontweight='bold', fontsize=12)
         
         # 7. Pipeline Performance Metrics (Bottom Span)
@@ -600,7 +884,7 @@ class ChemPathIntegratedPipeline:
         
         # Create grouped bar chart
         x_pos = np.arange(len(metrics_labels))
-        bars7 = ax7.bar(x_pos, metrics_values, color=['#ef4444', '#22c55e', '#3b82f6', '#f59e0b', '#8b5cf6'])
+        bars7 = ax7.bar(x_pos, metrics_values, color=_PALETTE_METRICS)
         
         ax7.set_xlabel('ChemPath Pipeline Components')
         ax7.set_ylabel('Performance Score (%)')
@@ -610,9 +894,7 @@ class ChemPathIntegratedPipeline:
         ax7.set_ylim(0, 100)
         
         # Add value labels
-        for bar, val in zip(bars7, metrics_values):
-            ax7.text(bar.get_x() + bar.get_width()/2, bar.get_height() + 1,
-                    f'{val:.1f}%', ha='center', va='bottom', fontweight='bold')
+        _annotate_bars(ax7, bars7, metrics_values)
         
         # Add a horizontal line at 85% for target performance
         ax7.axhline(y=85, color='red', linestyle='--', alpha=0.7, label='Target Performance (85%)')
@@ -651,7 +933,7 @@ def demonstrate_complete_chempath_pipeline():
     print("")
     
     # Initialize integrated pipeline
-    pipeline = ChemPathIntegratedPipeline()
+    pipeline = ChemPathIntegratedPipeline(verbose=True)
     
     # Define Ashwagandha plant profile (from EthnoPath integration)
     ashwagandha = TraditionalPlant(
@@ -736,8 +1018,15 @@ def demonstrate_complete_chempath_pipeline():
     print("💎 INVESTMENT SUMMARY FOR CHEMPATH")
     print("=" * 35)
     
-    best_result = max(optimization_results.values(), key=lambda x: x.development_confidence)
-    total_improvement = sum(r.bioavailability_improvement for r in optimization_results.values())
+    # One pass over the results: (bioavailability improvement, development confidence) per compound
+    compound_names = list(optimization_results)
+    vals = np.fromiter(
+        ((r.bioavailability_improvement, r.development_confidence) for r in optimization_results.values()),
+        dtype=np.dtype((np.float64, 2)),
+        count=len(compound_names)
+    )
+    best_result = optimization_results[compound_names[int(vals[:, 1].argmax())]]
+    total_improvement = vals[:, 0].sum()
     
     print(f"🎯 Lead Compound: {best_result.compound_name}")
     print(f"   Development Confidence: {best_result.development_confidence:.1%}")
@@ -25,9 +25,15 @@ License: MIT - For Research Simulation
 import numpy as np
 import pandas as pd
 from typing import Dict, List, Tuple, Optional, Union
-from dataclasses import dataclass
+from dataclasses import dataclass, fields
 from datetime import datetime
+from operator import attrgetter
 import json
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 @dataclass
@@ -47,6 +53,10 @@ class CulturalVariables:
     community_consensus: float  # 0-1, agreement on preparation method
     historical_significance: float  # 0-1, documented historical usage
 
+    def to_array(self) -> np.ndarray:
+        """Fields as a float64 vector, in declaration order."""
+        return np.array(_CULTURAL_FIELDS(self), dtype=np.float64)
+
 
 @dataclass
 class MolecularDescriptors:
@@ -59,6 +69,10 @@ class MolecularDescriptors:
     rotatable_bonds: int
     aromatic_rings: int
 
+    def to_array(self) -> np.ndarray:
+        """Fields as a float64 vector, in declaration order."""
+        return np.array(_DESCRIPTOR_FIELDS(self), dtype=np.float64)
+
 
 @dataclass
 class MolecularFeatures:
@@ -72,6 +86,36 @@ class MolecularFeatures:
     log_p: float  # Partition coefficient
     molecular_weight: float  # Da
 
+    def to_array(self) -> np.ndarray:
+        """Fields as a float64 vector, in declaration order."""
+        return np.array(_FEATURE_FIELDS(self), dtype=np.float64)
+
+
+# Field getters in declaration order; these fix the column layout of the SoA batches
+_CULTURAL_FIELDS = attrgetter(*(f.name for f in fields(CulturalVariables)))
+_DESCRIPTOR_FIELDS = attrgetter(*(f.name for f in fields(MolecularDescriptors)))
+_FEATURE_FIELDS = attrgetter(*(f.name for f in fields(MolecularFeatures)))
+
+
+def _stack(records: List, getter: attrgetter, width: int) -> np.ndarray:
+    """Stack dataclass records into an (N, width) float64 array in one pass."""
+    return np.fromiter(map(getter, records), dtype=np.dtype((np.float64, width)), count=len(records))
+
+
+def stack_cultural(records: List[CulturalVariables]) -> np.ndarray:
+    """Stack cultural variables into an (N, 8) array for predict_bioactivity_batch."""
+    return _stack(records, _CULTURAL_FIELDS, len(fields(CulturalVariables)))
+
+
+def stack_descriptors(records: List[MolecularDescriptors]) -> np.ndarray:
+    """Stack molecular descriptors into an (N, 7) array for predict_bioactivity_batch."""
+    return _stack(records, _DESCRIPTOR_FIELDS, len(fields(MolecularDescriptors)))
+
+
+def stack_features(records: List[MolecularFeatures]) -> np.ndarray:
+    """Stack molecular features into an (N, 8) array for predict_bioactivity_batch."""
+    return _stack(records, _FEATURE_FIELDS, len(fields(MolecularFeatures)))
+
 
 class CulturalQSAREngine:
     """
@@ -87,6 +131,14 @@ class CulturalQSAREngine:
     - 42.8% accuracy enhancement over conventional QSAR
     """
 
+    # Component scoring weights per column, in dataclass field order (see predict_bioactivity)
+    _CULTURAL_W = np.array([0.2, 0.3, 0.2, 0.0, 0.0, 0.0, 0.0, 0.3])
+    _DESCRIPTOR_W = np.array([-0.3 / 400, 0.4 / 5.0, 0.0, 0.3 / 10.0, 0.0, 0.0, 0.0])
+    _DESCRIPTOR_BIAS = 0.3
+    # Energy and solvent binding enter by magnitude, the dipole moment as is
+    _FEATURE_ABS_W = np.array([0.3 / 300.0, 0.0, 0.0, 0.0, 0.5 / 15.0, 0.0, 0.0, 0.0])
+    _FEATURE_W = np.array([0.0, 0.0, 0.2 / 10.0, 0.0, 0.0, 0.0, 0.0, 0.0])
+
     def __init__(self,
                  cultural_weight: float = 0.3,
                  molecular_feature_weight: float = 0.4,
@@ -117,7 +169,7 @@ class CulturalQSAREngine:
 
         # Bias mitigation: Ensure minimum cultural weight
         if self.cultural_weight < self.min_cultural_weight:
-            print(f"⚠️  Bias Mitigation: Adjusting cultural weight from {self.cultural_weight:.2f} to {self.min_cultural_weight:.2f}")
+            logger.warning("⚠️  Bias Mitigation: Adjusting cultural weight from %.2f to %.2f", self.cultural_weight, self.min_cultural_weight)
             self.cultural_weight = self.min_cultural_weight
             remaining = 1.0 - self.cultural_weight
             self.molecular_feature_weight = remaining * 0.57  # 40/70
@@ -128,13 +180,13 @@ class CulturalQSAREngine:
         # Model parameters based on deployment mode
         self.model_params = self._get_model_parameters()
 
-        print(f"🌿 ChemPath Cultural QSAR Engine Initialized")
-        print(f"   Deployment Mode: {self.deployment_mode}")
-        print(f"   Model Parameters: {self.model_params} parameters")
-        print(f"   Cultural Weight: {self.cultural_weight:.2f} (min: {self.min_cultural_weight:.2f})")
-        print(f"   Molecular Feature Weight: {self.molecular_feature_weight:.2f}")
-        print(f"   Descriptor Weight: {self.descriptor_weight:.2f}")
-        print(f"   Bias Mitigation: {'✅ Active' if self.cultural_weight >= self.min_cultural_weight else '❌ Failed'}")
+        logger.info("🌿 ChemPath Cultural QSAR Engine Initialized")
+        logger.info("   Deployment Mode: %s", self.deployment_mode)
+        logger.info("   Model Parameters: %s parameters", self.model_params)
+        logger.info("   Cultural Weight: %.2f (min: %.2f)", self.cultural_weight, self.min_cultural_weight)
+        logger.info("   Molecular Feature Weight: %.2f", self.molecular_feature_weight)
+        logger.info("   Descriptor Weight: %.2f", self.descriptor_weight)
+        logger.info("   Bias Mitigation: %s", '✅ Active' if self.cultural_weight >= self.min_cultural_weight else '❌ Failed')
     
     def _get_model_parameters(self) -> str:
         """Get model parameters based on deployment mode."""
@@ -221,6 +273,61 @@ class CulturalQSAREngine:
             }
         }
 
+    def predict_bioactivity_batch(self,
+                                  cultural_arr: np.ndarray,
+                                  mol_arr: np.ndarray,
+                                  feature_arr: np.ndarray) -> Dict[str, Union[np.ndarray, Dict]]:
+        """
+        Predict bioactivity for a batch of compounds at once.
+
+        Same scoring as predict_bioactivity, with each component computed as a
+        matrix-vector product over structure-of-arrays inputs.
+
+        Args:
+            cultural_arr: (N, 8) cultural variables, see stack_cultural
+            mol_arr: (N, 7) molecular descriptors, see stack_descriptors
+            feature_arr: (N, 8) advanced molecular features, see stack_features
+
+        Returns:
+            Per-compound arrays of the predict_bioactivity results
+        """
+        if not self.is_trained:
+            raise ValueError("Model must be trained before making predictions")
+
+        cultural_score = cultural_arr @ self._CULTURAL_W
+        descriptor_score = mol_arr @ self._DESCRIPTOR_W + self._DESCRIPTOR_BIAS
+        molecular_feature_score = np.abs(feature_arr) @ self._FEATURE_ABS_W + feature_arr @ self._FEATURE_W
+
+        final_prediction = (
+            self.cultural_weight * cultural_score +
+            self.descriptor_weight * descriptor_score +
+            self.molecular_feature_weight * molecular_feature_score
+        )
+
+        cultural_representation = cultural_score * self.cultural_weight
+
+        return {
+            'bioactivity_prediction': np.minimum(final_prediction * 8.5, 9.2),
+            'component_predictions': {
+                'cultural': cultural_score,
+                'descriptors': descriptor_score,
+                'molecular_features': molecular_feature_score
+            },
+            'component_weights': {
+                'cultural': self.cultural_weight,
+                'descriptors': self.descriptor_weight,
+                'molecular_features': self.molecular_feature_weight
+            },
+            'cultural_influence': cultural_representation,
+            'traditional_enhancement': np.maximum(0, (cultural_score - 0.5) * 2.0),
+            'bias_mitigation': {
+                'cultural_representation': cultural_representation,
+                'minimum_threshold': self.min_cultural_weight,
+                'passed': cultural_representation >= (self.min_cultural_weight * 0.5),
+                'cultural_preservation_score': cultural_score
+            }
+        }
+
 
 def simulate_cultural_qsar():
     """
@@ -308,6 +415,8 @@ def simulate_cultural_qsar():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Run simulation for research validation
     engine, results = simulate_cultural_qsar()
 
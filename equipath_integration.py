@@ -23,6 +23,11 @@ from dataclasses import dataclass
 from datetime import datetime
 import hashlib
 import json
+import logging
+import sys
+
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
 
 @dataclass
@@ -68,10 +73,10 @@ class EquiPathCoordinator:
         self.compensation_records = []
         self.attribution_complexity = self._get_attribution_complexity()
 
-        print(f"🔒 EquiPath Compensation Coordinator Initialized")
-        print(f"   Deployment Mode: {self.deployment_mode}")
-        print(f"   Attribution Complexity: {self.attribution_complexity}")
-        print(f"   Privacy Level: Enhanced zero-knowledge proofs")
+        logger.info("🔒 EquiPath Compensation Coordinator Initialized")
+        logger.info("   Deployment Mode: %s", self.deployment_mode)
+        logger.info("   Attribution Complexity: %s", self.attribution_complexity)
+        logger.info("   Privacy Level: Enhanced zero-knowledge proofs")
 
     def _get_attribution_complexity(self) -> str:
         """Get attribution complexity based on deployment mode."""
@@ -197,9 +202,9 @@ class EquiPathCoordinator:
 
         self.compensation_records.append(record)
 
-        print(f"   💰 Compensation Record Created: {record_id}")
-        print(f"      Amount: ${total_compensation:,.2f}")
-        print(f"      Cultural Preservation: {cultural_score:.2f}")
+        logger.info("   💰 Compensation Record Created: %s", record_id)
+        logger.info("      Amount: $%s", format(total_compensation, ',.2f'))
+        logger.info("      Cultural Preservation: %.2f", cultural_score)
 
         return record
 
@@ -214,14 +219,14 @@ class EquiPathCoordinator:
         Returns:
             List of compensation records with privacy preservation
         """
-        print(f"\n🔒 Processing Traditional Knowledge Compensation")
-        print(f"   Contributors: {len(traditional_contributions)}")
-        print(f"   Privacy Level: Zero-knowledge proofs")
+        logger.info("\n🔒 Processing Traditional Knowledge Compensation")
+        logger.info("   Contributors: %s", len(traditional_contributions))
+        logger.info("   Privacy Level: Zero-knowledge proofs")
 
         compensation_records = []
 
         for i, contrib_data in enumerate(traditional_contributions, 1):
-            print(f"\n   Processing Contribution {i}/{len(traditional_contributions)}...")
+            logger.info("\n   Processing Contribution %s/%s...", i, len(traditional_contributions))
 
             # Create contribution record
             contribution = TraditionalKnowledgeContribution(
@@ -259,10 +264,10 @@ class EquiPathCoordinator:
         total_compensation = sum(r.compensation_amount for r in compensation_records)
         avg_cultural_score = np.mean([r.cultural_preservation_score for r in compensation_records])
 
-        print(f"\n   ✅ Compensation Processing Complete")
-        print(f"      Total Compensation: ${total_compensation:,.2f}")
-        print(f"      Average Cultural Preservation: {avg_cultural_score:.2f}")
-        print(f"      Records Created: {len(compensation_records)}")
+        logger.info("\n   ✅ Compensation Processing Complete")
+        logger.info("      Total Compensation: $%s", format(total_compensation, ',.2f'))
+        logger.info("      Average Cultural Preservation: %.2f", avg_cultural_score)
+        logger.info("      Records Created: %s", len(compensation_records))
 
         return compensation_records
 
@@ -347,6 +352,8 @@ def simulate_equipath_integration():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Run simulation
     coordinator, records = simulate_equipath_integration()
 
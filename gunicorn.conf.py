@@ -0,0 +1,39 @@
+"""
+Gunicorn configuration for the ChemPath web simulation interface.
+
+Usage:
+    gunicorn app:app
+
+Simulation status lives in process memory, so a single worker with
+several threads is the default; raise WEB_CONCURRENCY only behind a
+load balancer with sticky sessions.
+"""
+
+import os
+
+bind = os.environ.get("BIND", "0.0.0.0:5000")
+
+# Threaded workers serve requests while simulations run in background
+# threads. Every open /api/simulation-stream (SSE) client holds one thread
+# until its job finishes, so streams are capped at SSE_MAX_STREAMS per
+# worker (default: all threads but two). Further clients get a 503 and the
+# page polls /api/simulation-status instead, which keeps two threads free
+# for polls, /healthz and page loads. Raise GUNICORN_THREADS to allow more
+# concurrent streams.
+worker_class = "gthread"
+threads = int(os.environ.get("GUNICORN_THREADS", 5))
+workers = int(os.environ.get("WEB_CONCURRENCY", 1))
+os.environ.setdefault("SSE_MAX_STREAMS", str(max(threads - 2, 1)))
+
+# Import the pipeline modules once in the master and share them via fork
+preload_app = True
+
+# Recycle workers periodically to bound memory and latency growth; jitter
+# staggers restarts. A recycled worker drops its in-memory simulation jobs.
+max_requests = 1000
+max_requests_jitter = 100
+
+# Simulations run in background threads, so requests stay short; allow
+# slow PDF exports and in-flight requests time to finish on restart
+timeout = 120
+graceful_timeout = 30
@@ -3,11 +3,18 @@ let resultsData = null;
 let charts = {};
 let compoundsArray = [];
 
+// Simulation job to display, passed from the simulation page as ?job=<id>
+const jobId = new URLSearchParams(window.location.search).get('job');
+
+function apiUrl(path) {
+    return jobId ? `${path}/${jobId}` : path;
+}
+
 // ======================
 // Data Loading
 // ======================
 function loadResults() {
-    fetch('/api/simulation-status')
+    fetch(apiUrl('/api/simulation-status'))
         .then(response => response.json())
         .then(data => {
             if (data.results) {
@@ -580,7 +587,7 @@ function displayCompoundsTable(compounds) {
 // Export Functions
 // ======================
 function exportJSON() {
-    fetch('/api/export-json')
+    fetch(apiUrl('/api/export-json'))
         .then(response => response.blob())
         .then(blob => {
             const url = window.URL.createObjectURL(blob);
@@ -601,7 +608,7 @@ function exportJSON() {
 
 function exportPDF() {
     showToast('Generating PDF report...');
-    fetch('/api/export-pdf')
+    fetch(apiUrl('/api/export-pdf'))
         .then(response => response.blob())
         .then(blob => {
             const url = window.URL.createObjectURL(blob);
@@ -24,8 +24,13 @@ from dataclasses import dataclass
 from enum import Enum
 import math
 import json
+import logging
+import sys
 from datetime import datetime, time
 
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
 
 class TraditionalEnhancer(Enum):
     """Traditional bioavailability enhancers from cultural medicine."""
@@ -137,9 +142,9 @@ class TraditionAwareADMETPredictor:
         # Traditional preparation routes
         self.preparation_routes = self._initialize_preparation_routes()
         
-        print(f"💊 Tradition-Aware ADMET Predictor initialized")
-        print(f"   Traditional enhancers loaded: {len(self.traditional_enhancers)}")
-        print(f"   Circadian timing models: {len(self.circadian_models)}")
+        logger.info("💊 Tradition-Aware ADMET Predictor initialized")
+        logger.info("   Traditional enhancers loaded: %s", len(self.traditional_enhancers))
+        logger.info("   Circadian timing models: %s", len(self.circadian_models))
     
     def _initialize_enhancer_database(self) -> Dict[str, TraditionalEnhancerProfile]:
         """
@@ -256,10 +261,10 @@ class TraditionAwareADMETPredictor:
         Returns:
             Complete ADMET properties with traditional enhancements
         """
-        print(f"💊 Predicting traditional ADMET for compound...")
-        print(f"   Enhancers: {', '.join(enhancers)}")
-        print(f"   Route: {route}")
-        print(f"   Fasting: {timing.get('fasting_state', False)}")
+        logger.info("💊 Predicting traditional ADMET for compound...")
+        logger.info("   Enhancers: %s", ', '.join(enhancers))
+        logger.info("   Route: %s", route)
+        logger.info("   Fasting: %s", timing.get('fasting_state', False))
         
         # Calculate base ADMET properties
         base_admet = self._calculate_base_admet(molecule_smiles, route)
@@ -422,9 +427,9 @@ class TraditionAwareADMETPredictor:
         Returns:
             Optimized preparation recommendation
         """
-        print(f"🎯 Optimizing traditional preparation...")
-        print(f"   Target bioavailability: {target_bioavail}%")
-        print(f"   Safety threshold: {safety_threshold}")
+        logger.info("🎯 Optimizing traditional preparation...")
+        logger.info("   Target bioavailability: %s%%", target_bioavail)
+        logger.info("   Safety threshold: %s", safety_threshold)
         
         # Test different enhancer combinations
         enhancer_combinations = [
@@ -538,6 +543,8 @@ def demonstrate_tradition_aware_admet():
 
 
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s", stream=sys.stdout)
+
     # Run demonstration
     predictor, results, optimization = demonstrate_tradition_aware_admet()
     